@@ -11,6 +11,9 @@ import reflex as rx
 from appos.admin.components.layout import admin_layout
 from appos.admin.state import AdminState
 
+# Broker queues shown on the page (see CeleryConfig.queues)
+_QUEUES = ("celery", "process_steps.fast", "process_steps.slow", "process_control", "scheduled")
+
 
 class WorkerManager:
     """
@@ -63,10 +66,9 @@ class WorkerManager:
         try:
             import redis as redis_lib
             r = redis_lib.from_url(redis_url)
-            queues = ["celery", "process_steps", "scheduled"]
-            return {q: r.llen(q) for q in queues}
+            return {q: r.llen(q) for q in _QUEUES}
         except Exception:
-            return {"celery": 0, "process_steps": 0, "scheduled": 0}
+            return {q: 0 for q in _QUEUES}
 
 
 class WorkersState(rx.State):
@@ -13,7 +13,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
-from sqlalchemy import Column, Integer, Boolean, DateTime, create_engine
+from sqlalchemy import Column, Integer, Boolean, DateTime, create_engine, false
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 
@@ -40,8 +40,13 @@ class AuditMixin:
 
 
 class SoftDeleteMixin:
-    """Adds is_deleted, deleted_at, deleted_by columns for soft delete support."""
-    is_deleted = Column(Boolean, default=False, nullable=False)
+    """
+    Adds is_deleted, deleted_at, deleted_by columns for soft delete support.
+
+    Live-row predicates always use the NOT NULL ``is_deleted`` boolean;
+    ``deleted_at`` is recorded for reference and never filtered on.
+    """
+    is_deleted = Column(Boolean, default=False, server_default=false(), nullable=False)
     deleted_at = Column(DateTime(timezone=True), nullable=True)
     deleted_by = Column(Integer, nullable=True)
 
@@ -63,6 +68,8 @@ class EngineRegistry:
     def __init__(self):
         self._engines: Dict[str, Any] = {}
         self._session_factories: Dict[str, sessionmaker] = {}
+        self._async_engines: Dict[str, Any] = {}
+        self._async_session_factories: Dict[str, Any] = {}
 
     def register(
         self,
@@ -88,6 +95,43 @@ class EngineRegistry:
         self._engines[name] = engine
         self._session_factories[name] = sessionmaker(bind=engine)
 
+    def register_async(
+        self,
+        name: str,
+        url: str,
+        pool_size: int = 10,
+        max_overflow: int = 20,
+        pool_timeout: int = 30,
+        pool_recycle: int = 1800,
+        pool_pre_ping: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Register an asyncio engine (e.g. postgresql+asyncpg://...).
+
+        The pool is pinned to AsyncAdaptedQueuePool; a plain QueuePool
+        cannot be used with an async engine. Sessions come from
+        get_async_session() and are meant for AsyncRecordService.
+        """
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+        from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+        engine = create_async_engine(
+            url,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            **kwargs,
+        )
+        self._async_engines[name] = engine
+        # expire_on_commit=False: attribute access after commit would need IO
+        self._async_session_factories[name] = async_sessionmaker(
+            bind=engine, expire_on_commit=False,
+        )
+
     def get(self, name: str) -> Any:
         """Get a registered engine by name."""
         if name not in self._engines:
@@ -100,14 +144,29 @@ class EngineRegistry:
             raise KeyError(f"Session factory '{name}' not found. Available: {list(self._session_factories.keys())}")
         return self._session_factories[name]()
 
+    def get_async_session(self, name: str = "appos_core") -> Any:
+        """Get a new AsyncSession for an engine registered with register_async()."""
+        if name not in self._async_session_factories:
+            raise KeyError(
+                f"Async session factory '{name}' not found. "
+                f"Available: {list(self._async_session_factories.keys())}"
+            )
+        return self._async_session_factories[name]()
+
     def dispose(self, name: Optional[str] = None) -> None:
         """Dispose one or all engines (close connection pools)."""
+        # Async engines are disposed through their sync proxy so shutdown
+        # does not need a running event loop.
         if name:
             if name in self._engines:
                 self._engines[name].dispose()
+            if name in self._async_engines:
+                self._async_engines[name].sync_engine.dispose()
         else:
             for engine in self._engines.values():
                 engine.dispose()
+            for engine in self._async_engines.values():
+                engine.sync_engine.dispose()
 
     def dispose_all(self) -> None:
         """Dispose all engines."""
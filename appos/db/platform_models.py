@@ -139,7 +139,8 @@ class UserGroup(Base):
     __table_args__ = (
         UniqueConstraint("user_id", "group_id", name="uq_user_group"),
         Index("idx_ug_user_id", "user_id"),
-        Index("idx_ug_group_id", "group_id"),
+        # Covers group -> members lookups without touching the heap
+        Index("idx_ug_group_user", "group_id", "user_id"),
     )
 
 
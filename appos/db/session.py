@@ -25,8 +25,8 @@ def init_platform_db(
     db_url: str,
     schema: str = "appOS",
     create_tables: bool = False,
-    pool_size: int = 10,
-    max_overflow: int = 20,
+    pool_size: int = 20,
+    max_overflow: int = 40,
     pool_timeout: int = 30,
     pool_recycle: int = 1800,
     pool_pre_ping: bool = True,
@@ -57,7 +57,9 @@ def init_platform_db(
         create_tables: When True, run Base.metadata.create_all() after schema
                        creation.  Use ONLY for ``appos init`` bootstrapping.
                        Production: leave False and rely on migration scripts.
-        pool_size:     SQLAlchemy engine pool_size.
+        pool_size:     SQLAlchemy engine pool_size.  Keep it at or above the
+                       Celery worker concurrency — every concurrent rule
+                       call checks out its own connection.
         max_overflow:  SQLAlchemy engine max_overflow.
         pool_timeout:  SQLAlchemy engine pool_timeout (seconds).
         pool_recycle:  SQLAlchemy engine pool_recycle (seconds).
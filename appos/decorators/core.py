@@ -298,10 +298,14 @@ def step(
     on_success: Optional[str] = None,
     condition: Optional[str] = None,
     fire_and_forget: bool = False,
+    long_running: bool = False,
 ) -> Dict[str, Any]:
     """
     Build a step definition for use inside a @process function.
     Returns a dict — not registered independently.
+
+    long_running steps run on the process_steps.slow queue, away from the
+    prefetching workers that serve short steps.
     """
     return {
         "type": "step",
@@ -316,6 +320,7 @@ def step(
         "on_success": on_success,
         "condition": condition,
         "fire_and_forget": fire_and_forget,
+        "long_running": long_running,
     }
 
 
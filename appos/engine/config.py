@@ -20,14 +20,20 @@ from pydantic import BaseModel, Field, field_validator
 # ---------------------------------------------------------------------------
 
 class DatabaseConfig(BaseModel):
+    """
+    Platform DB settings. Pool settings can be overridden per deployment
+    with APPOS_DB_POOL_SIZE / _MAX_OVERFLOW / _POOL_TIMEOUT / _POOL_RECYCLE /
+    _POOL_PRE_PING. Under Celery, pool_size should be at least the worker
+    concurrency so concurrent rule calls don't queue on checkout.
+    """
     host: str = "localhost"
     port: int = 5432
     name: str = "appos_core"
     user: str = "appos"
     password: str = "appos_dev"
     db_schema: str = "appOS"
-    pool_size: int = 10
-    max_overflow: int = 20
+    pool_size: int = 20
+    max_overflow: int = 40
     pool_timeout: int = 30
     pool_recycle: int = 1800
     pool_pre_ping: bool = True
@@ -53,8 +59,17 @@ class CeleryConfig(BaseModel):
     result_backend: str = "redis://localhost:6379/1"
     beat_schedule_check: int = 60
     concurrency: int = 4
+    # Process steps are mostly short IO-bound rule calls: prefetch a few per
+    # worker process. Use 1 for workers dedicated to long-running steps.
+    prefetch_multiplier: int = 4
+    acks_late: bool = True
+    task_default_rate_limit: Optional[str] = None
+    # Publish step logs to a Redis stream, drained to process_step_log in batches
+    async_step_logging: bool = False
     autoscale: CeleryAutoscaleConfig = CeleryAutoscaleConfig()
-    queues: List[str] = Field(default_factory=lambda: ["celery", "process_steps", "scheduled"])
+    queues: List[str] = Field(default_factory=lambda: [
+        "celery", "process_steps.fast", "process_steps.slow", "process_control", "scheduled",
+    ])
 
 
 class SecurityConfig(BaseModel):
@@ -203,6 +218,25 @@ class AppConfig(BaseModel):
 _platform_config: Optional[PlatformConfig] = None
 _app_configs: Dict[str, AppConfig] = {}
 
+# Env var -> DatabaseConfig field; env wins over appos.yaml
+_DB_ENV_OVERRIDES = {
+    "APPOS_DB_POOL_SIZE": "pool_size",
+    "APPOS_DB_MAX_OVERFLOW": "max_overflow",
+    "APPOS_DB_POOL_TIMEOUT": "pool_timeout",
+    "APPOS_DB_POOL_RECYCLE": "pool_recycle",
+    "APPOS_DB_POOL_PRE_PING": "pool_pre_ping",
+}
+
+
+def _database_overrides(database: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply APPOS_DB_* env overrides to the raw database section."""
+    merged = dict(database)
+    for env_var, key in _DB_ENV_OVERRIDES.items():
+        value = os.environ.get(env_var)
+        if value is not None:
+            merged[key] = value
+    return merged
+
 
 def _find_project_root() -> Path:
     """Find the project root by looking for appos.yaml."""
@@ -238,7 +272,7 @@ def load_platform_config(config_path: Optional[str] = None) -> PlatformConfig:
     path = Path(config_path)
     if not path.exists():
         # Return defaults if no config file
-        _platform_config = PlatformConfig()
+        _platform_config = PlatformConfig(database=_database_overrides({}))
         return _platform_config
 
     with open(path, "r", encoding="utf-8") as f:
@@ -251,7 +285,7 @@ def load_platform_config(config_path: Optional[str] = None) -> PlatformConfig:
         "name": platform_data.get("name", raw.get("name", "AppOS Platform")),
         "version": platform_data.get("version", raw.get("version", "2.0.0")),
         "environment": platform_data.get("environment", raw.get("environment", "dev")),
-        "database": raw.get("database", {}),
+        "database": _database_overrides(raw.get("database", {})),
         "redis": raw.get("redis", {}),
         "celery": raw.get("celery", {}),
         "security": raw.get("security", {}),
@@ -64,6 +64,14 @@ class ExecutionContext:
     process_instance_id: Optional[str] = None
     step_name: Optional[str] = None
 
+    # Request-start instant; shared timestamp for writes in this unit of work
+    now: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    # platform.rules.get_current_user() result, memoized for this request
+    _current_user_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+
     @property
     def is_system_admin(self) -> bool:
         return self.user_type == "system_admin"
@@ -259,8 +267,12 @@ class ProcessContext:
         inputs: Dict[str, Any] = None,
         variables: Dict[str, Any] = None,
         visibility: Dict[str, str] = None,
+        pk: Optional[int] = None,
+        current_step: Optional[str] = None,
     ):
         self.instance_id = instance_id
+        self.pk = pk  # ProcessInstance.id, once known — saves the instance_id lookup
+        self.current_step = current_step  # step name last written to ProcessInstance.current_step
         self._inputs = inputs or {}
         self._variables = variables or {}
         self._visibility: Dict[str, str] = visibility or {}  # {var_name: "logged"|"hidden"|"sensitive"}
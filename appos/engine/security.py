@@ -23,7 +23,8 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Set
 
 import bcrypt
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.orm import Session, lazyload
 
 from appos.db.platform_models import (
     Group,
@@ -42,6 +43,16 @@ from appos.engine.errors import AppOSSecurityError, AppOSSessionError
 
 logger = logging.getLogger("appos.engine.security")
 
+
+def _active_group_names(session: Session, user_id: int) -> Set[str]:
+    """Names of a user's active groups — one column, no Group hydration."""
+    return set(session.execute(
+        select(Group.name)
+        .join(UserGroup, UserGroup.group_id == Group.id)
+        .where(UserGroup.user_id == user_id, Group.is_active.is_(True))
+    ).scalars())
+
+
 # Permission hierarchy — higher includes lower
 PERMISSION_HIERARCHY = {
     "admin": {"admin", "delete", "update", "create", "use", "view"},
@@ -284,7 +295,10 @@ class AuthService:
         """
         session: Session = self._db_session_factory()
         try:
-            user = session.query(User).filter_by(username=username).first()
+            user = (
+                session.query(User).filter_by(username=username)
+                .options(lazyload(User.groups)).first()
+            )
 
             # User not found
             if user is None:
@@ -319,7 +333,7 @@ class AuthService:
                 )
 
             # Get user groups
-            groups = {g.name for g in user.groups if g.is_active}
+            groups = _active_group_names(session, user.id)
 
             # Create session
             session_id = f"sess_{uuid.uuid4().hex}"
@@ -453,12 +467,13 @@ class AuthService:
                 session.query(User)
                 .filter_by(user_type="service_account", is_active=True)
                 .filter(User.api_key_hash.isnot(None))
+                .options(lazyload(User.groups))
                 .all()
             )
 
             for user in service_accounts:
                 if bcrypt.checkpw(api_key.encode("utf-8"), user.api_key_hash.encode("utf-8")):
-                    groups = {g.name for g in user.groups if g.is_active}
+                    groups = _active_group_names(session, user.id)
                     return ExecutionContext(
                         user_id=user.id,
                         username=user.username,
@@ -22,16 +22,24 @@ Design refs: AppOS_Design.md §9 (Record Processing Pipeline)
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import io
+import json
 import logging
 import os
 import re
-import textwrap
+import tempfile
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from enum import Enum
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
+from appos.engine.config import get_project_root
 from appos.generators.model_generator import (
     SQL_TYPE_MAPPING,
     TYPE_MAPPING,
@@ -45,12 +53,37 @@ from appos.utilities.utils import to_snake
 
 logger = logging.getLogger("appos.generators.migration_generator")
 
+# Precompiled pattern for migration slugs
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+# Upper bound on threads used by generate_all_migrations(parallel=True)
+_MAX_WORKERS = 8
+
 
 # ---------------------------------------------------------------------------
 # Schema introspection data classes
 # ---------------------------------------------------------------------------
 
-@dataclass
+# Common information_schema type aliases → normalized comparison form
+_LIVE_TYPE_ALIASES: Dict[str, str] = {
+    "CHARACTER VARYING": "VARCHAR",
+    "TIMESTAMP WITHOUT TIME ZONE": "TIMESTAMP",
+    "TIMESTAMP WITH TIME ZONE": "TIMESTAMPTZ",
+    "DOUBLE PRECISION": "FLOAT",
+    "BIGINT": "BIGINT",
+    "SMALLINT": "SMALLINT",
+    "BOOLEAN": "BOOLEAN",
+    "INTEGER": "INTEGER",
+    "TEXT": "TEXT",
+    "JSONB": "JSONB",
+    "JSON": "JSON",
+    "BYTEA": "BYTEA",
+    "DATE": "DATE",
+    "NUMERIC": "NUMERIC",
+}
+
+
+@dataclass(slots=True)
 class LiveColumn:
     """A column as it exists in the live database."""
     name: str
@@ -60,29 +93,12 @@ class LiveColumn:
     character_maximum_length: Optional[int] = None
     numeric_precision: Optional[int] = None
     numeric_scale: Optional[int] = None
+    # Normalized DB type for comparison (uppercase, simplified) — computed once
+    normalized_type: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def normalized_type(self) -> str:
-        """Normalize DB type for comparison (uppercase, simplified)."""
+    def __post_init__(self) -> None:
         t = self.data_type.upper()
-        # Normalize common aliases
-        aliases = {
-            "CHARACTER VARYING": "VARCHAR",
-            "TIMESTAMP WITHOUT TIME ZONE": "TIMESTAMP",
-            "TIMESTAMP WITH TIME ZONE": "TIMESTAMPTZ",
-            "DOUBLE PRECISION": "FLOAT",
-            "BIGINT": "BIGINT",
-            "SMALLINT": "SMALLINT",
-            "BOOLEAN": "BOOLEAN",
-            "INTEGER": "INTEGER",
-            "TEXT": "TEXT",
-            "JSONB": "JSONB",
-            "JSON": "JSON",
-            "BYTEA": "BYTEA",
-            "DATE": "DATE",
-            "NUMERIC": "NUMERIC",
-        }
-        return aliases.get(t, t)
+        self.normalized_type = _LIVE_TYPE_ALIASES.get(t, t)
 
 
 @dataclass
@@ -94,7 +110,7 @@ class LiveTable:
     primary_key: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DesiredColumn:
     """A column as desired based on @record definition."""
     name: str
@@ -103,13 +119,11 @@ class DesiredColumn:
     default: Optional[str] = None
     is_primary_key: bool = False
     is_unique: bool = False
+    # Base type without length/precision for comparison — computed once
+    normalized_type: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def normalized_type(self) -> str:
-        """Base type without length/precision for comparison."""
-        base = self.sql_type.split("(")[0].upper()
-        # Map to the same normalized form as LiveColumn
-        return base
+    def __post_init__(self) -> None:
+        self.normalized_type = self.sql_type.split("(")[0].upper()
 
 
 @dataclass
@@ -167,19 +181,27 @@ class MigrationDiff:
     def has_changes(self) -> bool:
         return any(td.has_changes for td in self.table_diffs)
 
-    @property
+    @cached_property
     def summary(self) -> str:
-        creates = [td for td in self.table_diffs if td.change_type == "create"]
-        alters = [td for td in self.table_diffs if td.change_type == "alter" and td.column_diffs]
-        drops = [td for td in self.table_diffs if td.change_type == "drop"]
+        """Human-readable change summary (computed once per diff)."""
+        n_create = n_alter = n_drop = n_cols = 0
+        for td in self.table_diffs:
+            ct = td.change_type
+            if ct == "create":
+                n_create += 1
+            elif ct == "alter" and td.column_diffs:
+                n_alter += 1
+                n_cols += len(td.column_diffs)
+            elif ct == "drop":
+                n_drop += 1
+
         parts = []
-        if creates:
-            parts.append(f"{len(creates)} new table(s)")
-        if alters:
-            total_cols = sum(len(td.column_diffs) for td in alters)
-            parts.append(f"{total_cols} column change(s) in {len(alters)} table(s)")
-        if drops:
-            parts.append(f"{len(drops)} dropped table(s)")
+        if n_create:
+            parts.append(f"{n_create} new table(s)")
+        if n_alter:
+            parts.append(f"{n_cols} column change(s) in {n_alter} table(s)")
+        if n_drop:
+            parts.append(f"{n_drop} dropped table(s)")
         return ", ".join(parts) if parts else "no changes"
 
 
@@ -193,20 +215,35 @@ def _pydantic_field_to_sql_type(parsed_field: ParsedField) -> str:
 
     Uses the same mapping as model_generator but outputs SQL type syntax.
     """
-    type_name = parsed_field.python_type
-
-    sql_type = SQL_TYPE_MAPPING.get(type_name, "TEXT")
-
-    # Apply length/precision
-    if type_name == "str" and parsed_field.max_length:
-        sql_type = f"VARCHAR({parsed_field.max_length})"
-    elif type_name == "str" and not parsed_field.max_length:
-        sql_type = "VARCHAR(255)"  # Default length
-    elif type_name == "float":
-        precision = parsed_field.decimal_places or 2
-        sql_type = f"NUMERIC(10, {precision})"
+    match parsed_field.python_type:
+        case "str":
+            # Apply length (default 255)
+            return f"VARCHAR({parsed_field.max_length})" if parsed_field.max_length else "VARCHAR(255)"
+        case "float":
+            # Apply precision (default 2 decimal places)
+            return f"NUMERIC(10, {parsed_field.decimal_places or 2})"
+        case type_name:
+            return SQL_TYPE_MAPPING.get(type_name, "TEXT")
+
+
+def _sql_default(value: Any) -> str:
+    """
+    Render a Python default as a SQL literal for server_default.
 
-    return sql_type
+    Handles the scalar defaults Pydantic fields use in practice; anything
+    else is rendered as a quoted string literal.
+    """
+    if isinstance(value, Enum):
+        value = value.value
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if value is None:
+        return "NULL"
+    if isinstance(value, (int, float)):
+        return str(value)
+    return "'" + str(value).replace("'", "''") + "'"
 
 
 def build_desired_table(parsed: ParsedRecord, schema_name: str = "public") -> DesiredTable:
@@ -241,7 +278,7 @@ def build_desired_table(parsed: ParsedRecord, schema_name: str = "public") -> De
             name=f.name,
             sql_type=_pydantic_field_to_sql_type(f),
             is_nullable=f.nullable,
-            default=repr(f.default) if f.default is not None else None,
+            default=_sql_default(f.default) if f.default is not None else None,
             is_unique=f.unique,
         )
         table.columns[f.name] = col
@@ -258,16 +295,18 @@ def build_desired_table(parsed: ParsedRecord, schema_name: str = "public") -> De
                 name=col_name, sql_type=col_type, is_nullable=nullable,
             )
 
-    # Soft delete columns (if SoftDeleteMixin)
+    # Soft delete columns (if SoftDeleteMixin). Reads filter on the
+    # NOT NULL boolean; deleted_at is informational only.
     if parsed.soft_delete:
+        table.columns["is_deleted"] = DesiredColumn(
+            name="is_deleted", sql_type="BOOLEAN", is_nullable=False, default="false",
+        )
         for col_name, col_type in [
-            ("is_deleted", "BOOLEAN"),
             ("deleted_at", "TIMESTAMP WITH TIME ZONE"),
             ("deleted_by", "VARCHAR(100)"),
         ]:
             table.columns[col_name] = DesiredColumn(
                 name=col_name, sql_type=col_type, is_nullable=True,
-                default="false" if col_name == "is_deleted" else None,
             )
 
     # Foreign keys from relationships
@@ -323,10 +362,116 @@ def build_desired_schema(
 # Live DB introspection
 # ---------------------------------------------------------------------------
 
+# Persistent introspection cache (one JSON file per DB + schema); None means
+# <project root>/.appos/reflection_cache, next to the other generator outputs
+_REFLECTION_CACHE_DIR: Optional[Path] = None
+
+# Cheap catalog-level fingerprint of every column in a schema. Changes whenever
+# a relation or column is added, dropped, renamed, retyped, or has its
+# nullability/default altered — i.e. whenever information_schema would differ.
+_FINGERPRINT_SQL = """
+    SELECT md5(coalesce(string_agg(
+        c.oid::text || ':' || c.relname || ':' || a.attnum::text || ':' || a.attname
+        || ':' || a.atttypid::text || ':' || a.atttypmod::text || ':' || a.attnotnull::text
+        || ':' || coalesce(pg_get_expr(d.adbin, d.adrelid), ''),
+        ',' ORDER BY c.relname, a.attnum
+    ), ''))
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    JOIN pg_attribute a ON a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+    LEFT JOIN pg_attrdef d ON d.adrelid = c.oid AND d.adnum = a.attnum
+    WHERE n.nspname = :schema AND c.relkind IN ('r', 'p', 'v', 'm', 'f')
+"""
+
+
+def _schema_fingerprint(engine, schema_name: str) -> Optional[str]:
+    """
+    Compute a fingerprint of a schema's column catalog.
+
+    Returns None if the fingerprint can't be computed (e.g., non-PostgreSQL
+    engine), which disables the reflection cache for that call.
+    """
+    from sqlalchemy import text
+
+    try:
+        with engine.connect() as conn:
+            return conn.execute(text(_FINGERPRINT_SQL), {"schema": schema_name}).scalar()
+    except Exception as e:
+        logger.debug("Schema fingerprint unavailable for '%s': %s", schema_name, e)
+        return None
+
+
+def _reflection_cache_path(engine, schema_name: str) -> Path:
+    """Cache file for an engine's database + schema (password never included)."""
+    try:
+        url = engine.url.render_as_string(hide_password=True)
+    except AttributeError:
+        url = repr(engine)
+    db_key = hashlib.blake2b(url.encode("utf-8"), digest_size=8).hexdigest()
+    cache_dir = _REFLECTION_CACHE_DIR or get_project_root() / ".appos" / "reflection_cache"
+    return cache_dir / f"{schema_name}_{db_key}.json"
+
+
+def _load_reflection_cache(
+    path: Path,
+    fingerprint: str,
+    schema_name: str,
+    table_names: Optional[Set[str]],
+) -> Optional[Dict[str, LiveTable]]:
+    """Load cached LiveTables if the fingerprint matches and covers table_names."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    if data.get("fingerprint") != fingerprint:
+        return None
+    cached_filter = data.get("table_names")
+    if cached_filter is not None and (not table_names or not table_names <= set(cached_filter)):
+        return None
+
+    tables: Dict[str, LiveTable] = {}
+    for t_name, cols in data.get("tables", {}).items():
+        if table_names and t_name not in table_names:
+            continue
+        tbl = LiveTable(name=t_name, schema_name=schema_name)
+        for row in cols:
+            tbl.columns[row[0]] = LiveColumn(*row)
+        tables[t_name] = tbl
+    return tables
+
+
+def _save_reflection_cache(
+    path: Path,
+    fingerprint: str,
+    table_names: Optional[Set[str]],
+    tables: Dict[str, LiveTable],
+) -> None:
+    """Persist introspected LiveTables; failures are logged and ignored."""
+    data = {
+        "fingerprint": fingerprint,
+        "table_names": sorted(table_names) if table_names else None,
+        "tables": {
+            t_name: [
+                [c.name, c.data_type, c.is_nullable, c.column_default,
+                 c.character_maximum_length, c.numeric_precision, c.numeric_scale]
+                for c in tbl.columns.values()
+            ]
+            for t_name, tbl in tables.items()
+        },
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_if_changed(path, json.dumps(data))
+    except OSError as e:
+        logger.debug("Could not write reflection cache %s: %s", path, e)
+
+
 def introspect_live_tables(
     schema_name: str,
     engine=None,
     table_names: Optional[Set[str]] = None,
+    use_cache: bool = True,
 ) -> Dict[str, LiveTable]:
     """
     Introspect live database tables using information_schema.
@@ -335,11 +480,13 @@ def introspect_live_tables(
         schema_name: DB schema to inspect.
         engine: SQLAlchemy engine (defaults to platform engine).
         table_names: Optional set of table names to filter. If None, all tables.
+        use_cache: Reuse the on-disk reflection cache when the schema
+            fingerprint is unchanged since the last introspection.
 
     Returns:
         Dict of table_name → LiveTable.
     """
-    from sqlalchemy import text
+    from sqlalchemy import bindparam, text
 
     if engine is None:
         from appos.db.base import engine_registry
@@ -348,7 +495,17 @@ def introspect_live_tables(
             logger.warning("No platform engine available — cannot introspect DB")
             return {}
 
-    query = text("""
+    fingerprint = _schema_fingerprint(engine, schema_name) if use_cache else None
+    if fingerprint is not None:
+        cache_path = _reflection_cache_path(engine, schema_name)
+        cached = _load_reflection_cache(cache_path, fingerprint, schema_name, table_names)
+        if cached is not None:
+            logger.debug("Reflection cache hit for schema '%s' (%d tables)", schema_name, len(cached))
+            return cached
+
+    # Filter in SQL if specific tables requested
+    table_filter = "AND c.table_name IN :table_names" if table_names else ""
+    query = text(f"""
         SELECT
             c.table_name,
             c.column_name,
@@ -360,39 +517,42 @@ def introspect_live_tables(
             c.numeric_scale
         FROM information_schema.columns c
         WHERE c.table_schema = :schema
+        {table_filter}
         ORDER BY c.table_name, c.ordinal_position
     """)
+    params: Dict[str, Any] = {"schema": schema_name}
+    if table_names:
+        query = query.bindparams(bindparam("table_names", expanding=True))
+        params["table_names"] = sorted(table_names)
 
     tables: Dict[str, LiveTable] = {}
 
     try:
         with engine.connect() as conn:
-            result = conn.execute(query, {"schema": schema_name})
-            for row in result:
-                t_name = row[0]
-
-                # Filter if specific tables requested
-                if table_names and t_name not in table_names:
-                    continue
-
-                if t_name not in tables:
-                    tables[t_name] = LiveTable(name=t_name, schema_name=schema_name)
-
-                col = LiveColumn(
-                    name=row[1],
-                    data_type=row[2],
-                    is_nullable=row[3] == "YES",
-                    column_default=row[4],
-                    character_maximum_length=row[5],
-                    numeric_precision=row[6],
-                    numeric_scale=row[7],
+            result = conn.execute(query, params)
+            for (t_name, col_name, data_type, is_nullable, column_default,
+                 char_max_len, num_precision, num_scale) in result:
+                tbl = tables.get(t_name) or tables.setdefault(
+                    t_name, LiveTable(name=t_name, schema_name=schema_name),
+                )
+                tbl.columns[col_name] = LiveColumn(
+                    col_name,
+                    data_type,
+                    is_nullable == "YES",
+                    column_default,
+                    char_max_len,
+                    num_precision,
+                    num_scale,
                 )
-                tables[t_name].columns[col.name] = col
 
     except Exception as e:
         logger.error(f"Failed to introspect schema '{schema_name}': {e}")
+        return tables
+
+    if fingerprint is not None:
+        _save_reflection_cache(cache_path, fingerprint, table_names, tables)
 
-    logger.debug(f"Introspected {len(tables)} tables in schema '{schema_name}'")
+    logger.debug("Introspected %d tables in schema '%s'", len(tables), schema_name)
     return tables
 
 
@@ -404,10 +564,15 @@ def compute_diff(
     desired: Dict[str, DesiredTable],
     live: Dict[str, LiveTable],
     app_name: str,
+    stop_on_first_change: bool = False,
 ) -> MigrationDiff:
     """
     Compare desired schema (from @records) with live DB state.
 
+    Args:
+        stop_on_first_change: Return as soon as one change is found. The
+            resulting diff is partial — only reliable for ``has_changes``.
+
     Returns a MigrationDiff describing all necessary changes.
     """
     diff = MigrationDiff(app_name=app_name)
@@ -421,11 +586,13 @@ def compute_diff(
                 change_type="create",
                 desired=desired_table,
             ))
+            if stop_on_first_change:
+                return diff
             continue
 
         # 2. Existing tables — compare columns
         live_table = live[table_name]
-        col_diffs = _diff_columns(desired_table, live_table)
+        col_diffs = _diff_columns(desired_table, live_table, stop_on_first_change=stop_on_first_change)
         if col_diffs:
             diff.table_diffs.append(TableDiff(
                 table_name=table_name,
@@ -434,6 +601,8 @@ def compute_diff(
                 column_diffs=col_diffs,
                 desired=desired_table,
             ))
+            if stop_on_first_change:
+                return diff
 
     # 3. Dropped tables — only flag tables that were previously generated
     # (Don't flag platform tables or tables from other apps)
@@ -444,27 +613,52 @@ def compute_diff(
     return diff
 
 
-def _diff_columns(desired: DesiredTable, live: LiveTable) -> List[ColumnDiff]:
-    """Compare columns between desired and live table."""
+# Platform-managed columns never flagged as dropped
+_SYSTEM_COLS: frozenset = frozenset({
+    "id", "created_at", "updated_at", "created_by",
+    "updated_by", "is_deleted", "deleted_at", "deleted_by",
+})
+
+
+def _diff_columns(
+    desired: DesiredTable,
+    live: LiveTable,
+    stop_on_first_change: bool = False,
+) -> List[ColumnDiff]:
+    """
+    Compare columns between desired and live table.
+
+    With stop_on_first_change, returns after the first diff is found.
+    """
+    # Fast path: same column names with identical types/nullability (the
+    # common "already in sync" case) — skip the per-column diff walk.
+    live_cols = live.columns
+    if desired.columns.keys() == live_cols.keys() and all(
+        col.normalized_type == live_cols[name].normalized_type
+        and col.is_nullable == live_cols[name].is_nullable
+        for name, col in desired.columns.items()
+    ):
+        return []
+
     diffs: List[ColumnDiff] = []
+    desired_cols = desired.columns
 
-    # New columns
-    for col_name, desired_col in desired.columns.items():
-        if col_name not in live.columns:
+    # New and changed columns (desired column order)
+    for col_name, desired_col in desired_cols.items():
+        live_col = live_cols.get(col_name)
+        if live_col is None:
             diffs.append(ColumnDiff(
                 column_name=col_name,
                 change_type="add",
                 new_value=desired_col.sql_type,
                 desired=desired_col,
             ))
+            if stop_on_first_change:
+                return diffs
             continue
 
         # Type changes
-        live_col = live.columns[col_name]
-        desired_base = desired_col.normalized_type
-        live_base = live_col.normalized_type
-
-        if not _types_compatible(desired_base, live_base):
+        if not _types_compatible(desired_col.normalized_type, live_col.normalized_type):
             diffs.append(ColumnDiff(
                 column_name=col_name,
                 change_type="modify_type",
@@ -472,6 +666,8 @@ def _diff_columns(desired: DesiredTable, live: LiveTable) -> List[ColumnDiff]:
                 new_value=desired_col.sql_type,
                 desired=desired_col,
             ))
+            if stop_on_first_change:
+                return diffs
 
         # Nullable changes
         if desired_col.is_nullable != live_col.is_nullable:
@@ -482,23 +678,51 @@ def _diff_columns(desired: DesiredTable, live: LiveTable) -> List[ColumnDiff]:
                 new_value=str(desired_col.is_nullable),
                 desired=desired_col,
             ))
+            if stop_on_first_change:
+                return diffs
 
     # Dropped columns (conservative — just flag, don't auto-drop)
-    for col_name in live.columns:
-        if col_name not in desired.columns:
-            # Only flag if it's not a system column
-            system_cols = {"id", "created_at", "updated_at", "created_by",
-                           "updated_by", "is_deleted", "deleted_at", "deleted_by"}
-            if col_name not in system_cols:
+    dropped = live_cols.keys() - desired_cols.keys()
+    if dropped:
+        dropped -= _SYSTEM_COLS  # Only flag if it's not a system column
+        for col_name, live_col in live_cols.items():  # live column order
+            if col_name in dropped:
                 diffs.append(ColumnDiff(
                     column_name=col_name,
                     change_type="drop",
-                    old_value=live.columns[col_name].data_type,
+                    old_value=live_col.data_type,
                 ))
+                if stop_on_first_change:
+                    return diffs
 
     return diffs
 
 
+# Common compatible type pairs (symmetric)
+_COMPATIBLE_TYPE_PAIRS: Tuple[Tuple[str, str], ...] = (
+    ("SERIAL", "INTEGER"),
+    ("BIGSERIAL", "BIGINT"),
+    ("VARCHAR", "TEXT"),
+    ("TIMESTAMPTZ", "TIMESTAMP"),
+    ("JSON", "JSONB"),
+    ("FLOAT", "NUMERIC"),
+    ("NUMERIC", "DOUBLE PRECISION"),
+)
+
+
+def _build_compat_map(pairs: Sequence[Tuple[str, str]]) -> Dict[str, frozenset]:
+    """Expand symmetric type pairs into a type → compatible-types adjacency map."""
+    adjacency: Dict[str, Set[str]] = {}
+    for a, b in pairs:
+        adjacency.setdefault(a, set()).add(b)
+        adjacency.setdefault(b, set()).add(a)
+    return {t: frozenset(others) for t, others in adjacency.items()}
+
+
+_COMPAT: Dict[str, frozenset] = _build_compat_map(_COMPATIBLE_TYPE_PAIRS)
+_EMPTY_FROZENSET: frozenset = frozenset()
+
+
 def _types_compatible(desired: str, live: str) -> bool:
     """
     Check if two normalized SQL types are compatible.
@@ -507,25 +731,44 @@ def _types_compatible(desired: str, live: str) -> bool:
     """
     if desired == live:
         return True
-
-    # Common compatible pairs
-    compatible_pairs = {
-        frozenset({"SERIAL", "INTEGER"}),
-        frozenset({"BIGSERIAL", "BIGINT"}),
-        frozenset({"VARCHAR", "TEXT"}),
-        frozenset({"TIMESTAMPTZ", "TIMESTAMP"}),
-        frozenset({"JSON", "JSONB"}),
-        frozenset({"FLOAT", "NUMERIC"}),
-        frozenset({"NUMERIC", "DOUBLE PRECISION"}),
-    }
-
-    return frozenset({desired, live}) in compatible_pairs
+    return live in _COMPAT.get(desired, _EMPTY_FROZENSET)
 
 
 # ---------------------------------------------------------------------------
 # Migration script generation
 # ---------------------------------------------------------------------------
 
+_MIGRATION_TEMPLATE = '''\
+"""
+{desc}
+
+Revision: {revision}
+App: {app_name}
+Created: {created}
+
+Auto-generated by AppOS Migration Generator.
+Review before applying — especially DROP operations.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# Revision identifiers
+revision = "{revision}"
+down_revision = None  # Set manually or auto-chain
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+{upgrade_body}
+
+
+def downgrade() -> None:
+{downgrade_body}
+'''
+
+
 def generate_migration_script(
     diff: MigrationDiff,
     sequence: int = 1,
@@ -546,191 +789,156 @@ def generate_migration_script(
         return ""
 
     desc = description or diff.summary
-    slug = re.sub(r"[^a-z0-9]+", "_", desc.lower()).strip("_")[:50]
     revision = f"{diff.timestamp}_{sequence:03d}"
 
-    # Collect all upgrade/downgrade operations
-    upgrade_ops: List[str] = []
-    downgrade_ops: List[str] = []
+    # Stream all upgrade/downgrade operations into two buffers
+    up_buf = io.StringIO()
+    down_buf = io.StringIO()
 
     for td in diff.table_diffs:
         if td.change_type == "create":
-            upgrade_ops.append(_gen_create_table(td))
-            downgrade_ops.append(f"    op.drop_table('{td.table_name}', schema='{td.schema_name}')")
+            _gen_create_table(td, up_buf)
+            down_buf.write(f"    op.drop_table('{td.table_name}', schema='{td.schema_name}')\n\n")
 
         elif td.change_type == "alter":
             for cd in td.column_diffs:
                 if cd.change_type == "add":
-                    col_def = _gen_add_column(td.table_name, td.schema_name, cd)
-                    upgrade_ops.append(col_def)
-                    downgrade_ops.append(
+                    _gen_add_column(td.table_name, td.schema_name, cd, up_buf)
+                    down_buf.write(
                         f"    op.drop_column('{td.table_name}', '{cd.column_name}', "
-                        f"schema='{td.schema_name}')"
+                        f"schema='{td.schema_name}')\n\n"
                     )
 
                 elif cd.change_type == "drop":
-                    upgrade_ops.append(
+                    up_buf.write(
                         f"    # WARNING: Dropping column '{cd.column_name}' — verify data migration\n"
                         f"    op.drop_column('{td.table_name}', '{cd.column_name}', "
-                        f"schema='{td.schema_name}')"
+                        f"schema='{td.schema_name}')\n\n"
                     )
-                    downgrade_ops.append(
-                        f"    # Cannot auto-restore dropped column '{cd.column_name}' — manual intervention required"
+                    down_buf.write(
+                        f"    # Cannot auto-restore dropped column '{cd.column_name}' — manual intervention required\n\n"
                     )
 
                 elif cd.change_type == "modify_type":
-                    upgrade_ops.append(
+                    up_buf.write(
                         f"    op.alter_column(\n"
                         f"        '{td.table_name}', '{cd.column_name}',\n"
                         f"        type_=sa.{_sql_to_sa_type(cd.new_value)}(),\n"
                         f"        schema='{td.schema_name}'\n"
-                        f"    )"
+                        f"    )\n\n"
                     )
-                    downgrade_ops.append(
+                    down_buf.write(
                         f"    op.alter_column(\n"
                         f"        '{td.table_name}', '{cd.column_name}',\n"
                         f"        type_=sa.{_sql_to_sa_type(cd.old_value)}(),\n"
                         f"        schema='{td.schema_name}'\n"
-                        f"    )"
+                        f"    )\n\n"
                     )
 
                 elif cd.change_type == "modify_nullable":
                     nullable = cd.new_value == "True"
-                    upgrade_ops.append(
+                    up_buf.write(
                         f"    op.alter_column(\n"
                         f"        '{td.table_name}', '{cd.column_name}',\n"
                         f"        nullable={nullable},\n"
                         f"        schema='{td.schema_name}'\n"
-                        f"    )"
+                        f"    )\n\n"
                     )
-                    downgrade_ops.append(
+                    down_buf.write(
                         f"    op.alter_column(\n"
                         f"        '{td.table_name}', '{cd.column_name}',\n"
                         f"        nullable={not nullable},\n"
                         f"        schema='{td.schema_name}'\n"
-                        f"    )"
+                        f"    )\n\n"
                     )
 
-    upgrade_body = "\n\n".join(upgrade_ops) if upgrade_ops else "    pass"
-    downgrade_body = "\n\n".join(downgrade_ops) if downgrade_ops else "    pass"
-
-    script = textwrap.dedent(f'''\
-        """
-        {desc}
-
-        Revision: {revision}
-        App: {diff.app_name}
-        Created: {datetime.now(timezone.utc).isoformat()}
-
-        Auto-generated by AppOS Migration Generator.
-        Review before applying — especially DROP operations.
-        """
-
-        from alembic import op
-        import sqlalchemy as sa
-
-        # Revision identifiers
-        revision = "{revision}"
-        down_revision = None  # Set manually or auto-chain
-        branch_labels = None
-        depends_on = None
-
-
-        def upgrade() -> None:
-        {upgrade_body}
-
-
-        def downgrade() -> None:
-        {downgrade_body}
-    ''')
-
-    return script
+    return _MIGRATION_TEMPLATE.format(
+        desc=desc,
+        revision=revision,
+        app_name=diff.app_name,
+        created=datetime.now(timezone.utc).isoformat(),
+        upgrade_body=up_buf.getvalue().rstrip() or "    pass",
+        downgrade_body=down_buf.getvalue().rstrip() or "    pass",
+    )
 
 
-def _gen_create_table(td: TableDiff) -> str:
-    """Generate op.create_table() call for a new table."""
+def _gen_create_table(td: TableDiff, buf: io.StringIO) -> None:
+    """Write an op.create_table() call for a new table into buf."""
     if td.desired is None:
-        return f"    # Cannot generate CREATE TABLE for '{td.table_name}' — missing schema"
+        buf.write(f"    # Cannot generate CREATE TABLE for '{td.table_name}' — missing schema\n\n")
+        return
 
-    lines = [f"    op.create_table(\n        '{td.table_name}',"]
+    buf.write(f"    op.create_table(\n        '{td.table_name}',\n")
 
     for col_name, col in td.desired.columns.items():
-        sa_type = _sql_to_sa_type(col.sql_type)
-        parts = [f"sa.Column('{col_name}', sa.{sa_type}()"]
+        buf.write(f"        sa.Column('{col_name}', sa.{_sql_to_sa_type(col.sql_type)}()")
 
         if col.is_primary_key:
-            parts.append("primary_key=True")
+            buf.write(", primary_key=True")
             if col.sql_type.upper() == "SERIAL":
-                parts.append("autoincrement=True")
+                buf.write(", autoincrement=True")
         if not col.is_nullable:
-            parts.append("nullable=False")
+            buf.write(", nullable=False")
         if col.is_unique:
-            parts.append("unique=True")
+            buf.write(", unique=True")
         if col.default is not None and not col.is_primary_key:
-            parts.append(f"server_default=sa.text('{col.default}')")
+            buf.write(f", server_default=sa.text({col.default!r})")
 
-        line = ", ".join(parts) + ")"
-        lines.append(f"        {line},")
+        buf.write("),\n")
 
-    lines.append(f"        schema='{td.schema_name}'")
-    lines.append("    )")
+    buf.write(f"        schema='{td.schema_name}'\n    )\n\n")
 
-    return "\n".join(lines)
 
-
-def _gen_add_column(table_name: str, schema_name: str, cd: ColumnDiff) -> str:
-    """Generate op.add_column() for a new column."""
+def _gen_add_column(table_name: str, schema_name: str, cd: ColumnDiff, buf: io.StringIO) -> None:
+    """Write an op.add_column() call for a new column into buf."""
     if cd.desired is None:
-        return f"    # Cannot generate ADD COLUMN for '{cd.column_name}'"
+        buf.write(f"    # Cannot generate ADD COLUMN for '{cd.column_name}'\n\n")
+        return
 
     sa_type = _sql_to_sa_type(cd.desired.sql_type)
-    parts = [f"sa.Column('{cd.column_name}', sa.{sa_type}()"]
-
-    if not cd.desired.is_nullable:
-        parts.append("nullable=False")
-
-    col_def = ", ".join(parts) + ")"
+    nullable = "" if cd.desired.is_nullable else ", nullable=False"
 
-    return (
+    buf.write(
         f"    op.add_column(\n"
         f"        '{table_name}',\n"
-        f"        {col_def},\n"
+        f"        sa.Column('{cd.column_name}', sa.{sa_type}(){nullable}),\n"
         f"        schema='{schema_name}'\n"
-        f"    )"
+        f"    )\n\n"
     )
 
 
+_SA_TYPE_MAP: Dict[str, str] = {
+    "VARCHAR": "String",
+    "TEXT": "Text",
+    "INTEGER": "Integer",
+    "INT": "Integer",
+    "SERIAL": "Integer",
+    "BIGINT": "BigInteger",
+    "BIGSERIAL": "BigInteger",
+    "SMALLINT": "SmallInteger",
+    "NUMERIC": "Numeric",
+    "FLOAT": "Float",
+    "DOUBLE PRECISION": "Float",
+    "BOOLEAN": "Boolean",
+    "DATE": "Date",
+    "TIMESTAMP": "DateTime",
+    "TIMESTAMP WITH TIME ZONE": "DateTime",
+    "TIMESTAMPTZ": "DateTime",
+    "JSON": "JSON",
+    "JSONB": "JSON",
+    "BYTEA": "LargeBinary",
+}
+
+
+@lru_cache(maxsize=256)
 def _sql_to_sa_type(sql_type: str) -> str:
     """
     Convert SQL type string to SQLAlchemy type name.
 
     Examples: "VARCHAR(100)" → "String", "INTEGER" → "Integer"
     """
-    base = sql_type.split("(")[0].upper().strip()
-
-    mapping = {
-        "VARCHAR": "String",
-        "TEXT": "Text",
-        "INTEGER": "Integer",
-        "INT": "Integer",
-        "SERIAL": "Integer",
-        "BIGINT": "BigInteger",
-        "BIGSERIAL": "BigInteger",
-        "SMALLINT": "SmallInteger",
-        "NUMERIC": "Numeric",
-        "FLOAT": "Float",
-        "DOUBLE PRECISION": "Float",
-        "BOOLEAN": "Boolean",
-        "DATE": "Date",
-        "TIMESTAMP": "DateTime",
-        "TIMESTAMP WITH TIME ZONE": "DateTime",
-        "TIMESTAMPTZ": "DateTime",
-        "JSON": "JSON",
-        "JSONB": "JSON",
-        "BYTEA": "LargeBinary",
-    }
-
-    return mapping.get(base, "String")
+    base = sql_type.partition("(")[0].strip().upper()
+    return _SA_TYPE_MAP.get(base, "String")
 
 
 # ---------------------------------------------------------------------------
@@ -777,49 +985,158 @@ def generate_migration(
         table_names=set(desired.keys()),
     )
 
-    # 3. Compute diff
+    # 3–6. Diff, generate and write
+    return _generate_from_diff(
+        app_name, desired, live,
+        output_dir=output_dir,
+        description=description,
+        dry_run=dry_run,
+    )
+
+
+def has_pending_migration(
+    app_name: str,
+    schema_name: str = "public",
+    engine=None,
+    registry=None,
+) -> bool:
+    """
+    Check whether an app's @records differ from the live DB (CI dry-check).
+
+    Stops at the first detected difference instead of building a full diff.
+    """
+    desired = build_desired_schema(app_name, schema_name, registry)
+    if not desired:
+        return False
+
+    live = introspect_live_tables(
+        schema_name=schema_name,
+        engine=engine,
+        table_names=set(desired.keys()),
+    )
+    return compute_diff(desired, live, app_name, stop_on_first_change=True).has_changes
+
+
+def _generate_from_diff(
+    app_name: str,
+    desired: Dict[str, DesiredTable],
+    live: Dict[str, LiveTable],
+    output_dir: Optional[str] = None,
+    description: Optional[str] = None,
+    dry_run: bool = False,
+) -> Optional[str]:
+    """
+    Diff an app's desired tables against already-introspected live tables
+    and write the resulting migration script.
+
+    Shared by generate_migration() and generate_all_migrations() so the
+    latter can introspect the schema once for every app.
+    """
     diff = compute_diff(desired, live, app_name)
 
     if not diff.has_changes:
         logger.info(f"No migration needed for app '{app_name}' — schema is in sync")
         return None
 
-    logger.info(f"Migration diff for '{app_name}': {diff.summary}")
+    logger.info("Migration diff for '%s': %s", app_name, diff.summary)
+    if logger.isEnabledFor(logging.DEBUG):
+        for td in diff.table_diffs:
+            logger.debug("  %s %s: %r", td.change_type, td.table_name, td.column_diffs)
 
-    # 4. Determine sequence number
+    # Determine sequence number
     out_dir = output_dir or f"migrations/{app_name}/versions"
-    sequence = _next_sequence_number(out_dir)
+    latest_sequence, latest_name = _latest_migration(out_dir)
+    sequence = latest_sequence + 1
 
-    # 5. Generate script
+    # Generate script
     script = generate_migration_script(diff, sequence, description)
 
     if dry_run:
         return script
 
-    # 6. Write to file
+    # Re-running against a schema the latest (unapplied) migration already
+    # covers yields the same operations — reuse that file instead of adding
+    # a duplicate under the next sequence number
     out_path = Path(out_dir)
+    if latest_name is not None:
+        latest_path = out_path / latest_name
+        try:
+            latest_script = latest_path.read_text(encoding="utf-8")
+        except OSError:
+            latest_script = None
+        if latest_script is not None and _script_body(latest_script) == _script_body(script):
+            logger.info(f"Migration unchanged, reusing: {latest_path}")
+            return str(latest_path)
+
+    # Write to file
     out_path.mkdir(parents=True, exist_ok=True)
 
-    slug = re.sub(r"[^a-z0-9]+", "_", (description or diff.summary).lower()).strip("_")[:50]
+    slug = _SLUG_RE.sub("_", (description or diff.summary).lower()).strip("_")[:50]
     filename = f"{sequence:03d}_{slug}.py"
     filepath = out_path / filename
 
-    filepath.write_text(script, encoding="utf-8")
+    _write_if_changed(filepath, script)
     logger.info(f"Migration written: {filepath}")
 
     return str(filepath)
 
 
+# Header lines that differ between runs of the same diff (timestamps, sequence)
+_VOLATILE_SCRIPT_LINE_RE = re.compile(r'^(?:Revision: |Created: |revision = ").*$', re.MULTILINE)
+
+
+def _script_body(script: str) -> str:
+    """A migration script with its per-run revision/timestamp lines blanked."""
+    return _VOLATILE_SCRIPT_LINE_RE.sub("", script)
+
+
+def _write_if_changed(filepath: Path, content: str) -> bool:
+    """
+    Atomically write content to filepath unless it already holds the same bytes.
+
+    Writes go to a temp file in the same directory and are moved into place
+    with os.replace, so readers never observe a half-written migration.
+
+    Returns:
+        True if the file was written, False if it was already up to date.
+    """
+    data = content.encode("utf-8")
+    try:
+        if filepath.stat().st_size == len(data) and filepath.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+
+    fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, prefix=f".{filepath.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+    return True
+
+
 def generate_all_migrations(
     schema_name: str = "public",
     output_base: str = "migrations",
     engine=None,
     registry=None,
     dry_run: bool = False,
+    parallel: bool = True,
 ) -> Dict[str, Optional[str]]:
     """
     Generate migrations for ALL apps that have @record objects.
 
+    The live schema is introspected once for the union of every app's
+    tables, then each app is diffed against its own subset.
+
+    Args:
+        parallel: Run per-app record parsing and script generation on a
+            thread pool. Set False for restricted environments.
+
     Returns:
         Dict of app_name → migration file path (or None if no changes).
     """
@@ -828,37 +1145,73 @@ def generate_all_migrations(
 
     # Discover all apps with records
     all_records = reg.get_by_type("record")
-    apps = set()
-    for r in all_records:
-        if r.app_name:
-            apps.add(r.app_name)
-
-    results: Dict[str, Optional[str]] = {}
-    for app_name in sorted(apps):
-        result = generate_migration(
-            app_name=app_name,
+    app_names = sorted({r.app_name for r in all_records if r.app_name})
+    if not app_names:
+        return {}
+
+    executor = (
+        ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(app_names)))
+        if parallel and len(app_names) > 1 else None
+    )
+    try:
+        # 1. Build desired schemas for every app up front
+        if executor:
+            desired_list = list(executor.map(
+                lambda a: build_desired_schema(a, schema_name, reg), app_names,
+            ))
+        else:
+            desired_list = [build_desired_schema(a, schema_name, reg) for a in app_names]
+        desired_by_app: Dict[str, Dict[str, DesiredTable]] = dict(zip(app_names, desired_list))
+
+        # 2. Introspect the live DB once for all apps' tables
+        all_tables: Set[str] = set().union(*(d.keys() for d in desired_by_app.values()))
+        live_all = introspect_live_tables(
             schema_name=schema_name,
-            output_dir=f"{output_base}/{app_name}/versions",
             engine=engine,
-            registry=reg,
-            dry_run=dry_run,
-        )
-        results[app_name] = result
+            table_names=all_tables,
+        ) if all_tables else {}
+
+        # 3. Diff + generate per app against its slice of the live schema
+        def _generate_one(app_name: str) -> Optional[str]:
+            desired = desired_by_app[app_name]
+            if not desired:
+                logger.info(f"No @record objects found for app '{app_name}'")
+                return None
+            live_app = {t: live_all[t] for t in desired if t in live_all}
+            return _generate_from_diff(
+                app_name, desired, live_app,
+                output_dir=f"{output_base}/{app_name}/versions",
+                dry_run=dry_run,
+            )
 
-    return results
+        if executor:
+            futures = {executor.submit(_generate_one, a): a for a in app_names}
+            generated = {futures[f]: f.result() for f in as_completed(futures)}
+        else:
+            generated = {a: _generate_one(a) for a in app_names}
+    finally:
+        if executor:
+            executor.shutdown()
 
+    return {a: generated[a] for a in app_names}
 
-def _next_sequence_number(versions_dir: str) -> int:
-    """Determine the next migration sequence number."""
-    path = Path(versions_dir)
-    if not path.exists():
-        return 1
 
-    max_seq = 0
-    for py_file in path.glob("*.py"):
-        match = re.match(r"^(\d+)_", py_file.name)
-        if match:
-            seq = int(match.group(1))
-            max_seq = max(max_seq, seq)
+def _latest_migration(versions_dir: str) -> Tuple[int, Optional[str]]:
+    """Highest migration sequence number in versions_dir and its filename (0, None if empty)."""
+    max_seq, latest = 0, None
+    try:
+        with os.scandir(versions_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(".py"):
+                    continue
+                underscore = name.find("_")
+                if underscore <= 0:
+                    continue
+                head = name[:underscore]
+                if head.isdecimal() and int(head) > max_seq:
+                    max_seq, latest = int(head), name
+    except FileNotFoundError:
+        pass
 
-    return max_seq + 1
+    return max_seq, latest
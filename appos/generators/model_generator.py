@@ -15,14 +15,25 @@ Design refs: AppOS_Design.md §9 (Record System & Auto-Generation), §5.7 (Recor
 
 from __future__ import annotations
 
+import hashlib
+import inspect
+import io
 import logging
 import os
+import pickle
 import re
 import textwrap
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Type, get_args, get_origin
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple, Type, get_args, get_origin
+from weakref import WeakKeyDictionary
 
+from appos.engine.config import get_project_root
+from appos.engine.registry import object_registry
 from appos.utilities.utils import to_snake
 
 from pydantic import BaseModel
@@ -64,6 +75,14 @@ SQL_TYPE_MAPPING = {
 
 def _get_field_type_name(annotation: Any) -> str:
     """Extract the base type name from a possibly-Optional annotation."""
+    try:
+        return _cached_field_type_name(annotation)
+    except TypeError:
+        # Unhashable annotation (e.g. Literal over a list value) — skip the cache
+        return _field_type_name(annotation)
+
+
+def _field_type_name(annotation: Any) -> str:
     origin = get_origin(annotation)
 
     # Optional[X] is Union[X, None]
@@ -91,6 +110,10 @@ def _get_field_type_name(annotation: Any) -> str:
     return str(annotation)
 
 
+# typing generics are cached/interned, so one lookup per distinct annotation
+_cached_field_type_name = lru_cache(maxsize=1024)(_field_type_name)
+
+
 def _is_optional(annotation: Any) -> bool:
     """Check if annotation is Optional[X]."""
     args = get_args(annotation)
@@ -107,143 +130,133 @@ def _is_relationship(field_info: FieldInfo) -> bool:
     return False
 
 
-def _get_max_length(field_info: FieldInfo) -> Optional[int]:
-    """Extract max_length from Field metadata."""
-    return getattr(field_info, "max_length", None)
+def _extract_constraints(
+    field_info: FieldInfo,
+) -> Tuple[Optional[int], Optional[int], Optional[List[str]], Optional[float], Optional[float], bool]:
+    """
+    Extract all column constraints from a field in one pass.
 
+    Walks ``metadata`` once (for ge/le) and reads ``json_schema_extra`` once
+    (for decimal_places/choices/unique).
 
-def _get_decimal_places(field_info: FieldInfo) -> Optional[int]:
-    """Extract decimal_places from Field json_schema_extra."""
-    extra = getattr(field_info, "json_schema_extra", None) or {}
-    if isinstance(extra, dict):
-        return extra.get("decimal_places")
-    return getattr(field_info, "decimal_places", None)
-
+    Returns:
+        (max_length, decimal_places, choices, ge, le, unique)
+    """
+    ge = le = None
+    found_ge = found_le = False
+    for m in getattr(field_info, "metadata", None) or ():
+        if not found_ge and hasattr(m, "ge"):
+            ge, found_ge = m.ge, True
+        if not found_le and hasattr(m, "le"):
+            le, found_le = m.le, True
+    if not found_ge:
+        ge = getattr(field_info, "ge", None)
+    if not found_le:
+        le = getattr(field_info, "le", None)
 
-def _get_choices(field_info: FieldInfo) -> Optional[List[str]]:
-    """Extract choices from Field json_schema_extra."""
     extra = getattr(field_info, "json_schema_extra", None) or {}
     if isinstance(extra, dict):
-        return extra.get("choices")
-    return None
-
-
-def _get_ge(field_info: FieldInfo) -> Optional[float]:
-    """Extract ge (>=) constraint."""
-    for m in getattr(field_info, "metadata", []):
-        if hasattr(m, "ge"):
-            return m.ge
-    return getattr(field_info, "ge", None)
-
+        decimal_places = extra.get("decimal_places")
+        choices = extra.get("choices")
+        unique = extra.get("unique", False)
+    else:
+        decimal_places = getattr(field_info, "decimal_places", None)
+        choices = None
+        unique = False
 
-def _get_le(field_info: FieldInfo) -> Optional[float]:
-    """Extract le (<=) constraint."""
-    for m in getattr(field_info, "metadata", []):
-        if hasattr(m, "le"):
-            return m.le
-    return getattr(field_info, "le", None)
+    return getattr(field_info, "max_length", None), decimal_places, choices, ge, le, unique
 
 
 # ---------------------------------------------------------------------------
 # Record Parser
 # ---------------------------------------------------------------------------
 
+@dataclass(slots=True)
 class ParsedField:
     """Parsed field from a Pydantic record."""
-
-    def __init__(
-        self,
-        name: str,
-        python_type: str,
-        nullable: bool = False,
-        max_length: Optional[int] = None,
-        decimal_places: Optional[int] = None,
-        default: Any = None,
-        has_default: bool = False,
-        choices: Optional[List[str]] = None,
-        ge: Optional[float] = None,
-        le: Optional[float] = None,
-        unique: bool = False,
-        index: bool = False,
-        description: str = "",
-    ):
-        self.name = name
-        self.python_type = python_type
-        self.nullable = nullable
-        self.max_length = max_length
-        self.decimal_places = decimal_places
-        self.default = default
-        self.has_default = has_default
-        self.choices = choices
-        self.ge = ge
-        self.le = le
-        self.unique = unique
-        self.index = index
-        self.description = description
-
-
+    name: str
+    python_type: str
+    nullable: bool = False
+    max_length: Optional[int] = None
+    decimal_places: Optional[int] = None
+    default: Any = None
+    has_default: bool = False
+    choices: Optional[List[str]] = None
+    ge: Optional[float] = None
+    le: Optional[float] = None
+    unique: bool = False
+    index: bool = False
+    description: str = ""
+
+
+@dataclass(slots=True)
 class ParsedRelationship:
     """Parsed relationship declaration."""
-
-    def __init__(
-        self,
-        name: str,
-        rel_type: str,  # "has_many" | "belongs_to" | "has_one"
-        target: str,
-        back_ref: Optional[str] = None,
-        cascade: str = "save-update, merge",
-        required: bool = False,
-    ):
-        self.name = name
-        self.rel_type = rel_type
-        self.target = target
-        self.back_ref = back_ref
-        self.cascade = cascade
-        self.required = required
+    name: str
+    rel_type: str  # "has_many" | "belongs_to" | "has_one"
+    target: str
+    back_ref: Optional[str] = None
+    cascade: str = "save-update, merge"
+    required: bool = False
 
 
+@dataclass(slots=True)
 class ParsedRecord:
     """Fully parsed @record with fields, relationships, and Meta."""
+    class_name: str
+    app_name: str
+    table_name: str
+    fields: List[ParsedField]
+    relationships: List[ParsedRelationship]
+    audit: bool = False
+    soft_delete: bool = False
+    display_field: Optional[str] = None
+    search_fields: Optional[List[str]] = None
+    connected_system: Optional[str] = None
+    permissions: Optional[Dict[str, List[str]]] = None
+    on_create: Optional[List[str]] = None
+    on_update: Optional[List[str]] = None
+    on_delete: Optional[List[str]] = None
+    row_security_rule: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        # Normalize optional collections so callers can iterate directly
+        self.search_fields = self.search_fields or []
+        self.permissions = self.permissions or {}
+        self.on_create = self.on_create or []
+        self.on_update = self.on_update or []
+        self.on_delete = self.on_delete or []
+
+
+def _meta_snapshot(meta: Any) -> Dict[str, Any]:
+    """
+    Snapshot a record's Meta options into a plain dict.
+
+    Merges ``vars()`` along the Meta class MRO (so inherited options still
+    apply) instead of issuing one getattr per option.
+    """
+    if meta is None:
+        return {}
+    if isinstance(meta, type):
+        snapshot: Dict[str, Any] = {}
+        for klass in reversed(meta.__mro__[:-1]):  # skip `object`
+            snapshot.update(vars(klass))
+        return snapshot
+    return {name: getattr(meta, name) for name in dir(meta) if not name.startswith("__")}
+
 
-    def __init__(
-        self,
-        class_name: str,
-        app_name: str,
-        table_name: str,
-        fields: List[ParsedField],
-        relationships: List[ParsedRelationship],
-        audit: bool = False,
-        soft_delete: bool = False,
-        display_field: Optional[str] = None,
-        search_fields: Optional[List[str]] = None,
-        connected_system: Optional[str] = None,
-        permissions: Optional[Dict[str, List[str]]] = None,
-        on_create: Optional[List[str]] = None,
-        on_update: Optional[List[str]] = None,
-        on_delete: Optional[List[str]] = None,
-        row_security_rule: Optional[str] = None,
-    ):
-        self.class_name = class_name
-        self.app_name = app_name
-        self.table_name = table_name
-        self.fields = fields
-        self.relationships = relationships
-        self.audit = audit
-        self.soft_delete = soft_delete
-        self.display_field = display_field
-        self.search_fields = search_fields or []
-        self.connected_system = connected_system
-        self.permissions = permissions or {}
-        self.on_create = on_create or []
-        self.on_update = on_update or []
-        self.on_delete = on_delete or []
-        self.row_security_rule = row_security_rule
+# Parsed records per class (weakly keyed so reloaded classes can be collected),
+# then per app_name. ParsedRecord instances are shared — treat them as read-only.
+_PARSED_CACHE: "WeakKeyDictionary[type, Dict[str, ParsedRecord]]" = WeakKeyDictionary()
 
 
 def parse_record(record_class: type, app_name: str = "") -> ParsedRecord:
     """
     Parse a @record-decorated Pydantic class into structured data.
 
+    Results are cached per (record_class, app_name); repeated generation
+    passes reuse the first parse instead of re-walking model_fields.
+
     Args:
         record_class: The Pydantic BaseModel class decorated with @record.
         app_name: The app this record belongs to.
@@ -251,32 +264,54 @@ def parse_record(record_class: type, app_name: str = "") -> ParsedRecord:
     Returns:
         ParsedRecord with fields, relationships, and Meta.
     """
-    meta = getattr(record_class, "Meta", None)
+    try:
+        by_app = _PARSED_CACHE.get(record_class)
+    except TypeError:  # not weak-referenceable — parse without caching
+        return _parse_record(record_class, app_name)
+
+    if by_app is None:
+        by_app = _PARSED_CACHE[record_class] = {}
+    parsed = by_app.get(app_name)
+    if parsed is None:
+        parsed = by_app[app_name] = _parse_record(record_class, app_name)
+    return parsed
+
+
+def _parse_record(record_class: type, app_name: str) -> ParsedRecord:
+    """Uncached implementation of parse_record()."""
+    meta = _meta_snapshot(getattr(record_class, "Meta", None))
     class_name = record_class.__name__
 
     # Meta config
-    table_name = getattr(meta, "table_name", to_snake(class_name) + "s")
-    audit = getattr(meta, "audit", False)
-    soft_delete = getattr(meta, "soft_delete", False)
-    display_field = getattr(meta, "display_field", None)
-    search_fields = getattr(meta, "search_fields", [])
-    connected_system = getattr(meta, "connected_system", None)
-    permissions = getattr(meta, "permissions", {})
-    on_create = getattr(meta, "on_create", [])
-    on_update = getattr(meta, "on_update", [])
-    on_delete = getattr(meta, "on_delete", [])
-    row_security_rule = getattr(meta, "row_security_rule", None)
+    table_name = meta["table_name"] if "table_name" in meta else to_snake(class_name) + "s"
+    audit = meta.get("audit", False)
+    soft_delete = meta.get("soft_delete", False)
+    display_field = meta.get("display_field")
+    search_fields = meta.get("search_fields", [])
+    connected_system = meta.get("connected_system")
+    permissions = meta.get("permissions", {})
+    on_create = meta.get("on_create", [])
+    on_update = meta.get("on_update", [])
+    on_delete = meta.get("on_delete", [])
+    row_security_rule = meta.get("row_security_rule")
 
     fields: List[ParsedField] = []
     relationships: List[ParsedRelationship] = []
+    search_set: FrozenSet[str] = frozenset(search_fields)
 
     # Get Pydantic model fields
-    model_fields = record_class.model_fields if hasattr(record_class, "model_fields") else {}
+    model_fields: Dict[str, FieldInfo] = (
+        record_class.model_fields if hasattr(record_class, "model_fields") else {}
+    )
 
+    field_name: str
+    field_info: FieldInfo
     for field_name, field_info in model_fields.items():
+        field_default: Any = field_info.default
+
         # Check if it's a relationship
         if _is_relationship(field_info):
-            rel_data = field_info.default
+            rel_data: Dict[str, Any] = field_default
             relationships.append(ParsedRelationship(
                 name=field_name,
                 rel_type=rel_data["_relationship"],
@@ -288,28 +323,20 @@ def parse_record(record_class: type, app_name: str = "") -> ParsedRecord:
             continue
 
         # Regular field
-        annotation = field_info.annotation or str
-        type_name = _get_field_type_name(annotation)
-        nullable = _is_optional(annotation)
-
-        # Extract constraints
-        max_length = _get_max_length(field_info)
-        decimal_places = _get_decimal_places(field_info)
-        choices = _get_choices(field_info)
-        ge = _get_ge(field_info)
-        le = _get_le(field_info)
-        description = field_info.description or ""
+        annotation: Any = field_info.annotation or str
+        type_name: str = _get_field_type_name(annotation)
+        nullable: bool = _is_optional(annotation)
 
-        # Default value
-        has_default = field_info.default is not None and not isinstance(field_info.default, type)
-        default = field_info.default if has_default else None
+        # Extract constraints (incl. unique via json_schema_extra)
+        max_length, decimal_places, choices, ge, le, unique = _extract_constraints(field_info)
+        description: str = field_info.description or ""
 
-        # Check for unique (via json_schema_extra or if field name is 'email')
-        extra = getattr(field_info, "json_schema_extra", None) or {}
-        unique = extra.get("unique", False) if isinstance(extra, dict) else False
+        # Default value
+        has_default: bool = field_default is not None and not isinstance(field_default, type)
+        default: Any = field_default if has_default else None
 
         # Index search fields
-        index = field_name in search_fields
+        index: bool = field_name in search_set
 
         fields.append(ParsedField(
             name=field_name,
@@ -350,16 +377,26 @@ def parse_record(record_class: type, app_name: str = "") -> ParsedRecord:
 # SQLAlchemy Model Code Generator
 # ---------------------------------------------------------------------------
 
-def generate_model_code(parsed: ParsedRecord) -> str:
+# sqlalchemy names every generated model imports (Column + the Integer PK)
+_IMPORTS_SEED: FrozenSet[str] = frozenset({"Column", "Integer"})
+
+
+def generate_model_code(parsed: ParsedRecord, out: Optional[io.StringIO] = None) -> str:
     """
     Generate SQLAlchemy model Python code from a ParsedRecord.
 
+    Args:
+        parsed: The parsed record.
+        out: Optional buffer to stream the source into instead of
+            materializing and returning it.
+
     Returns:
-        Python source code string for the generated model file.
+        Python source code string for the generated model file
+        ("" when written to ``out``).
     """
     model_name = f"{parsed.class_name}Model"
-    imports: Set[str] = {"Column", "Integer"}
-    sa_extras: Set[str] = set()
+    field_names = {f.name for f in parsed.fields}
+    imports: Set[str] = set(_IMPORTS_SEED)
     base_classes = ["Base", "AuditMixin"]
     if parsed.soft_delete:
         base_classes.append("SoftDeleteMixin")
@@ -369,11 +406,56 @@ def generate_model_code(parsed: ParsedRecord) -> str:
     # Primary key
     lines.append(f"    id = Column(Integer, primary_key=True, autoincrement=True)")
 
-    # Fields
+    # Fields — one pass emits the column plus its check constraints and index
+    table_name = parsed.table_name
+    check_lines: List[str] = []
+    index_lines: List[str] = []
     for f in parsed.fields:
+        name = f.name
         col_parts, field_imports = _build_column(f)
         imports.update(field_imports)
-        lines.append(f"    {f.name} = {col_parts}")
+        lines.append(f"    {name} = {col_parts}")
+
+        if f.choices:
+            choice_str = ", ".join(f"'{c}'" for c in f.choices)
+            imports.add("CheckConstraint")
+            check_lines.append(
+                f'        CheckConstraint("{name} IN ({choice_str})", name="ck_{table_name}_{name}"),'
+            )
+        if f.ge is not None:
+            imports.add("CheckConstraint")
+            check_lines.append(
+                f'        CheckConstraint("{name} >= {f.ge}", name="ck_{table_name}_{name}_ge"),'
+            )
+        if f.le is not None:
+            imports.add("CheckConstraint")
+            check_lines.append(
+                f'        CheckConstraint("{name} <= {f.le}", name="ck_{table_name}_{name}_le"),'
+            )
+        if f.index and not f.unique:
+            imports.add("Index")
+            if parsed.soft_delete:
+                # Service reads always filter is_deleted = false; index live rows only
+                imports.add("text")
+                index_lines.append(
+                    f'        Index("idx_{table_name}_{name}_active", "{name}", '
+                    f'postgresql_where=text("is_deleted = false")),'
+                )
+            else:
+                index_lines.append(
+                    f'        Index("idx_{table_name}_{name}", "{name}"),'
+                )
+        if f.index and f.python_type == "str":
+            # Trigram GIN index serves search()'s ILIKE '%q%' (needs pg_trgm)
+            imports.add("Index")
+            live_only = ""
+            if parsed.soft_delete:
+                imports.add("text")
+                live_only = ', postgresql_where=text("is_deleted = false")'
+            index_lines.append(
+                f'        Index("idx_{table_name}_{name}_trgm", "{name}", postgresql_using="gin", '
+                f'postgresql_ops={{"{name}": "gin_trgm_ops"}}{live_only}),'
+            )
 
     # Relationships
     rel_lines: List[str] = []
@@ -389,7 +471,6 @@ def generate_model_code(parsed: ParsedRecord) -> str:
             fk_col = f"{r.name}_id" if not r.name.endswith("_id") else r.name
             nullable = "False" if r.required else "True"
             # FK column (only if not already in fields)
-            field_names = {f.name for f in parsed.fields}
             if fk_col not in field_names:
                 target_table = to_snake(r.target) + "s"
                 lines.append(
@@ -402,145 +483,133 @@ def generate_model_code(parsed: ParsedRecord) -> str:
             back_pop = f', back_populates="{r.back_ref}"' if r.back_ref else ""
             rel_lines.append(f'    {r.name} = relationship("{target_model}", uselist=False{back_pop})')
 
-    # Check constraints
-    check_lines: List[str] = []
-    for f in parsed.fields:
-        if f.choices:
-            choice_str = ", ".join(f"'{c}'" for c in f.choices)
-            imports.add("CheckConstraint")
-            check_lines.append(
-                f'        CheckConstraint("{f.name} IN ({choice_str})", name="ck_{parsed.table_name}_{f.name}"),'
-            )
-        if f.ge is not None:
-            imports.add("CheckConstraint")
-            check_lines.append(
-                f'        CheckConstraint("{f.name} >= {f.ge}", name="ck_{parsed.table_name}_{f.name}_ge"),'
-            )
-        if f.le is not None:
-            imports.add("CheckConstraint")
-            check_lines.append(
-                f'        CheckConstraint("{f.name} <= {f.le}", name="ck_{parsed.table_name}_{f.name}_le"),'
-            )
-
-    # Index lines
-    index_lines: List[str] = []
-    for f in parsed.fields:
-        if f.index and not f.unique:
-            imports.add("Index")
-            index_lines.append(
-                f'        Index("idx_{parsed.table_name}_{f.name}", "{f.name}"),'
-            )
+    # Record-level indexes
     if parsed.soft_delete:
         imports.add("Index")
         index_lines.append(
-            f'        Index("idx_{parsed.table_name}_is_deleted", "is_deleted"),'
+            f'        Index("idx_{table_name}_is_deleted", "is_deleted"),'
         )
     # is_active index
-    field_names = {f.name for f in parsed.fields}
     if "is_active" in field_names:
         imports.add("Index")
         index_lines.append(
-            f'        Index("idx_{parsed.table_name}_is_active", "is_active"),'
+            f'        Index("idx_{table_name}_is_active", "is_active"),'
         )
 
     # Assemble imports
-    sa_imports = sorted(imports - {"relationship"})
-    orm_imports = []
+    sa_imports = sorted(imp for imp in imports if imp != "relationship")
+
+    buf = io.StringIO() if out is None else out
+    w = buf.write
+    w(
+        '"""\n'
+        f"Auto-generated SQLAlchemy model for @record {parsed.class_name}.\n"
+        f"App: {parsed.app_name}\n"
+        f"Table: {parsed.table_name}\n"
+        "\n"
+        "DO NOT EDIT — regenerate with `appos generate`.\n"
+        '"""\n'
+        "\n"
+        "from datetime import datetime, timezone\n"
+        "\n"
+        f"from sqlalchemy import {', '.join(sa_imports)}\n"
+    )
     if "relationship" in imports:
-        orm_imports.append("relationship")
-
-    import_block = f"from sqlalchemy import {', '.join(sa_imports)}"
-    if orm_imports:
-        import_block += f"\nfrom sqlalchemy.orm import {', '.join(orm_imports)}"
+        w("from sqlalchemy.orm import relationship\n")
+    w(
+        "from appos.db.base import Base, AuditMixin, SoftDeleteMixin\n"
+        if parsed.soft_delete else "from appos.db.base import Base, AuditMixin\n"
+    )
 
     # Assemble class
-    bases = ", ".join(base_classes)
-    table_args_parts = check_lines + index_lines
-    table_args_block = ""
-    if table_args_parts:
-        table_args_block = "\n    __table_args__ = (\n" + "\n".join(table_args_parts) + "\n    )\n"
+    w(f"\n\nclass {model_name}({', '.join(base_classes)}):\n")
+    w(f'    __tablename__ = "{parsed.table_name}"\n\n')
+    buf.writelines(f"{line}\n" for line in lines)
 
-    rel_block = ""
     if rel_lines:
-        rel_block = "\n    # Relationships\n" + "\n".join(rel_lines) + "\n"
+        w("\n    # Relationships\n")
+        buf.writelines(f"{line}\n" for line in rel_lines)
 
-    code = f'''"""
-Auto-generated SQLAlchemy model for @record {parsed.class_name}.
-App: {parsed.app_name}
-Table: {parsed.table_name}
+    if check_lines or index_lines:
+        w("\n    __table_args__ = (\n")
+        buf.writelines(f"{line}\n" for line in check_lines)
+        buf.writelines(f"{line}\n" for line in index_lines)
+        w("    )\n")
 
-DO NOT EDIT — regenerate with `appos generate`.
-"""
+    w("\n    def __repr__(self) -> str:\n")
+    w(f'        return f"<{model_name}(id={{self.id}})"\n')
 
-from datetime import datetime, timezone
+    return buf.getvalue() if out is None else ""
 
-{import_block}
-from appos.db.base import Base, AuditMixin{"" if not parsed.soft_delete else ", SoftDeleteMixin"}
 
+# SQLAlchemy type → fixed column type expression (when it differs from the name)
+_COLUMN_TYPE_EXPR: Dict[str, str] = {"DateTime": "DateTime(timezone=True)"}
 
-class {model_name}({bases}):
-    __tablename__ = "{parsed.table_name}"
+# SQLAlchemy type → import names required by its column expression
+_TYPE_IMPORTS: Dict[str, FrozenSet[str]] = {
+    sa_type: frozenset({sa_type}) for sa_type in {*TYPE_MAPPING.values(), "String"}
+}
 
-{chr(10).join(lines)}
-{rel_block}{table_args_block}
-    def __repr__(self) -> str:
-        return f"<{model_name}(id={{self.id}})"
-'''
 
-    return code
+def _column_default(f: ParsedField) -> str:
+    """Render the ``, default=...`` suffix of a Column(...) expression."""
+    if not f.has_default:
+        return ""
+    default = f.default
+    if isinstance(default, (bool, int, float)):
+        return f", default={default}"
+    if isinstance(default, str):
+        return f', default="{default}"'
+    return ""
 
 
-def _build_column(f: ParsedField) -> Tuple[str, Set[str]]:
-    """Build a Column(...) expression for a ParsedField."""
-    imports: Set[str] = set()
-    parts: List[str] = []
+def _build_column(
+    f: ParsedField,
+    _type_map: Dict[str, str] = TYPE_MAPPING,
+    _type_expr: Dict[str, str] = _COLUMN_TYPE_EXPR,
+    _type_imports: Dict[str, FrozenSet[str]] = _TYPE_IMPORTS,
+) -> Tuple[str, FrozenSet[str]]:
+    """
+    Build a Column(...) expression for a ParsedField.
 
-    # Column type
-    sa_type = TYPE_MAPPING.get(f.python_type, "String")
-    imports.add(sa_type)
+    The lookup tables are bound as defaults so the per-field hot path reads
+    them as locals; callers pass only ``f``.
+    """
+    sa_type = _type_map.get(f.python_type, "String")
 
+    # Column type
     if sa_type == "String" and f.max_length:
-        parts.append(f"String({f.max_length})")
+        type_expr = f"String({f.max_length})"
     elif sa_type == "Numeric" and f.decimal_places is not None:
-        parts.append(f"Numeric(10, {f.decimal_places})")
-    elif sa_type == "DateTime":
-        parts.append("DateTime(timezone=True)")
-    elif sa_type == "JSON":
-        parts.append("JSON")
+        type_expr = f"Numeric(10, {f.decimal_places})"
     else:
-        parts.append(sa_type)
-
-    # Nullable
-    if f.unique:
-        parts.append("unique=True")
-    parts.append(f"nullable={f.nullable}")
+        type_expr = _type_expr.get(sa_type, sa_type)
 
-    # Default
-    if f.has_default:
-        if isinstance(f.default, bool):
-            parts.append(f"default={f.default}")
-        elif isinstance(f.default, (int, float)):
-            parts.append(f"default={f.default}")
-        elif isinstance(f.default, str):
-            parts.append(f'default="{f.default}"')
-
-    col_expr = f"Column({', '.join(parts)})"
-    return col_expr, imports
+    unique = ", unique=True" if f.unique else ""
+    col_expr = f"Column({type_expr}{unique}, nullable={f.nullable}{_column_default(f)})"
+    return col_expr, _type_imports[sa_type]
 
 
 # ---------------------------------------------------------------------------
 # SQL DDL Generator
 # ---------------------------------------------------------------------------
 
-def generate_sql_ddl(parsed: ParsedRecord) -> str:
+def generate_sql_ddl(parsed: ParsedRecord, out: Optional[io.StringIO] = None) -> str:
     """
     Generate CREATE TABLE SQL for a ParsedRecord.
 
-    Returns PostgreSQL DDL including indexes and check constraints.
+    Returns PostgreSQL DDL including indexes and check constraints, or ""
+    when streamed into ``out``.
     """
-    lines: List[str] = []
-    lines.append(f"-- Auto-generated from @record {parsed.class_name}")
-    lines.append(f"CREATE TABLE IF NOT EXISTS {parsed.table_name} (")
+    field_names = {f.name for f in parsed.fields}
+    table_name = parsed.table_name
+    buf = io.StringIO() if out is None else out
+    w = buf.write
+    w(f"-- Auto-generated from @record {parsed.class_name}\n")
+    trgm_fields = [f.name for f in parsed.fields if f.index and f.python_type == "str"]
+    if trgm_fields:
+        w("CREATE EXTENSION IF NOT EXISTS pg_trgm;\n\n")
+    w(f"CREATE TABLE IF NOT EXISTS {table_name} (\n")
 
     # Primary key
     col_lines: List[str] = []
@@ -552,14 +621,14 @@ def generate_sql_ddl(parsed: ParsedRecord) -> str:
         nullable = "" if f.nullable else " NOT NULL"
         default = _sql_default(f)
         unique = " UNIQUE" if f.unique else ""
-        check = ""
+        col_parts = [f"    {f.name:<16}{sql_type}{nullable}{default}{unique}"]
         if f.choices:
             choice_str = ", ".join(f"'{c}'" for c in f.choices)
-            check = f"\n                    CHECK ({f.name} IN ({choice_str}))"
+            col_parts.append(f"                    CHECK ({f.name} IN ({choice_str}))")
         if f.ge is not None:
-            check += f"\n                    CHECK ({f.name} >= {f.ge})"
+            col_parts.append(f"                    CHECK ({f.name} >= {f.ge})")
 
-        col_lines.append(f"    {f.name:<16}{sql_type}{nullable}{default}{unique}{check}")
+        col_lines.append("\n".join(col_parts))
 
     # Audit columns (always)
     col_lines.append("    created_at      TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()")
@@ -573,71 +642,105 @@ def generate_sql_ddl(parsed: ParsedRecord) -> str:
         col_lines.append("    deleted_at      TIMESTAMP WITH TIME ZONE")
         col_lines.append("    deleted_by      INTEGER")
 
-    lines.append(",\n".join(col_lines))
-    lines.append(");")
-    lines.append("")
+    w(",\n".join(col_lines))
+    w("\n);\n")
 
-    # Indexes
+    # Indexes (each preceded by a newline; none leaves a trailing ");\n")
     for f in parsed.fields:
-        if f.index:
-            lines.append(
-                f"CREATE INDEX IF NOT EXISTS idx_{parsed.table_name}_{f.name} "
-                f"ON {parsed.table_name}({f.name});"
+        if not f.index:
+            continue
+        if parsed.soft_delete:
+            w(
+                f"\nCREATE INDEX IF NOT EXISTS idx_{table_name}_{f.name}_active "
+                f"ON {table_name}({f.name}) WHERE is_deleted = false;"
+                f"\nDROP INDEX IF EXISTS idx_{table_name}_{f.name};  "
+                f"-- superseded by idx_{table_name}_{f.name}_active"
+            )
+        else:
+            w(
+                f"\nCREATE INDEX IF NOT EXISTS idx_{table_name}_{f.name} "
+                f"ON {table_name}({f.name});"
             )
+    # Trigram GIN indexes let search()'s ILIKE '%q%' skip the sequential scan
+    live_only = " WHERE is_deleted = false" if parsed.soft_delete else ""
+    for name in trgm_fields:
+        w(
+            f"\nCREATE INDEX IF NOT EXISTS idx_{table_name}_{name}_trgm "
+            f"ON {table_name} USING gin ({name} gin_trgm_ops){live_only};"
+        )
     if parsed.soft_delete:
-        lines.append(
-            f"CREATE INDEX IF NOT EXISTS idx_{parsed.table_name}_is_deleted "
-            f"ON {parsed.table_name}(is_deleted);"
+        w(
+            f"\nCREATE INDEX IF NOT EXISTS idx_{table_name}_is_deleted "
+            f"ON {table_name}(is_deleted);"
         )
-    field_names = {f.name for f in parsed.fields}
     if "is_active" in field_names:
-        lines.append(
-            f"CREATE INDEX IF NOT EXISTS idx_{parsed.table_name}_is_active "
-            f"ON {parsed.table_name}(is_active);"
+        w(
+            f"\nCREATE INDEX IF NOT EXISTS idx_{table_name}_is_active "
+            f"ON {table_name}(is_active);"
         )
 
-    return "\n".join(lines)
+    return buf.getvalue() if out is None else ""
+
+
+def _build_sql_type_builders() -> Dict[str, Callable[[ParsedField], str]]:
+    """Python type name → PostgreSQL type builder, one callable per type."""
+    builders: Dict[str, Callable[[ParsedField], str]] = {
+        python_type: (lambda f, _sql=sql: _sql)
+        for python_type, sql in SQL_TYPE_MAPPING.items()
+    }
+    builders["str"] = lambda f: f"VARCHAR({f.max_length})" if f.max_length else "VARCHAR"
+    builders["float"] = (
+        lambda f: f"NUMERIC(10,{f.decimal_places})" if f.decimal_places is not None else "NUMERIC"
+    )
+    return builders
+
 
+_SQL_TYPE_BUILDERS: Dict[str, Callable[[ParsedField], str]] = _build_sql_type_builders()
 
-def _sql_type(f: ParsedField) -> str:
+# Default value type → DEFAULT clause builder (bool before int for subclass fallback)
+_SQL_DEFAULT_BUILDERS: Dict[type, Callable[[Any], str]] = {
+    bool: lambda d: f" DEFAULT {'TRUE' if d else 'FALSE'}",
+    int: lambda d: f" DEFAULT {d}",
+    float: lambda d: f" DEFAULT {d}",
+    str: lambda d: f" DEFAULT '{d}'",
+}
+
+
+def _sql_type(
+    f: ParsedField,
+    _builders: Dict[str, Callable[[ParsedField], str]] = _SQL_TYPE_BUILDERS,
+) -> str:
     """Map a ParsedField to a PostgreSQL type string."""
-    base = SQL_TYPE_MAPPING.get(f.python_type, "TEXT")
-    if f.python_type == "str" and f.max_length:
-        return f"VARCHAR({f.max_length})"
-    if f.python_type == "float" and f.decimal_places is not None:
-        return f"NUMERIC(10,{f.decimal_places})"
-    return base
+    builder = _builders.get(f.python_type)
+    return builder(f) if builder is not None else "TEXT"
 
 
-def _sql_default(f: ParsedField) -> str:
+def _sql_default(
+    f: ParsedField,
+    _builders: Dict[type, Callable[[Any], str]] = _SQL_DEFAULT_BUILDERS,
+) -> str:
     """Generate DEFAULT clause for SQL."""
     if not f.has_default:
         return ""
-    if isinstance(f.default, bool):
-        return f" DEFAULT {'TRUE' if f.default else 'FALSE'}"
-    if isinstance(f.default, (int, float)):
-        return f" DEFAULT {f.default}"
-    if isinstance(f.default, str):
-        return f" DEFAULT '{f.default}'"
-    return ""
+    default = f.default
+    builder = _builders.get(type(default))
+    if builder is None:
+        # Subclasses (IntEnum, str-based enums, ...) — match by isinstance
+        for base, base_builder in _builders.items():
+            if isinstance(default, base):
+                builder = base_builder
+                break
+        else:
+            return ""
+    return builder(default)
 
 
 # ---------------------------------------------------------------------------
 # Audit Log Table Generator
 # ---------------------------------------------------------------------------
 
-def generate_audit_table_sql(parsed: ParsedRecord) -> Optional[str]:
-    """
-    Generate the audit_log table DDL for records with Meta.audit = True.
-
-    Table name: {app}_{table}_audit_log
-    """
-    if not parsed.audit:
-        return None
-
-    table_name = f"{parsed.app_name}_{parsed.table_name}_audit_log"
-
-    return f"""-- Auto-generated audit log for @record {parsed.class_name}
+# Audit log DDL; formatted with table_name and class_name
+_AUDIT_TEMPLATE = """-- Auto-generated audit log for @record {class_name}
 CREATE TABLE IF NOT EXISTS {table_name} (
     id                  SERIAL PRIMARY KEY,
     record_id           INTEGER NOT NULL,
@@ -648,7 +751,9 @@ CREATE TABLE IF NOT EXISTS {table_name} (
     changed_by          INTEGER NOT NULL,
     changed_at          TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
     execution_id        VARCHAR(50),
-    process_instance_id VARCHAR(50)
+    process_instance_id VARCHAR(50),
+    prev_hash           BYTEA,
+    row_hash            BYTEA
 );
 
 CREATE INDEX IF NOT EXISTS idx_{table_name}_record ON {table_name}(record_id);
@@ -658,6 +763,21 @@ CREATE INDEX IF NOT EXISTS idx_{table_name}_user ON {table_name}(changed_by);
 CREATE INDEX IF NOT EXISTS idx_{table_name}_op ON {table_name}(operation);"""
 
 
+def generate_audit_table_sql(parsed: ParsedRecord) -> Optional[str]:
+    """
+    Generate the audit_log table DDL for records with Meta.audit = True.
+
+    Table name: {app}_{table}_audit_log
+    """
+    if not parsed.audit:
+        return None
+
+    return _AUDIT_TEMPLATE.format(
+        table_name=f"{parsed.app_name}_{parsed.table_name}_audit_log",
+        class_name=parsed.class_name,
+    )
+
+
 # ---------------------------------------------------------------------------
 # File writer
 # ---------------------------------------------------------------------------
@@ -666,63 +786,206 @@ def generate_and_write(
     record_class: type,
     app_name: str,
     output_dir: Optional[str] = None,
+    force: bool = False,
 ) -> Dict[str, str]:
     """
     Full generation pipeline: parse → generate model + SQL → write files.
 
+    Skips generation when the outputs were last generated from the same
+    record source file and generator module (incremental build; see
+    _inputs_digest()).
+
     Args:
         record_class: The @record Pydantic class.
         app_name: App short name (e.g., "crm").
         output_dir: Base output directory. Defaults to .appos/generated/.
+        force: Regenerate even if outputs look up to date.
 
     Returns:
-        Dict of {filepath: content} that was written.
+        Dict of {filepath: content} that was written (or is current on disk).
     """
     if output_dir is None:
-        from appos.engine.config import get_project_root
         output_dir = str(get_project_root() / ".appos" / "generated")
 
     parsed = parse_record(record_class, app_name)
-    written: Dict[str, str] = {}
+    digest = _inputs_digest(record_class)
+    if not force:
+        current = _read_if_up_to_date(parsed, output_dir, digest)
+        if current is not None:
+            logger.debug(f"Generated model for {parsed.class_name} is up to date")
+            return current
+    return _generate_and_write_parsed(parsed, output_dir, digest)
+
+
+def _output_paths(parsed: ParsedRecord, output_dir: str) -> Tuple[str, str, Optional[str]]:
+    """Paths of (model .py, table .sql, audit .sql or None) for a record."""
+    audit_path = (
+        os.path.join(output_dir, "sql", f"{parsed.app_name}_{parsed.table_name}_audit_log.sql")
+        if parsed.audit else None
+    )
+    return (
+        os.path.join(output_dir, "models", f"{to_snake(parsed.class_name)}.py"),
+        os.path.join(output_dir, "sql", f"{parsed.table_name}.sql"),
+        audit_path,
+    )
+
+
+@lru_cache(maxsize=1)
+def _generator_digest() -> bytes:
+    """sha256 of this generator module's source (fixed for the process)."""
+    with open(__file__, "rb") as f:
+        return hashlib.sha256(f.read()).digest()
+
+
+def _inputs_digest(record_class: type) -> Optional[str]:
+    """
+    Digest of a record's generation inputs: its source file and this
+    generator module. None if the source file can't be read, in which
+    case the record is always regenerated.
+    """
+    try:
+        with open(inspect.getfile(record_class), "rb") as f:
+            source = f.read()
+    except (TypeError, OSError):
+        return None
+    return hashlib.sha256(_generator_digest() + source).hexdigest()
+
 
-    # Model code
-    model_code = generate_model_code(parsed)
-    model_path = os.path.join(output_dir, "models", f"{to_snake(parsed.class_name)}.py")
-    _write_file(model_path, model_code)
-    written[model_path] = model_code
+def _stamp_path(parsed: ParsedRecord, output_dir: str) -> str:
+    """Sidecar file holding the inputs digest a record's outputs were generated from."""
+    return os.path.join(output_dir, ".stamps", f"{parsed.app_name}_{parsed.table_name}.sha256")
+
+
+def _read_if_up_to_date(
+    parsed: ParsedRecord,
+    output_dir: str,
+    digest: Optional[str],
+) -> Optional[Dict[str, str]]:
+    """
+    Return the existing outputs if they were generated from inputs with
+    this digest, else None.
+
+    Compares the stamp written by _generate_and_write_parsed() rather than
+    mtimes, so unchanged outputs never need touching to stay current.
+    """
+    if digest is None:
+        return None
+    try:
+        with open(_stamp_path(parsed, output_dir), encoding="utf-8") as f:
+            if f.read() != digest:
+                return None
+    except OSError:
+        return None
+
+    current: Dict[str, str] = {}
+    for path in _output_paths(parsed, output_dir):
+        if path is None:
+            continue
+        try:
+            with open(path, encoding="utf-8") as f:
+                current[path] = f.read()
+        except OSError:
+            return None
+    return current
+
+
+def _generate_and_write_parsed(
+    parsed: ParsedRecord,
+    output_dir: str,
+    digest: Optional[str] = None,
+) -> Dict[str, str]:
+    """
+    Generate and write all files for an already-parsed record.
 
-    # SQL DDL
-    sql_ddl = generate_sql_ddl(parsed)
-    sql_path = os.path.join(output_dir, "sql", f"{parsed.table_name}.sql")
-    _write_file(sql_path, sql_ddl)
-    written[sql_path] = sql_ddl
+    Pure function of (parsed, output_dir) writing disjoint paths per record,
+    so generate_all_for_app() can run it in worker processes. The inputs
+    digest, if given, is stamped after the outputs are written.
+    """
+    model_path, sql_path, audit_path = _output_paths(parsed, output_dir)
 
-    # Audit log SQL (if enabled)
+    # Generate all outputs first: model code, SQL DDL, audit log SQL (if enabled)
+    outputs: Dict[str, str] = {
+        model_path: generate_model_code(parsed),
+        sql_path: generate_sql_ddl(parsed),
+    }
     audit_sql = generate_audit_table_sql(parsed)
-    if audit_sql:
-        audit_path = os.path.join(output_dir, "sql", f"{parsed.app_name}_{parsed.table_name}_audit_log.sql")
-        _write_file(audit_path, audit_sql)
-        written[audit_path] = audit_sql
+    if audit_sql and audit_path:
+        outputs[audit_path] = audit_sql
+
+    # Then write them in one pass, skipping files that are already up to date
+    unchanged = 0
+    for path, content in outputs.items():
+        if not _write_file(path, content):
+            unchanged += 1
+    if digest is not None:
+        _write_file(_stamp_path(parsed, output_dir), digest)
 
     logger.info(
         f"Generated model for {parsed.class_name}: "
         f"{len(parsed.fields)} fields, {len(parsed.relationships)} relationships"
+        + (f" ({unchanged} file(s) unchanged)" if unchanged else "")
     )
-    return written
+    return outputs
+
+
+# Directories already ensured by _write_file during this process
+_MKDIR_CACHE: Set[str] = set()
+
+# Raw fd flags for _write_file (O_BINARY only exists on Windows)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
 
 
-def _write_file(path: str, content: str) -> None:
-    """Write content to a file, creating directories as needed."""
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
+def _write_file(path: str, content: str) -> bool:
+    """
+    Write content to a file, creating directories as needed.
+
+    Skips the write when the file already holds identical content, so
+    regenerating unchanged records doesn't touch mtimes.
+
+    Returns:
+        True if the file was written, False if it was already up to date.
+    """
+    data = content.encode("utf-8")
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+
+    directory = os.path.dirname(path)
+    if directory not in _MKDIR_CACHE:
+        os.makedirs(directory, exist_ok=True)
+        _MKDIR_CACHE.add(directory)
+    try:
+        fd = os.open(path, _WRITE_FLAGS, 0o644)
+    except FileNotFoundError:
+        # Directory removed since it was cached — recreate and retry
+        os.makedirs(directory, exist_ok=True)
+        fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return True
 
 
 # ---------------------------------------------------------------------------
 # Batch generation utility
 # ---------------------------------------------------------------------------
 
-def generate_all_for_app(app_name: str, output_dir: Optional[str] = None) -> Dict[str, str]:
+# Process pools only pay off once there is enough codegen to amortize startup
+_PROCESS_POOL_MIN_RECORDS = 8
+
+
+def generate_all_for_app(
+    app_name: str,
+    output_dir: Optional[str] = None,
+    parallel: bool = True,
+    force: bool = False,
+) -> Dict[str, str]:
     """
     Generate SQLAlchemy models for ALL @record objects in an app.
 
@@ -732,20 +995,58 @@ def generate_all_for_app(app_name: str, output_dir: Optional[str] = None) -> Dic
     Args:
         app_name: App short name (e.g., "crm").
         output_dir: Base output directory.
+        parallel: Fan code generation out to a process pool when the app
+            has at least _PROCESS_POOL_MIN_RECORDS records.
+        force: Regenerate records whose outputs look up to date.
 
     Returns:
         Dict of all {filepath: content} written.
     """
-    from appos.engine.registry import object_registry
+    if output_dir is None:
+        output_dir = str(get_project_root() / ".appos" / "generated")
 
-    all_written: Dict[str, str] = {}
     records = object_registry.get_by_type("record", app_name=app_name)
 
-    for reg_obj in records:
-        handler = reg_obj.handler
-        if handler and isinstance(handler, type) and issubclass(handler, BaseModel):
-            written = generate_and_write(handler, app_name, output_dir)
-            all_written.update(written)
+    # Parse in-process (record classes aren't necessarily importable from a
+    # worker); the resulting ParsedRecords are plain picklable data.
+    all_written: Dict[str, str] = {}
+    parsed_records: List[Tuple[ParsedRecord, Optional[str]]] = []
+    for r in records:
+        handler = r.handler
+        if not (handler and isinstance(handler, type) and issubclass(handler, BaseModel)):
+            continue
+        parsed = parse_record(handler, app_name)
+        digest = _inputs_digest(handler)
+        current = None if force else _read_if_up_to_date(parsed, output_dir, digest)
+        if current is not None:
+            all_written.update(current)
+        else:
+            parsed_records.append((parsed, digest))
+
+    if parallel and len(parsed_records) >= _PROCESS_POOL_MIN_RECORDS:
+        try:
+            # Check up front: an unpicklable value (local class, lambda, lock)
+            # raises AttributeError/TypeError rather than PicklingError
+            for item in parsed_records:
+                pickle.dumps(item)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            logger.warning(f"Records can't be sent to worker processes ({e}); generating serially")
+        else:
+            try:
+                workers = min(os.cpu_count() or 1, len(parsed_records))
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = [
+                        pool.submit(_generate_and_write_parsed, parsed, output_dir, digest)
+                        for parsed, digest in parsed_records
+                    ]
+                    for fut in as_completed(futures):
+                        all_written.update(fut.result())
+                parsed_records = []
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning(f"Parallel model generation unavailable ({e}); falling back to serial")
+
+    for parsed, digest in parsed_records:
+        all_written.update(_generate_and_write_parsed(parsed, output_dir, digest))
 
     logger.info(f"Generated {len(records)} record models for app '{app_name}'")
     return all_written
@@ -4,12 +4,14 @@ audit logging, soft delete, event hooks, and security checks.
 
 Provides:
     - RecordService: Base class for all generated CRUD services
+    - AsyncRecordService: AsyncSession variant (generated with async_mode=True)
     - ServiceGenerator: Generates per-record service files
     - Audit log integration (field-level change tracking)
 
 Generated service methods:
     - create(data) → instance
     - get(id) → instance
+    - get_many(ids) → {id: instance}
     - get_by(field, value) → instance
     - update(id, data) → instance
     - delete(id) → bool
@@ -22,20 +24,298 @@ Design refs: AppOS_Design.md §9 (Generated CRUD Service), §5.7 (Record)
 
 from __future__ import annotations
 
+import atexit
+import concurrent.futures
+import contextvars
+import functools
+import hashlib
+import io
+import json
 import logging
+import queue
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
 
 from appos.utilities.utils import to_snake
 import os
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple, Type
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple, Type
 
-from sqlalchemy import and_, func, or_
+from sqlalchemy import Integer, and_, bindparam, func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from appos.db.base import Base
+from appos.engine.context import get_execution_context
 
 logger = logging.getLogger("appos.generators.service_generator")
 
+# Max prebuilt statements kept per service class before the cache is reset
+_STMT_CACHE_MAX = 256
+
+# Max IDs per IN (...) in get_many(), well under PostgreSQL's bind limit
+_IN_CHUNK_SIZE = 1000
+
+# Audit row values covered by row_hash, in hashing order
+_AUDIT_HASH_FIELDS = (
+    "record_id", "field_name", "old_value", "new_value",
+    "operation", "changed_by", "execution_id", "changed_at",
+)
+
+# Event hooks run here, off the create/update/delete call path
+_HOOK_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="appos-hooks",
+)
+
+# DELETE snapshots are serialized with orjson when installed
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:  # pragma: no cover - optional speedup
+    _json_dumps = json.dumps
+
+
+# ---------------------------------------------------------------------------
+# Audit hash chain — shared by inline writes and the AuditShipper
+# ---------------------------------------------------------------------------
+
+def _audit_row_hash(prev_hash: Optional[bytes], row: Dict[str, Any]) -> bytes:
+    """
+    sha256(prev_hash + canonical JSON of the row's audited values).
+
+    Always stdlib json with fixed separators (never orjson), so a verifier
+    recomputes the same bytes whatever the writer had installed. Timestamps
+    hash as UTC ISO-8601 with microseconds, whatever zone the DB returns.
+    """
+    payload = json.dumps(
+        [_audit_hash_value(row[k]) for k in _AUDIT_HASH_FIELDS],
+        separators=(",", ":"), sort_keys=True, default=str,
+    )
+    return hashlib.sha256((prev_hash or b"") + payload.encode()).digest()
+
+
+def _audit_hash_value(value: Any) -> Any:
+    """Canonical form of one audited value for hashing (naive datetimes are UTC)."""
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc).isoformat(timespec="microseconds")
+    return value
+
+
+def _chain_audit_rows(rows: List[Dict[str, Any]], prev_hash: Optional[bytes]) -> None:
+    """Link one record's audit rows into its hash chain, in place."""
+    for row in rows:
+        row["prev_hash"] = prev_hash
+        prev_hash = row["row_hash"] = _audit_row_hash(prev_hash, row)
+
+
+@functools.lru_cache(maxsize=256)
+def _chain_head_stmts(table: Any) -> Tuple[Any, Any]:
+    """
+    (lock, head) statements for the audit chains of ``table``.
+
+    lock: per-record transaction-scoped advisory lock (PostgreSQL only), which
+    also covers a record whose chain has no rows yet.
+    head: newest row_hash of one record, SELECT ... FOR UPDATE.
+    """
+    record_id = bindparam("record_id", type_=Integer)
+    lock = select(func.pg_advisory_xact_lock(func.hashtext(table.name), record_id))
+    head = (
+        select(table.c.row_hash)
+        .where(table.c.record_id == record_id)
+        .order_by(table.c.id.desc())
+        .limit(1)
+        .with_for_update()
+    )
+    return lock, head
+
+
+def _audit_chain_head(conn: Any, table: Any, record_id: int) -> Optional[bytes]:
+    """
+    Newest row_hash of a record's chain, locked until ``conn``'s transaction
+    ends so concurrent writers of the same record cannot fork the chain.
+    ``conn`` is a Session or a Connection.
+    """
+    lock, head = _chain_head_stmts(table)
+    params = {"record_id": record_id}
+    dialect = conn.get_bind().dialect if isinstance(conn, Session) else conn.dialect
+    if dialect.name == "postgresql":
+        conn.execute(lock, params)
+    return conn.execute(head, params).scalar()
+
+
+# ---------------------------------------------------------------------------
+# Audit Shipper — batched, out-of-transaction audit writes
+# ---------------------------------------------------------------------------
+
+class AuditShipper:
+    """
+    Background writer for audit rows (RecordService.audit_mode = "async_copy").
+
+    Rows are queued in-process and a daemon thread writes them in batches of
+    up to ``batch_size`` or every ``flush_interval`` seconds. On PostgreSQL a
+    batch is one ``COPY ... FROM STDIN WITH CSV``; other dialects get one
+    executemany INSERT. Audit rows are no longer part of the record's
+    transaction: a rollback does not retract them and a crash can lose the
+    rows still queued.
+
+    Usage:
+        shipper = AuditShipper(engine_registry.get("appos_audit"))
+        CustomerService.audit_mode = "async_copy"
+        CustomerService.audit_shipper = shipper
+    """
+
+    def __init__(self, engine: Any, batch_size: int = 500, flush_interval: float = 0.2):
+        """
+        Args:
+            engine: SQLAlchemy engine for the audit database/schema.
+            batch_size: Max rows per COPY/INSERT.
+            flush_interval: Max seconds a queued row waits before being written.
+        """
+        self._engine = engine
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def enqueue(self, table: Any, rows: List[Dict[str, Any]]) -> None:
+        """Queue audit rows for ``table`` (a SQLAlchemy Table); never blocks."""
+        if self._thread is None:
+            self._start()
+        put = self._queue.put
+        for row in rows:
+            put((table, row))
+
+    def close(self) -> None:
+        """Write everything still queued and stop the worker thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="appos-audit-shipper", daemon=True,
+                )
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _run(self) -> None:
+        q = self._queue
+        while True:
+            item = q.get()  # idle until a row (or close()) arrives
+            batch = []
+            stop = item is None
+            if not stop:
+                batch.append(item)
+                # Keep collecting until the batch is full or its first row
+                # has waited flush_interval — one transaction per batch
+                deadline = time.monotonic() + self._flush_interval
+                while len(batch) < self._batch_size:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = q.get(timeout=timeout)
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        stop = True
+                        break
+                    batch.append(item)
+            if batch:
+                self._write(batch)
+            if stop:
+                # close() sentinel: write whatever raced in behind it
+                remaining = []
+                while True:
+                    try:
+                        item = q.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not None:
+                        remaining.append(item)
+                if remaining:
+                    self._write(remaining)
+                return
+
+    def _write(self, batch: List[Tuple[Any, Dict[str, Any]]]) -> None:
+        """Write one batch, grouped by table. Failures are logged, not raised."""
+        by_table: Dict[Any, List[Dict[str, Any]]] = {}
+        for table, row in batch:
+            by_table.setdefault(table, []).append(row)
+        for table, rows in by_table.items():
+            try:
+                with self._engine.begin() as conn:
+                    if "row_hash" in table.c:
+                        self._chain(conn, table, rows)
+                    if conn.dialect.name == "postgresql":
+                        self._copy(conn, table, rows)
+                    else:
+                        conn.execute(insert(table), rows)
+            except Exception:
+                logger.exception(f"Audit shipper dropped {len(rows)} row(s) for {table.name}")
+
+    @staticmethod
+    def _chain(conn: Any, table: Any, rows: List[Dict[str, Any]]) -> None:
+        """
+        Hash-chain queued rows in queue order, inside the write transaction.
+
+        Chains are computed here rather than by the service: rows still queued
+        are invisible to a SELECT, and the audit table may live in another
+        database. Record heads are locked in ID order to avoid deadlocks.
+        """
+        heads = {
+            record_id: _audit_chain_head(conn, table, record_id)
+            for record_id in sorted({row["record_id"] for row in rows})
+        }
+        for row in rows:
+            record_id = row["record_id"]
+            row["prev_hash"] = heads[record_id]
+            heads[record_id] = row["row_hash"] = _audit_row_hash(heads[record_id], row)
+
+    @staticmethod
+    def _copy(conn: Any, table: Any, rows: List[Dict[str, Any]]) -> None:
+        """COPY rows into ``table`` through the psycopg cursor of ``conn``."""
+        columns = list(rows[0].keys())
+        target = f'"{table.schema}"."{table.name}"' if table.schema else f'"{table.name}"'
+        sql = f"COPY {target} ({', '.join(columns)}) FROM STDIN WITH CSV"
+
+        buf = io.StringIO()
+        for row in rows:
+            buf.write(",".join(_csv_field(row[c]) for c in columns))
+            buf.write("\n")
+        buf.seek(0)
+
+        cursor = conn.connection.cursor()
+        try:
+            cursor.copy_expert(sql, buf)
+        finally:
+            cursor.close()
+
+
+def _id_chunks(record_ids: List[int]) -> List[List[int]]:
+    """Split de-duplicated IDs into IN-list chunks of at most _IN_CHUNK_SIZE."""
+    ids = list(dict.fromkeys(record_ids))
+    return [ids[i:i + _IN_CHUNK_SIZE] for i in range(0, len(ids), _IN_CHUNK_SIZE)]
+
+
+def _csv_field(value: Any) -> str:
+    """CSV field for COPY: unquoted empty is NULL, everything else quoted."""
+    if value is None:
+        return ""
+    if isinstance(value, bytes):
+        return "\\x" + value.hex()  # bytea hex input format
+    return '"' + str(value).replace('"', '""') + '"'
+
 
 # ---------------------------------------------------------------------------
 # Base Record Service
@@ -67,6 +347,47 @@ class RecordService:
     on_create_hooks: List[str] = []
     on_update_hooks: List[str] = []
     on_delete_hooks: List[str] = []
+    sync_hooks: bool = False           # True: dispatch inline instead of on _HOOK_EXECUTOR
+
+    # "inline": audit rows INSERTed in the record's transaction (default)
+    # "async_copy": audit rows handed to `audit_shipper` and written in batches
+    audit_mode: str = "inline"
+    audit_shipper: Optional[AuditShipper] = None
+
+    # Bookkeeping columns left out of CREATE audit rows
+    _AUDIT_EXCLUDE: frozenset = frozenset(
+        {"id", "created_at", "updated_at", "created_by", "updated_by"}
+    )
+
+    # Derived from `model` in __init_subclass__
+    _audit_columns: Tuple[Any, ...] = ()   # columns logged on CREATE
+    _all_columns: Tuple[Any, ...] = ()     # columns snapshotted on DELETE
+    _field_names: frozenset = frozenset()   # every column, diffed by update()
+    _column_names: frozenset = frozenset()  # writable by a direct UPDATE
+    _has_soft_delete_col: bool = False     # soft_delete_enabled and model has is_deleted
+    _has_created_at: bool = False
+    _has_updated_at: bool = False
+    _has_updated_by: bool = False
+    _has_deleted_by: bool = False
+    _stmt_cache: Dict[Tuple[Any, ...], Any] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._stmt_cache = {}
+        table = getattr(cls.model, "__table__", None)
+        if table is not None:
+            cls._all_columns = tuple(table.columns)
+            cls._field_names = frozenset(c.name for c in cls._all_columns)
+            cls._column_names = frozenset(c.name for c in cls._all_columns if not c.primary_key)
+            cls._audit_columns = tuple(
+                c for c in cls._all_columns if c.name not in cls._AUDIT_EXCLUDE
+            )
+        model = cls.model
+        cls._has_soft_delete_col = bool(cls.soft_delete_enabled) and hasattr(model, "is_deleted")
+        cls._has_created_at = hasattr(model, "created_at")
+        cls._has_updated_at = hasattr(model, "updated_at")
+        cls._has_updated_by = hasattr(model, "updated_by")
+        cls._has_deleted_by = hasattr(model, "deleted_by")
 
     def __init__(self, session_factory=None):
         """
@@ -83,6 +404,166 @@ class RecordService:
             )
         return self._session_factory()
 
+    @contextmanager
+    def _session_scope(self, session: Optional[Session]) -> Iterator[Tuple[Session, bool]]:
+        """
+        Yield (session, own_session) for a CRUD call.
+
+        A caller-supplied session is passed through untouched. Otherwise a new
+        one is opened, rolled back on error and always closed; committing stays
+        with the method so hooks fire after the commit.
+        """
+        if session is not None:
+            yield session, False
+            return
+        session = self._get_session()
+        try:
+            yield session, True
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def _cached_stmt(self, key: Tuple[Any, ...], build: Callable[[], Any]) -> Any:
+        """
+        Return the prebuilt select() for a query shape, building it on first use.
+
+        Statements take their values through bindparam()s, so one entry
+        serves every call with the same filter columns and ordering.
+        """
+        cache = self._stmt_cache
+        stmt = cache.get(key)
+        if stmt is None:
+            if len(cache) >= _STMT_CACHE_MAX:
+                cache.clear()
+            stmt = cache[key] = build()
+        return stmt
+
+    def _filter_spec(
+        self, filters: Optional[Dict[str, Any]],
+    ) -> Tuple[Tuple[Tuple[str, bool], ...], Dict[str, Any]]:
+        """
+        Split exact-match filters into a cacheable shape and bind values.
+
+        The shape is a sorted tuple of (column, is_null) for known columns;
+        None values compile to IS NULL and take no bind parameter.
+        """
+        if not filters:
+            return (), {}
+        spec: List[Tuple[str, bool]] = []
+        params: Dict[str, Any] = {}
+        for field_name, value in filters.items():
+            if getattr(self.model, field_name, None) is None:
+                continue
+            spec.append((field_name, value is None))
+            if value is not None:
+                params[f"f_{field_name}"] = value
+        spec.sort()
+        return tuple(spec), params
+
+    def _apply_filters(self, stmt: Any, spec: Tuple[Tuple[str, bool], ...]) -> Any:
+        """Add the soft-delete clause and bound filter clauses for a spec."""
+        if self._has_soft_delete_col:
+            stmt = stmt.where(self.model.is_deleted == False)
+        for field_name, is_null in spec:
+            column = getattr(self.model, field_name)
+            stmt = stmt.where(
+                column.is_(None) if is_null else column == bindparam(f"f_{field_name}")
+            )
+        return stmt
+
+    def _get_many_stmt(self) -> Any:
+        """Statement for get_many(); the expanding "ids" IN keeps one cache entry."""
+        return self._cached_stmt(
+            ("get_many", self._has_soft_delete_col),
+            lambda: self._apply_filters(
+                select(self.model).where(self.model.id.in_(bindparam("ids", expanding=True))), (),
+            ),
+        )
+
+    def _get_by_stmt(self, field: str, value: Any) -> Tuple[Any, Dict[str, Any]]:
+        """Statement and bind values for get_by()."""
+        column = getattr(self.model, field, None)
+        if column is None:
+            raise ValueError(f"Field '{field}' not found on {self.model.__name__}")
+
+        spec = ((field, value is None),)
+        stmt = self._cached_stmt(
+            ("get_by", spec, self._has_soft_delete_col),
+            lambda: self._apply_filters(select(self.model), spec).limit(1),
+        )
+        params = {} if value is None else {f"f_{field}": value}
+        return stmt, params
+
+    def _list_stmt(
+        self,
+        filters: Optional[Dict[str, Any]],
+        page: int,
+        page_size: int,
+        order_by: Optional[str],
+        descending: bool,
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Statement and bind values for list()."""
+        spec, params = self._filter_spec(filters)
+
+        # Ordering: a known column, none (unknown column), or created_at desc
+        order_col = getattr(self.model, order_by, None) if order_by else None
+        if order_col is None:
+            order_key = "" if order_by else None
+            descending = False
+        else:
+            order_key = order_by
+
+        def build() -> Any:
+            stmt = self._apply_filters(select(self.model), spec)
+            if order_col is not None:
+                stmt = stmt.order_by(order_col.desc() if descending else order_col.asc())
+            elif order_key is None and self._has_created_at:
+                stmt = stmt.order_by(self.model.created_at.desc())
+            return stmt.offset(bindparam("offset")).limit(bindparam("limit"))
+
+        stmt = self._cached_stmt(
+            ("list", spec, order_key, descending, self._has_soft_delete_col), build,
+        )
+
+        # Pagination
+        params["offset"] = (page - 1) * page_size
+        params["limit"] = page_size
+        return stmt, params
+
+    def _search_stmt(
+        self,
+        query_text: str,
+        search_fields: Optional[List[str]],
+        page: int,
+        page_size: int,
+    ) -> Any:
+        """Statement for search() (ILIKE across fields, OR-combined; served by the trigram indexes)."""
+        stmt = self._apply_filters(select(self.model), ())
+
+        # Build OR conditions for search
+        if search_fields and query_text:
+            conditions = []
+            for field_name in search_fields:
+                column = getattr(self.model, field_name, None)
+                if column is not None:
+                    conditions.append(column.ilike(f"%{query_text}%"))
+            if conditions:
+                stmt = stmt.where(or_(*conditions))
+
+        offset = (page - 1) * page_size
+        return stmt.offset(offset).limit(page_size)
+
+    def _count_stmt(self, filters: Optional[Dict[str, Any]]) -> Tuple[Any, Dict[str, Any]]:
+        """Statement and bind values for count()."""
+        spec, params = self._filter_spec(filters)
+        stmt = self._cached_stmt(
+            ("count", spec, self._has_soft_delete_col),
+            lambda: self._apply_filters(select(func.count(self.model.id)), spec),
+        )
+        return stmt, params
+
     # -------------------------------------------------------------------
     # CREATE
     # -------------------------------------------------------------------
@@ -104,19 +585,20 @@ class RecordService:
         Returns:
             The created model instance.
         """
-        own_session = session is None
-        if own_session:
-            session = self._get_session()
-
-        try:
+        with self._session_scope(session) as (session, own_session):
             # Set audit fields
             if user_id:
                 data["created_by"] = user_id
                 data["updated_by"] = user_id
 
-            instance = self.model(**data)
-            session.add(instance)
-            session.flush()  # Get ID before commit
+            if self._can_insert_returning(data):
+                # Nothing needs a pending instance: INSERT ... RETURNING in one round trip
+                result = session.execute(insert(self.model).returning(self.model), data)
+                instance = result.scalar_one()
+            else:
+                instance = self.model(**data)
+                session.add(instance)
+                session.flush()  # Get ID before commit
 
             # Audit log
             if self.audit_enabled:
@@ -131,34 +613,43 @@ class RecordService:
             logger.debug(f"Created {self.model.__name__} id={instance.id}")
             return instance
 
-        except Exception:
-            if own_session:
-                session.rollback()
-            raise
-        finally:
-            if own_session:
-                session.close()
-
     # -------------------------------------------------------------------
     # READ
     # -------------------------------------------------------------------
 
     def get(self, record_id: int, session: Optional[Session] = None) -> Optional[Any]:
         """Get a record by ID. Respects soft-delete."""
-        own_session = session is None
-        if own_session:
-            session = self._get_session()
+        with self._session_scope(session) as (session, _):
+            # Primary-key lookup: served from the identity map when loaded
+            instance = session.get(self.model, record_id)
+
+            if (
+                instance is not None
+                and self._has_soft_delete_col
+                and instance.is_deleted
+            ):
+                return None
 
-        try:
-            query = session.query(self.model).filter(self.model.id == record_id)
+            return instance
 
-            if self.soft_delete_enabled and hasattr(self.model, "is_deleted"):
-                query = query.filter(self.model.is_deleted == False)
+    def get_many(
+        self,
+        record_ids: List[int],
+        session: Optional[Session] = None,
+    ) -> Dict[int, Any]:
+        """
+        Get several records by ID in one query per chunk. Respects soft-delete.
 
-            return query.first()
-        finally:
-            if own_session:
-                session.close()
+        Returns:
+            {id: instance} for the IDs that exist; missing IDs are absent.
+        """
+        with self._session_scope(session) as (session, _):
+            stmt = self._get_many_stmt()
+            found: Dict[int, Any] = {}
+            for chunk in _id_chunks(record_ids):
+                for instance in session.execute(stmt, {"ids": chunk}).scalars():
+                    found[instance.id] = instance
+            return found
 
     def get_by(
         self,
@@ -167,24 +658,9 @@ class RecordService:
         session: Optional[Session] = None,
     ) -> Optional[Any]:
         """Get a record by a specific field value."""
-        own_session = session is None
-        if own_session:
-            session = self._get_session()
-
-        try:
-            column = getattr(self.model, field, None)
-            if column is None:
-                raise ValueError(f"Field '{field}' not found on {self.model.__name__}")
-
-            query = session.query(self.model).filter(column == value)
-
-            if self.soft_delete_enabled and hasattr(self.model, "is_deleted"):
-                query = query.filter(self.model.is_deleted == False)
-
-            return query.first()
-        finally:
-            if own_session:
-                session.close()
+        with self._session_scope(session) as (session, _):
+            stmt, params = self._get_by_stmt(field, value)
+            return session.execute(stmt, params).scalars().first()
 
     # -------------------------------------------------------------------
     # UPDATE
@@ -201,32 +677,24 @@ class RecordService:
         Update a record by ID.
 
         Only updates fields present in `data` (partial update).
-        Tracks field-level changes for audit log.
+        Tracks field-level changes for audit log. Without audit or update
+        hooks the old values are not needed, so the row is written with a
+        single UPDATE ... RETURNING instead of SELECT then UPDATE.
         """
-        own_session = session is None
-        if own_session:
-            session = self._get_session()
+        with self._session_scope(session) as (session, own_session):
+            stmt = self._direct_update_stmt(record_id, data, user_id)
+            if stmt is not None:
+                instance = session.execute(stmt).scalars().first()
+                if instance is not None and own_session:
+                    session.commit()
+                logger.debug(f"Updated {self.model.__name__} id={record_id} (direct): {list(data.keys())}")
+                return instance
 
-        try:
             instance = self.get(record_id, session=session)
             if not instance:
                 return None
 
-            # Track changes for audit
-            changes: Dict[str, Tuple[Any, Any]] = {}
-
-            for field_name, new_value in data.items():
-                if hasattr(instance, field_name):
-                    old_value = getattr(instance, field_name)
-                    if old_value != new_value:
-                        changes[field_name] = (old_value, new_value)
-                        setattr(instance, field_name, new_value)
-
-            # Update audit fields
-            if user_id and hasattr(instance, "updated_by"):
-                instance.updated_by = user_id
-            if hasattr(instance, "updated_at"):
-                instance.updated_at = datetime.now(timezone.utc)
+            changes = self._apply_changes(instance, data, user_id)
 
             # Audit log
             if self.audit_enabled and changes:
@@ -242,14 +710,6 @@ class RecordService:
             logger.debug(f"Updated {self.model.__name__} id={record_id}: {list(changes.keys())}")
             return instance
 
-        except Exception:
-            if own_session:
-                session.rollback()
-            raise
-        finally:
-            if own_session:
-                session.close()
-
     # -------------------------------------------------------------------
     # DELETE
     # -------------------------------------------------------------------
@@ -273,22 +733,12 @@ class RecordService:
         Returns:
             True if record was deleted/deactivated.
         """
-        own_session = session is None
-        if own_session:
-            session = self._get_session()
-
-        try:
-            instance = session.query(self.model).filter(self.model.id == record_id).first()
+        with self._session_scope(session) as (session, own_session):
+            instance = session.get(self.model, record_id)
             if not instance:
                 return False
 
-            if self.soft_delete_enabled and not hard and hasattr(instance, "is_deleted"):
-                # Soft delete
-                instance.is_deleted = True
-                instance.deleted_at = datetime.now(timezone.utc)
-                if user_id and hasattr(instance, "deleted_by"):
-                    instance.deleted_by = user_id
-            else:
+            if not self._soft_delete(instance, user_id, hard):
                 # Hard delete
                 session.delete(instance)
 
@@ -305,14 +755,6 @@ class RecordService:
             logger.debug(f"Deleted {self.model.__name__} id={record_id} (soft={self.soft_delete_enabled and not hard})")
             return True
 
-        except Exception:
-            if own_session:
-                session.rollback()
-            raise
-        finally:
-            if own_session:
-                session.close()
-
     # -------------------------------------------------------------------
     # LIST & SEARCH
     # -------------------------------------------------------------------
@@ -339,41 +781,9 @@ class RecordService:
         Returns:
             List of model instances.
         """
-        own_session = session is None
-        if own_session:
-            session = self._get_session()
-
-        try:
-            query = session.query(self.model)
-
-            # Soft delete filter
-            if self.soft_delete_enabled and hasattr(self.model, "is_deleted"):
-                query = query.filter(self.model.is_deleted == False)
-
-            # Apply filters
-            if filters:
-                for field_name, value in filters.items():
-                    column = getattr(self.model, field_name, None)
-                    if column is not None:
-                        query = query.filter(column == value)
-
-            # Ordering
-            if order_by:
-                col = getattr(self.model, order_by, None)
-                if col is not None:
-                    query = query.order_by(col.desc() if descending else col.asc())
-            elif hasattr(self.model, "created_at"):
-                query = query.order_by(self.model.created_at.desc())
-
-            # Pagination
-            offset = (page - 1) * page_size
-            query = query.offset(offset).limit(page_size)
-
-            return query.all()
-
-        finally:
-            if own_session:
-                session.close()
+        with self._session_scope(session) as (session, _):
+            stmt, params = self._list_stmt(filters, page, page_size, order_by, descending)
+            return session.execute(stmt, params).scalars().all()
 
     def search(
         self,
@@ -395,32 +805,9 @@ class RecordService:
         Returns:
             List of matching model instances.
         """
-        own_session = session is None
-        if own_session:
-            session = self._get_session()
-
-        try:
-            query = session.query(self.model)
-
-            if self.soft_delete_enabled and hasattr(self.model, "is_deleted"):
-                query = query.filter(self.model.is_deleted == False)
-
-            # Build OR conditions for search
-            if search_fields and query_text:
-                conditions = []
-                for field_name in search_fields:
-                    column = getattr(self.model, field_name, None)
-                    if column is not None:
-                        conditions.append(column.ilike(f"%{query_text}%"))
-                if conditions:
-                    query = query.filter(or_(*conditions))
-
-            offset = (page - 1) * page_size
-            return query.offset(offset).limit(page_size).all()
-
-        finally:
-            if own_session:
-                session.close()
+        with self._session_scope(session) as (session, _):
+            stmt = self._search_stmt(query_text, search_fields, page, page_size)
+            return session.execute(stmt).scalars().all()
 
     def count(
         self,
@@ -428,55 +815,97 @@ class RecordService:
         session: Optional[Session] = None,
     ) -> int:
         """Count records matching filters."""
-        own_session = session is None
-        if own_session:
-            session = self._get_session()
-
-        try:
-            query = session.query(func.count(self.model.id))
-
-            if self.soft_delete_enabled and hasattr(self.model, "is_deleted"):
-                query = query.filter(self.model.is_deleted == False)
-
-            if filters:
-                for field_name, value in filters.items():
-                    column = getattr(self.model, field_name, None)
-                    if column is not None:
-                        query = query.filter(column == value)
+        with self._session_scope(session) as (session, _):
+            stmt, params = self._count_stmt(filters)
+            return session.execute(stmt, params).scalar() or 0
+
+    def _can_insert_returning(self, data: Dict[str, Any]) -> bool:
+        """True when create() can skip the unit of work: no audit, no hooks, plain columns."""
+        return (
+            not self.audit_enabled
+            and not self.on_create_hooks
+            and data.keys() <= self._column_names
+        )
 
-            return query.scalar() or 0
+    def _apply_changes(
+        self,
+        instance: Any,
+        data: Dict[str, Any],
+        user_id: Optional[int],
+    ) -> Dict[str, Tuple[Any, Any]]:
+        """Apply a partial update in place; return {field: (old, new)} for audit."""
+        changes: Dict[str, Tuple[Any, Any]] = {}
+        field_names = self._field_names
+
+        # Membership test instead of hasattr(); keeps data order for audit rows
+        for field_name, new_value in data.items():
+            if field_name in field_names:
+                old_value = getattr(instance, field_name)
+                if old_value != new_value:
+                    changes[field_name] = (old_value, new_value)
+                    setattr(instance, field_name, new_value)
+
+        # Update audit fields
+        if user_id and self._has_updated_by:
+            instance.updated_by = user_id
+        if self._has_updated_at:
+            instance.updated_at = self._now()
+
+        return changes
+
+    def _direct_update_stmt(
+        self,
+        record_id: int,
+        data: Dict[str, Any],
+        user_id: Optional[int],
+    ) -> Optional[Any]:
+        """
+        UPDATE ... RETURNING for update() when no audit row or hook needs old values.
 
-        finally:
-            if own_session:
-                session.close()
+        Returns None when the change-tracking path is required.
+        """
+        if self.audit_enabled or self.on_update_hooks:
+            return None
+        values = {k: v for k, v in data.items() if k in self._column_names}
+        if not values:
+            return None
+        if user_id and self._has_updated_by:
+            values["updated_by"] = user_id
+        if self._has_updated_at:
+            values["updated_at"] = self._now()
+
+        stmt = update(self.model).where(self.model.id == record_id)
+        if self._has_soft_delete_col:
+            stmt = stmt.where(self.model.is_deleted == False)
+        return stmt.values(**values).returning(self.model)
+
+    def _soft_delete(self, instance: Any, user_id: Optional[int], hard: bool) -> bool:
+        """Flag `instance` as deleted if soft delete applies; False means hard delete."""
+        if hard or not self._has_soft_delete_col:
+            return False
+        instance.is_deleted = True
+        instance.deleted_at = self._now()
+        if user_id and self._has_deleted_by:
+            instance.deleted_by = user_id
+        return True
 
     # -------------------------------------------------------------------
     # Audit Logging
     # -------------------------------------------------------------------
 
     def _log_create(self, session: Session, instance: Any, user_id: Optional[int]) -> None:
-        """Log a CREATE operation to the audit table (one row per field)."""
-        if not self._get_audit_model():
-            return
-
+        """Log a CREATE operation to the audit table (one row per field, one INSERT)."""
         AuditModel = self._get_audit_model()
-        execution_id = self._get_execution_id()
-
-        for col in self.model.__table__.columns:
-            if col.name in ("id", "created_at", "updated_at", "created_by", "updated_by"):
-                continue
-            value = getattr(instance, col.name, None)
-            if value is not None:
-                audit_entry = AuditModel(
-                    record_id=instance.id,
-                    field_name=col.name,
-                    old_value=None,
-                    new_value=str(value),
-                    operation="create",
-                    changed_by=user_id or 0,
-                    execution_id=execution_id,
-                )
-                session.add(audit_entry)
+        if not AuditModel:
+            return
+        rows = self._create_audit_rows(instance, user_id)
+        if rows and not self._ship_audit(AuditModel, rows):
+            if self._is_chained(AuditModel):
+                _chain_audit_rows(rows, None)  # a new record starts its chain
+            # executemany: SQLAlchemy 2.0 renders this as multi-row
+            # INSERT ... VALUES (...), (...) pages ("insertmanyvalues"; on
+            # psycopg2 via execute_values), so wide records stay one round trip
+            session.execute(insert(AuditModel), rows)
 
     def _log_update(
         self,
@@ -485,61 +914,129 @@ class RecordService:
         changes: Dict[str, Tuple[Any, Any]],
         user_id: Optional[int],
     ) -> None:
-        """Log an UPDATE operation (one row per changed field)."""
-        if not self._get_audit_model():
-            return
-
+        """Log an UPDATE operation (one row per changed field, one INSERT)."""
         AuditModel = self._get_audit_model()
-        execution_id = self._get_execution_id()
-
-        for field_name, (old_val, new_val) in changes.items():
-            audit_entry = AuditModel(
-                record_id=instance.id,
-                field_name=field_name,
-                old_value=str(old_val) if old_val is not None else None,
-                new_value=str(new_val) if new_val is not None else None,
-                operation="update",
-                changed_by=user_id or 0,
-                execution_id=execution_id,
-            )
-            session.add(audit_entry)
+        if not AuditModel or not changes:
+            return
+        rows = self._update_audit_rows(instance, changes, user_id)
+        if not self._ship_audit(AuditModel, rows):
+            if self._is_chained(AuditModel):
+                _chain_audit_rows(rows, _audit_chain_head(
+                    session, AuditModel.__table__, instance.id,
+                ))
+            session.execute(insert(AuditModel), rows)
 
     def _log_delete(self, session: Session, instance: Any, user_id: Optional[int]) -> None:
         """Log a DELETE operation (single row with full record JSON)."""
-        if not self._get_audit_model():
+        AuditModel = self._get_audit_model()
+        if not AuditModel:
             return
+        row = self._delete_audit_row(instance, user_id)
+        if not self._ship_audit(AuditModel, [row]):
+            if self._is_chained(AuditModel):
+                _chain_audit_rows([row], _audit_chain_head(
+                    session, AuditModel.__table__, instance.id,
+                ))
+            session.execute(insert(AuditModel).values(**row))
 
-        import json
-        AuditModel = self._get_audit_model()
+    @staticmethod
+    def _is_chained(AuditModel: type) -> bool:
+        """True when the audit table carries prev_hash/row_hash columns."""
+        return "row_hash" in AuditModel.__table__.c
+
+    def _ship_audit(self, AuditModel: type, rows: List[Dict[str, Any]]) -> bool:
+        """
+        Hand rows to the audit shipper in "async_copy" mode; False means write
+        inline. Shipped rows are hash-chained by the shipper, in queue order.
+        """
+        if self.audit_mode != "async_copy" or self.audit_shipper is None:
+            return False
+        self.audit_shipper.enqueue(AuditModel.__table__, rows)
+        return True
+
+    def _create_audit_rows(self, instance: Any, user_id: Optional[int]) -> List[Dict[str, Any]]:
+        """Build CREATE audit rows for every non-null audited column."""
+        record_id = instance.id
+        changed_by = user_id or 0
         execution_id = self._get_execution_id()
+        changed_at = self._now()
 
+        rows = []
+        for col in self._audit_columns:
+            value = getattr(instance, col.name, None)
+            if value is not None:
+                rows.append({
+                    "record_id": record_id,
+                    "field_name": col.name,
+                    "old_value": None,
+                    "new_value": str(value),
+                    "operation": "create",
+                    "changed_by": changed_by,
+                    "execution_id": execution_id,
+                    "changed_at": changed_at,
+                })
+        return rows
+
+    def _update_audit_rows(
+        self,
+        instance: Any,
+        changes: Dict[str, Tuple[Any, Any]],
+        user_id: Optional[int],
+    ) -> List[Dict[str, Any]]:
+        """Build UPDATE audit rows, one per changed field."""
+        record_id = instance.id
+        changed_by = user_id or 0
+        execution_id = self._get_execution_id()
+        changed_at = self._now()
+
+        return [
+            {
+                "record_id": record_id,
+                "field_name": field_name,
+                "old_value": str(old_val) if old_val is not None else None,
+                "new_value": str(new_val) if new_val is not None else None,
+                "operation": "update",
+                "changed_by": changed_by,
+                "execution_id": execution_id,
+                "changed_at": changed_at,
+            }
+            for field_name, (old_val, new_val) in changes.items()
+        ]
+
+    def _delete_audit_row(self, instance: Any, user_id: Optional[int]) -> Dict[str, Any]:
+        """Build the DELETE audit row carrying a JSON snapshot of the record."""
         # Serialize full record
-        record_data = {}
-        for col in self.model.__table__.columns:
-            val = getattr(instance, col.name, None)
-            record_data[col.name] = str(val) if val is not None else None
-
-        audit_entry = AuditModel(
-            record_id=instance.id,
-            field_name="_record",
-            old_value=json.dumps(record_data),
-            new_value=None,
-            operation="delete",
-            changed_by=user_id or 0,
-            execution_id=execution_id,
-        )
-        session.add(audit_entry)
+        record_data = {
+            col.name: None if (val := getattr(instance, col.name, None)) is None else str(val)
+            for col in self._all_columns
+        }
+
+        return {
+            "record_id": instance.id,
+            "field_name": "_record",
+            "old_value": _json_dumps(record_data),
+            "new_value": None,
+            "operation": "delete",
+            "changed_by": user_id or 0,
+            "execution_id": self._get_execution_id(),
+            "changed_at": self._now(),
+        }
 
     def _get_audit_model(self) -> Optional[type]:
         """Get the audit log model class (lazy import from generated code)."""
         # This will be overridden by generated service subclasses
         return getattr(self, "_audit_model", None)
 
+    @staticmethod
+    def _now() -> datetime:
+        """Timestamp for audit fields: the execution context's clock, else wall time."""
+        ctx = get_execution_context()
+        return ctx.now if ctx else datetime.now(timezone.utc)
+
     @staticmethod
     def _get_execution_id() -> Optional[str]:
         """Get the current execution ID from context."""
         try:
-            from appos.engine.context import get_execution_context
             ctx = get_execution_context()
             return ctx.execution_id if ctx else None
         except Exception:
@@ -554,6 +1051,8 @@ class RecordService:
         Fire event hooks (on_create, on_update, on_delete).
 
         Each hook is an object_ref (rule or process) dispatched via engine.dispatch().
+        Hooks run on the shared hook executor so the write returns without
+        waiting for them; set ``sync_hooks = True`` to dispatch inline.
         """
         if not hooks:
             return
@@ -561,55 +1060,326 @@ class RecordService:
         try:
             from appos.engine.runtime import get_runtime
             runtime = get_runtime()
+            record_id = instance.id
             for hook_ref in hooks:
-                logger.debug(f"Firing hook: {hook_ref} for {self.model.__name__} id={instance.id}")
-                runtime.dispatch(hook_ref, inputs={"record_id": instance.id, **data})
+                logger.debug(f"Firing hook: {hook_ref} for {self.model.__name__} id={record_id}")
+                inputs = {"record_id": record_id, **data}
+                if self.sync_hooks:
+                    runtime.dispatch(hook_ref, inputs=inputs)
+                else:
+                    # Copy the context so the hook sees the caller's execution context
+                    ctx = contextvars.copy_context()
+                    future = _HOOK_EXECUTOR.submit(ctx.run, runtime.dispatch, hook_ref, inputs=inputs)
+                    future.add_done_callback(_log_hook_failure)
         except Exception as e:
             logger.warning(f"Hook dispatch failed: {e}")
 
 
+def _log_hook_failure(future: concurrent.futures.Future) -> None:
+    """Done-callback for background hooks: log instead of dropping the error."""
+    exc = future.exception()
+    if exc is not None:
+        logger.warning(f"Hook dispatch failed: {exc}")
+
+
 # ---------------------------------------------------------------------------
-# Service Generator — generates per-record service Python files
+# Async Record Service
 # ---------------------------------------------------------------------------
 
-def generate_service_code(
-    class_name: str,
-    app_name: str,
-    table_name: str,
-    audit: bool = False,
-    soft_delete: bool = False,
-    search_fields: Optional[List[str]] = None,
-    on_create: Optional[List[str]] = None,
-    on_update: Optional[List[str]] = None,
-    on_delete: Optional[List[str]] = None,
-) -> str:
+class AsyncRecordService(RecordService):
     """
-    Generate a RecordService subclass for a @record.
+    asyncio variant of RecordService backed by SQLAlchemy's AsyncSession.
 
-    Returns Python source code string.
+    Same statements, audit rows and hooks as the sync base; every DB
+    round-trip is awaited so concurrent CRUD overlaps I/O. The session
+    factory should be an ``async_sessionmaker`` on an async engine — see
+    EngineRegistry.register_async().
+
+    Usage:
+        class CustomerService(AsyncRecordService):
+            model = CustomerModel
+            app_name = "crm"
+
+        customer = await CustomerService(factory).get(42)
     """
-    model_name = f"{class_name}Model"
-    service_name = f"{class_name}Service"
-    model_import = f"from appos.generators.generated.models.{to_snake(class_name)} import {model_name}"
-
-    search_fields_str = repr(search_fields or [])
-    on_create_str = repr(on_create or [])
-    on_update_str = repr(on_update or [])
-    on_delete_str = repr(on_delete or [])
-
-    audit_model_block = ""
-    if audit:
-        audit_model_block = f"""
-    def _get_audit_model(self):
-        # Lazy import to avoid circular deps
+
+    @asynccontextmanager
+    async def _session_scope(
+        self, session: Optional[AsyncSession],
+    ) -> AsyncIterator[Tuple[AsyncSession, bool]]:
+        """Async counterpart of RecordService._session_scope()."""
+        if session is not None:
+            yield session, False
+            return
+        session = self._get_session()
         try:
-            from appos.generators.generated.models.{app_name}_{table_name}_audit_log import {class_name}AuditLogModel
-            return {class_name}AuditLogModel
-        except ImportError:
-            return None
-"""
+            yield session, True
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+    # -------------------------------------------------------------------
+    # CREATE
+    # -------------------------------------------------------------------
+
+    async def create(
+        self,
+        data: Dict[str, Any],
+        user_id: Optional[int] = None,
+        session: Optional[AsyncSession] = None,
+    ) -> Any:
+        """Create a new record. See RecordService.create()."""
+        async with self._session_scope(session) as (session, own_session):
+            # Set audit fields
+            if user_id:
+                data["created_by"] = user_id
+                data["updated_by"] = user_id
+
+            if self._can_insert_returning(data):
+                # Nothing needs a pending instance: INSERT ... RETURNING in one round trip
+                result = await session.execute(insert(self.model).returning(self.model), data)
+                instance = result.scalar_one()
+            else:
+                instance = self.model(**data)
+                session.add(instance)
+                await session.flush()  # Get ID before commit
+
+            # Audit log
+            if self.audit_enabled:
+                await self._log_create(session, instance, user_id)
+
+            if own_session:
+                await session.commit()
+
+            # Fire event hooks
+            self._fire_hooks(self.on_create_hooks, instance, data)
+
+            logger.debug(f"Created {self.model.__name__} id={instance.id}")
+            return instance
+
+    # -------------------------------------------------------------------
+    # READ
+    # -------------------------------------------------------------------
+
+    async def get(self, record_id: int, session: Optional[AsyncSession] = None) -> Optional[Any]:
+        """Get a record by ID. Respects soft-delete."""
+        async with self._session_scope(session) as (session, _):
+            instance = await session.get(self.model, record_id)
+
+            if (
+                instance is not None
+                and self._has_soft_delete_col
+                and instance.is_deleted
+            ):
+                return None
+
+            return instance
+
+    async def get_many(
+        self,
+        record_ids: List[int],
+        session: Optional[AsyncSession] = None,
+    ) -> Dict[int, Any]:
+        """Get several records by ID. See RecordService.get_many()."""
+        async with self._session_scope(session) as (session, _):
+            stmt = self._get_many_stmt()
+            found: Dict[int, Any] = {}
+            for chunk in _id_chunks(record_ids):
+                for instance in (await session.execute(stmt, {"ids": chunk})).scalars():
+                    found[instance.id] = instance
+            return found
+
+    async def get_by(
+        self,
+        field: str,
+        value: Any,
+        session: Optional[AsyncSession] = None,
+    ) -> Optional[Any]:
+        """Get a record by a specific field value."""
+        async with self._session_scope(session) as (session, _):
+            stmt, params = self._get_by_stmt(field, value)
+            return (await session.execute(stmt, params)).scalars().first()
+
+    # -------------------------------------------------------------------
+    # UPDATE
+    # -------------------------------------------------------------------
+
+    async def update(
+        self,
+        record_id: int,
+        data: Dict[str, Any],
+        user_id: Optional[int] = None,
+        session: Optional[AsyncSession] = None,
+    ) -> Optional[Any]:
+        """Partially update a record by ID. See RecordService.update()."""
+        async with self._session_scope(session) as (session, own_session):
+            stmt = self._direct_update_stmt(record_id, data, user_id)
+            if stmt is not None:
+                instance = (await session.execute(stmt)).scalars().first()
+                if instance is not None and own_session:
+                    await session.commit()
+                logger.debug(f"Updated {self.model.__name__} id={record_id} (direct): {list(data.keys())}")
+                return instance
+
+            instance = await self.get(record_id, session=session)
+            if not instance:
+                return None
+
+            changes = self._apply_changes(instance, data, user_id)
+
+            # Audit log
+            if self.audit_enabled and changes:
+                await self._log_update(session, instance, changes, user_id)
+
+            if own_session:
+                await session.commit()
+
+            # Fire event hooks
+            if changes:
+                self._fire_hooks(self.on_update_hooks, instance, {"changes": changes})
+
+            logger.debug(f"Updated {self.model.__name__} id={record_id}: {list(changes.keys())}")
+            return instance
+
+    # -------------------------------------------------------------------
+    # DELETE
+    # -------------------------------------------------------------------
+
+    async def delete(
+        self,
+        record_id: int,
+        user_id: Optional[int] = None,
+        hard: bool = False,
+        session: Optional[AsyncSession] = None,
+    ) -> bool:
+        """Delete a record, soft by default if enabled. See RecordService.delete()."""
+        async with self._session_scope(session) as (session, own_session):
+            instance = await session.get(self.model, record_id)
+            if not instance:
+                return False
+
+            if not self._soft_delete(instance, user_id, hard):
+                # Hard delete
+                await session.delete(instance)
+
+            # Audit log
+            if self.audit_enabled:
+                await self._log_delete(session, instance, user_id)
+
+            if own_session:
+                await session.commit()
+
+            # Fire event hooks
+            self._fire_hooks(self.on_delete_hooks, instance, {})
+
+            logger.debug(f"Deleted {self.model.__name__} id={record_id} (soft={self.soft_delete_enabled and not hard})")
+            return True
+
+    # -------------------------------------------------------------------
+    # LIST & SEARCH
+    # -------------------------------------------------------------------
+
+    async def list(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        page: int = 1,
+        page_size: int = 25,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        session: Optional[AsyncSession] = None,
+    ) -> List[Any]:
+        """List records with optional filtering and pagination."""
+        async with self._session_scope(session) as (session, _):
+            stmt, params = self._list_stmt(filters, page, page_size, order_by, descending)
+            return (await session.execute(stmt, params)).scalars().all()
+
+    async def search(
+        self,
+        query_text: str,
+        search_fields: Optional[List[str]] = None,
+        page: int = 1,
+        page_size: int = 25,
+        session: Optional[AsyncSession] = None,
+    ) -> List[Any]:
+        """Full-text search across specified fields using ILIKE."""
+        async with self._session_scope(session) as (session, _):
+            stmt = self._search_stmt(query_text, search_fields, page, page_size)
+            return (await session.execute(stmt)).scalars().all()
+
+    async def count(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        session: Optional[AsyncSession] = None,
+    ) -> int:
+        """Count records matching filters."""
+        async with self._session_scope(session) as (session, _):
+            stmt, params = self._count_stmt(filters)
+            return (await session.execute(stmt, params)).scalar() or 0
+
+    # -------------------------------------------------------------------
+    # Audit Logging
+    # -------------------------------------------------------------------
+
+    async def _log_create(self, session: AsyncSession, instance: Any, user_id: Optional[int]) -> None:
+        AuditModel = self._get_audit_model()
+        if not AuditModel:
+            return
+        rows = self._create_audit_rows(instance, user_id)
+        if rows and not self._ship_audit(AuditModel, rows):
+            if self._is_chained(AuditModel):
+                _chain_audit_rows(rows, None)
+            await session.execute(insert(AuditModel), rows)
+
+    async def _log_update(
+        self,
+        session: AsyncSession,
+        instance: Any,
+        changes: Dict[str, Tuple[Any, Any]],
+        user_id: Optional[int],
+    ) -> None:
+        AuditModel = self._get_audit_model()
+        if not AuditModel or not changes:
+            return
+        rows = self._update_audit_rows(instance, changes, user_id)
+        if not self._ship_audit(AuditModel, rows):
+            if self._is_chained(AuditModel):
+                _chain_audit_rows(rows, await self._audit_chain_head(
+                    session, AuditModel.__table__, instance.id,
+                ))
+            await session.execute(insert(AuditModel), rows)
+
+    async def _log_delete(self, session: AsyncSession, instance: Any, user_id: Optional[int]) -> None:
+        AuditModel = self._get_audit_model()
+        if not AuditModel:
+            return
+        row = self._delete_audit_row(instance, user_id)
+        if not self._ship_audit(AuditModel, [row]):
+            if self._is_chained(AuditModel):
+                _chain_audit_rows([row], await self._audit_chain_head(
+                    session, AuditModel.__table__, instance.id,
+                ))
+            await session.execute(insert(AuditModel).values(**row))
+
+    @staticmethod
+    async def _audit_chain_head(
+        session: AsyncSession, table: Any, record_id: int,
+    ) -> Optional[bytes]:
+        """Async _audit_chain_head(): the record's newest row_hash, locked."""
+        lock, head = _chain_head_stmts(table)
+        params = {"record_id": record_id}
+        if session.get_bind().dialect.name == "postgresql":
+            await session.execute(lock, params)
+        return (await session.execute(head, params)).scalar()
+
+
+# ---------------------------------------------------------------------------
+# Service Generator — generates per-record service Python files
+# ---------------------------------------------------------------------------
 
-    code = f'''"""
+# Templates are parsed once at import; generate_service_code only formats
+_SERVICE_TEMPLATE = '''"""
 Auto-generated CRUD service for @record {class_name}.
 App: {app_name}
 Table: {table_name}
@@ -619,11 +1389,11 @@ DO NOT EDIT — regenerate with `appos generate`.
 
 from typing import Any, Dict, List, Optional
 
-{model_import}
-from appos.generators.service_generator import RecordService
+from appos.generators.generated.models.{module_name} import {model_name}
+from appos.generators.service_generator import {base_name}
 
 
-class {service_name}(RecordService):
+class {class_name}Service({base_name}):
     """CRUD service for {class_name} records."""
 
     model = {model_name}
@@ -632,28 +1402,89 @@ class {service_name}(RecordService):
     soft_delete_enabled = {soft_delete}
 
     # Event hooks from Meta
-    on_create_hooks = {on_create_str}
-    on_update_hooks = {on_update_str}
-    on_delete_hooks = {on_delete_str}
+    on_create_hooks = {on_create!r}
+    on_update_hooks = {on_update!r}
+    on_delete_hooks = {on_delete!r}
 
     # Search fields from Meta
-    _search_fields = {search_fields_str}
+    _search_fields = {search_fields!r}
 
-    def search(self, query_text: str, search_fields=None, **kwargs):
-        return super().search(
+{search_block}
             query_text,
             search_fields=search_fields or self._search_fields,
             **kwargs,
         )
 {audit_model_block}
 '''
-    return code
+
+_SYNC_SEARCH_BLOCK = """    def search(self, query_text: str, search_fields=None, **kwargs):
+        return super().search("""
+
+_ASYNC_SEARCH_BLOCK = """    async def search(self, query_text: str, search_fields=None, **kwargs):
+        return await super().search("""
+
+_AUDIT_MODEL_BLOCK = """
+    _audit_model_cls = None
+
+    @classmethod
+    def _get_audit_model(cls):
+        # Lazy import to avoid circular deps; resolved once per class
+        if cls._audit_model_cls is None:
+            try:
+                from appos.generators.generated.models.{app_name}_{table_name}_audit_log import {class_name}AuditLogModel
+            except ImportError:
+                return None
+            cls._audit_model_cls = {class_name}AuditLogModel
+        return cls._audit_model_cls
+"""
+
+
+def generate_service_code(
+    class_name: str,
+    app_name: str,
+    table_name: str,
+    audit: bool = False,
+    soft_delete: bool = False,
+    search_fields: Optional[List[str]] = None,
+    on_create: Optional[List[str]] = None,
+    on_update: Optional[List[str]] = None,
+    on_delete: Optional[List[str]] = None,
+    async_mode: bool = False,
+) -> str:
+    """
+    Generate a RecordService subclass for a @record.
+
+    With async_mode=True the service subclasses AsyncRecordService and
+    its CRUD methods are coroutines.
+
+    Returns Python source code string.
+    """
+    return _SERVICE_TEMPLATE.format_map({
+        "class_name": class_name,
+        "app_name": app_name,
+        "table_name": table_name,
+        "model_name": f"{class_name}Model",
+        "module_name": to_snake(class_name),
+        "base_name": "AsyncRecordService" if async_mode else "RecordService",
+        "audit": audit,
+        "soft_delete": soft_delete,
+        "on_create": on_create or [],
+        "on_update": on_update or [],
+        "on_delete": on_delete or [],
+        "search_fields": search_fields or [],
+        "search_block": _ASYNC_SEARCH_BLOCK if async_mode else _SYNC_SEARCH_BLOCK,
+        "audit_model_block": (
+            _AUDIT_MODEL_BLOCK.format(app_name=app_name, table_name=table_name, class_name=class_name)
+            if audit else ""
+        ),
+    })
 
 
 def generate_and_write_service(
     record_class: type,
     app_name: str,
     output_dir: Optional[str] = None,
+    async_mode: bool = False,
 ) -> str:
     """
     Generate and write a CRUD service file for a @record.
@@ -662,6 +1493,7 @@ def generate_and_write_service(
         record_class: The @record Pydantic class.
         app_name: App short name.
         output_dir: Base output dir. Defaults to .appos/generated/.
+        async_mode: Generate an AsyncRecordService subclass.
 
     Returns:
         Path to the generated file.
@@ -684,6 +1516,7 @@ def generate_and_write_service(
         on_create=parsed.on_create,
         on_update=parsed.on_update,
         on_delete=parsed.on_delete,
+        async_mode=async_mode,
     )
 
     file_path = os.path.join(output_dir, "services", f"{to_snake(parsed.class_name)}_service.py")
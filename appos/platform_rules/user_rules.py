@@ -14,15 +14,60 @@ Design refs: AppOS_Design.md §8 Prebuilt Platform Rules, AppOS_PlatformRules_Re
 from __future__ import annotations
 
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+from sqlalchemy import bindparam, insert, select, update
+
+from appos.db.platform_models import App, Group, GroupApp, User, UserGroup
 from appos.engine.context import get_execution_context
 from appos.engine.errors import AppOSSecurityError, AppOSValidationError
 from appos.engine.security import hash_password, verify_password
 
 logger = logging.getLogger("appos.platform_rules")
 
+# Columns update_user() may touch
+_UPDATE_ALLOWED = frozenset({
+    "email", "full_name", "is_active", "user_type", "preferred_language", "timezone",
+})
+
+# Read statements built once; row._mapping gives the response dict directly
+_CURRENT_USER_STMT = select(
+    User.id, User.username, User.email, User.full_name,
+    User.user_type, User.preferred_language, User.timezone,
+).where(User.id == bindparam("user_id"))
+
+_USER_STMT = select(
+    User.id, User.username, User.email, User.full_name,
+    User.user_type, User.is_active, User.preferred_language,
+    User.timezone, User.last_login,
+).where(User.id == bindparam("user_id"))
+
+_GROUP_NAMES_STMT = (
+    select(Group.name)
+    .join(UserGroup, UserGroup.group_id == Group.id)
+    .where(UserGroup.user_id == bindparam("user_id"))
+)
+
+_GROUP_MEMBERS_STMT = (
+    select(User.id, User.username, User.full_name, User.user_type)
+    .join(UserGroup, UserGroup.user_id == User.id)
+    .join(Group, Group.id == UserGroup.group_id)
+    .where(Group.name == bindparam("group_name"), User.is_active.is_(True))
+)
+
+# bcrypt releases the GIL, so a thread pool runs KDFs truly in parallel while
+# capping them at one per core instead of one per request thread
+_PW_EXECUTOR = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4, thread_name_prefix="appos-pwhash",
+)
+
 
 def _require_admin() -> None:
     """Raise if current user is not system_admin."""
@@ -40,101 +85,171 @@ def _get_session():
     return get_platform_session()
 
 
+# Session of the outermost rule running in this context; nested rules reuse it
+_active_session: ContextVar[Optional[Any]] = ContextVar(
+    "appos_rules_session", default=None,
+)
+
+
+@contextmanager
+def _session_scope(write: bool = True):
+    """
+    Session for one rule call.
+
+    The outermost call owns the session: it commits on success (writes
+    only), rolls back on error, and closes. A rule called from inside
+    another reuses that session instead of checking out a second
+    connection; nested writes run in a SAVEPOINT so a failing inner rule
+    undoes only its own changes. A nested write marks the session so a
+    read-only outer call still commits it.
+    """
+    outer = _active_session.get()
+    if outer is not None:
+        if write:
+            with outer.begin_nested():
+                yield outer
+            outer.info["appos_rules_wrote"] = True
+        else:
+            yield outer
+        return
+
+    session = _get_session()
+    token = _active_session.set(session)
+    try:
+        yield session
+        if write or session.info.pop("appos_rules_wrote", False):
+            session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        _active_session.reset(token)
+        session.close()
+
+
+# Group name -> id, LRU-bounded. Group-mutating rules must invalidate.
+_GROUP_CACHE_MAX = 512
+_group_id_cache: "OrderedDict[str, int]" = OrderedDict()
+_group_id_lock = threading.Lock()
+
+
+def _resolve_group_ids(session, names: List[str]) -> Dict[str, int]:
+    """
+    Resolve group names to ids. Cache hits are served from the LRU; all
+    misses are fetched in one IN query. Unknown names are left out.
+    """
+    resolved: Dict[str, int] = {}
+    missing: List[str] = []
+    with _group_id_lock:
+        for name in dict.fromkeys(names):
+            group_id = _group_id_cache.get(name)
+            if group_id is None:
+                missing.append(name)
+            else:
+                _group_id_cache.move_to_end(name)
+                resolved[name] = group_id
+
+    if missing:
+        rows = session.execute(
+            select(Group.name, Group.id).where(Group.name.in_(missing))
+        ).all()
+        with _group_id_lock:
+            for name, group_id in rows:
+                resolved[name] = _group_id_cache[name] = group_id
+                _group_id_cache.move_to_end(name)
+            while len(_group_id_cache) > _GROUP_CACHE_MAX:
+                _group_id_cache.popitem(last=False)
+    return resolved
+
+
+def _resolve_group_id(session, name: str) -> Optional[int]:
+    """Resolve a single group name to its id, or None if it doesn't exist."""
+    return _resolve_group_ids(session, [name]).get(name)
+
+
+def _invalidate_group_cache(name: Optional[str] = None) -> None:
+    """Drop one cached group id, or the whole cache when `name` is None."""
+    with _group_id_lock:
+        if name is None:
+            _group_id_cache.clear()
+        else:
+            _group_id_cache.pop(name, None)
+
+
 # ---------------------------------------------------------------------------
 # User rules
 # ---------------------------------------------------------------------------
 
 def get_current_user() -> Dict[str, Any]:
-    """Returns current user details. Any authenticated user."""
+    """
+    Returns current user details. Any authenticated user.
+
+    Memoized on the execution context, so repeated calls within one request
+    hit the DB once. Rules that change the current user clear the cache.
+    """
     ctx = get_execution_context()
     if ctx is None:
         raise AppOSSecurityError("Not authenticated")
 
-    from appos.db.platform_models import User
+    cached = ctx._current_user_cache
+    if cached is None:
+        cached = ctx._current_user_cache = _load_current_user(ctx.user_id)
+    # Copy so callers can't mutate the memoized value
+    return {**cached, "groups": list(cached["groups"])} if cached else {}
 
-    session = _get_session()
-    try:
-        user = session.query(User).get(ctx.user_id)
-        if user is None:
+
+def _load_current_user(user_id: int) -> Dict[str, Any]:
+    with _session_scope(write=False) as session:
+        row = session.execute(_CURRENT_USER_STMT, {"user_id": user_id}).one_or_none()
+        if row is None:
             return {}
-        return {
-            "id": user.id,
-            "username": user.username,
-            "email": user.email,
-            "full_name": user.full_name,
-            "user_type": user.user_type,
-            "preferred_language": user.preferred_language,
-            "timezone": user.timezone,
-            "groups": [g.name for g in user.groups],
-        }
-    finally:
-        session.close()
+        return {**row._mapping, "groups": _group_names(session, user_id)}
+
+
+def _group_names(session, user_id: int) -> List[str]:
+    """Group names for a user, straight from the membership join."""
+    return list(session.execute(_GROUP_NAMES_STMT, {"user_id": user_id}).scalars())
+
+
+def _invalidate_current_user(user_id: int) -> None:
+    """Drop the memoized get_current_user() result if `user_id` is the caller."""
+    ctx = get_execution_context()
+    if ctx is not None and ctx.user_id == user_id:
+        ctx._current_user_cache = None
 
 
 def get_user(user_id: int) -> Dict[str, Any]:
     """Returns user by ID. system_admin required."""
     _require_admin()
 
-    from appos.db.platform_models import User
-
-    session = _get_session()
-    try:
-        user = session.query(User).get(user_id)
-        if user is None:
+    with _session_scope(write=False) as session:
+        row = session.execute(_USER_STMT, {"user_id": user_id}).one_or_none()
+        if row is None:
             return {}
         return {
-            "id": user.id,
-            "username": user.username,
-            "email": user.email,
-            "full_name": user.full_name,
-            "user_type": user.user_type,
-            "is_active": user.is_active,
-            "preferred_language": user.preferred_language,
-            "timezone": user.timezone,
-            "last_login": user.last_login.isoformat() if user.last_login else None,
-            "groups": [g.name for g in user.groups],
+            **row._mapping,
+            "last_login": row.last_login.isoformat() if row.last_login else None,
+            "groups": _group_names(session, user_id),
         }
-    finally:
-        session.close()
 
 
 def get_user_groups(user_id: int) -> List[str]:
     """Returns list of group names for a user. system_admin required."""
     _require_admin()
 
-    from appos.db.platform_models import User
-
-    session = _get_session()
-    try:
-        user = session.query(User).get(user_id)
-        return [g.name for g in user.groups] if user else []
-    finally:
-        session.close()
+    with _session_scope(write=False) as session:
+        return _group_names(session, user_id)
 
 
 def get_group_members(group_name: str) -> List[Dict[str, Any]]:
     """Returns list of users in a group. system_admin required."""
     _require_admin()
 
-    from appos.db.platform_models import Group
-
-    session = _get_session()
-    try:
-        group = session.query(Group).filter_by(name=group_name).first()
-        if group is None:
-            return []
-        return [
-            {
-                "id": u.id,
-                "username": u.username,
-                "full_name": u.full_name,
-                "user_type": u.user_type,
-            }
-            for u in group.users
-            if u.is_active
-        ]
-    finally:
-        session.close()
+    with _session_scope(write=False) as session:
+        # Active members straight from the join, as column rows — no User
+        # hydration and no selectin cascade through the relationships
+        rows = session.execute(_GROUP_MEMBERS_STMT, {"group_name": group_name})
+        return [dict(row._mapping) for row in rows]
 
 
 def create_user(
@@ -148,13 +263,13 @@ def create_user(
     """Create a new user. system_admin required."""
     _require_admin()
 
-    from appos.db.platform_models import Group, User, UserGroup
-
     if user_type not in ("basic", "system_admin", "service_account"):
         raise AppOSValidationError(f"Invalid user_type: {user_type}")
 
-    session = _get_session()
-    try:
+    # bcrypt is deliberately slow — hash before checking out a connection
+    password_hash = _PW_EXECUTOR.submit(hash_password, password).result()
+
+    with _session_scope() as session:
         # Check uniqueness
         existing = session.query(User).filter(
             (User.username == username) | (User.email == email)
@@ -168,115 +283,111 @@ def create_user(
             username=username,
             email=email,
             full_name=full_name,
-            password_hash=hash_password(password),
+            password_hash=password_hash,
             user_type=user_type,
             is_active=True,
         )
         session.add(user)
         session.flush()
 
-        # Assign groups
+        # Assign groups — one lookup, one multi-row INSERT
         if groups:
-            for gname in groups:
-                g = session.query(Group).filter_by(name=gname).first()
-                if g:
-                    session.add(UserGroup(user_id=user.id, group_id=g.id))
+            group_ids = _resolve_group_ids(session, groups)
+            if group_ids:
+                session.execute(insert(UserGroup), [
+                    {"user_id": user.id, "group_id": gid}
+                    for gid in group_ids.values()
+                ])
 
-        session.commit()
-        logger.info(f"Created user: {username} (type: {user_type})")
+        created = {"id": user.id, "username": user.username}
 
-        return {"id": user.id, "username": user.username}
-
-    except Exception:
-        session.rollback()
-        raise
-    finally:
-        session.close()
+    logger.info(f"Created user: {username} (type: {user_type})")
+    return created
 
 
 def update_user(user_id: int, fields: Dict[str, Any]) -> Dict[str, Any]:
     """Update user fields. system_admin required."""
     _require_admin()
 
-    from appos.db.platform_models import User
-
-    ALLOWED = {"email", "full_name", "is_active", "user_type", "preferred_language", "timezone"}
+    updates = {k: v for k, v in fields.items() if k in _UPDATE_ALLOWED}
 
-    session = _get_session()
-    try:
-        user = session.query(User).get(user_id)
-        if user is None:
+    with _session_scope() as session:
+        # One UPDATE ... RETURNING; no row back means no such user
+        if updates:
+            stmt = (
+                update(User).where(User.id == user_id)
+                .values(**updates).returning(User.username)
+            )
+        else:
+            stmt = select(User.username).where(User.id == user_id)
+        username = session.execute(stmt).scalar_one_or_none()
+        if username is None:
             raise AppOSValidationError(f"User {user_id} not found")
 
-        for key, value in fields.items():
-            if key in ALLOWED:
-                setattr(user, key, value)
+    _invalidate_current_user(user_id)
+    return {"id": user_id, "username": username, "updated": list(fields.keys())}
 
-        session.commit()
-        return {"id": user.id, "username": user.username, "updated": list(fields.keys())}
 
-    except Exception:
-        session.rollback()
-        raise
-    finally:
-        session.close()
+def _insert_ignoring_conflicts(session, model, index_elements: List[str]):
+    """INSERT ... ON CONFLICT DO NOTHING for dialects that have it, else None."""
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        return None
+    # Core table insert, so the result carries a real rowcount
+    return dialect_insert(model.__table__).on_conflict_do_nothing(
+        index_elements=index_elements,
+    )
 
 
 def add_user_to_group(user_id: int, group_name: str) -> bool:
-    """Add a user to a group. system_admin required."""
+    """Add a user to a group. system_admin required. Idempotent."""
     _require_admin()
 
-    from appos.db.platform_models import Group, UserGroup
-
-    session = _get_session()
-    try:
-        group = session.query(Group).filter_by(name=group_name).first()
-        if group is None:
+    with _session_scope() as session:
+        group_id = _resolve_group_id(session, group_name)
+        if group_id is None:
             raise AppOSValidationError(f"Group not found: {group_name}")
 
-        existing = session.query(UserGroup).filter_by(
-            user_id=user_id, group_id=group.id
-        ).first()
-        if existing:
-            return True  # Already a member
+        # Single round trip; an existing membership is a no-op, not a race
+        stmt = _insert_ignoring_conflicts(session, UserGroup, ["user_id", "group_id"])
+        if stmt is not None:
+            inserted = session.execute(
+                stmt, {"user_id": user_id, "group_id": group_id}
+            ).rowcount
+        else:
+            inserted = not session.query(UserGroup).filter_by(
+                user_id=user_id, group_id=group_id
+            ).first()
+            if inserted:
+                session.add(UserGroup(user_id=user_id, group_id=group_id))
 
-        session.add(UserGroup(user_id=user_id, group_id=group.id))
-        session.commit()
-        return True
-
-    except Exception:
-        session.rollback()
-        raise
-    finally:
-        session.close()
+    if inserted:
+        _invalidate_current_user(user_id)
+    return True
 
 
 def remove_user_from_group(user_id: int, group_name: str) -> bool:
     """Remove a user from a group. system_admin required."""
     _require_admin()
 
-    from appos.db.platform_models import Group, UserGroup
-
-    session = _get_session()
-    try:
-        group = session.query(Group).filter_by(name=group_name).first()
-        if group is None:
+    with _session_scope() as session:
+        group_id = _resolve_group_id(session, group_name)
+        if group_id is None:
             raise AppOSValidationError(f"Group not found: {group_name}")
 
         membership = session.query(UserGroup).filter_by(
-            user_id=user_id, group_id=group.id
+            user_id=user_id, group_id=group_id
         ).first()
         if membership:
             session.delete(membership)
-            session.commit()
 
-        return True
-
-    except Exception:
-        session.rollback()
-        raise
-    finally:
-        session.close()
+    if membership:
+        _invalidate_current_user(user_id)
+    return True
 
 
 def change_password(user_id: int, old_password: str, new_password: str) -> bool:
@@ -295,31 +406,39 @@ def change_password(user_id: int, old_password: str, new_password: str) -> bool:
             user_id=ctx.user_id,
         )
 
-    from appos.db.platform_models import User
-
-    session = _get_session()
-    try:
-        user = session.query(User).get(user_id)
-        if user is None:
-            raise AppOSValidationError(f"User {user_id} not found")
-
-        # Verify old password (not required for admin)
-        if ctx.user_type != "system_admin":
-            if not verify_password(old_password, user.password_hash):
-                raise AppOSSecurityError("Current password is incorrect")
+    # Reject bad input before taking a connection or running bcrypt
+    if not isinstance(new_password, str) or len(new_password) < 8:
+        raise AppOSValidationError("Password must be at least 8 characters")
 
-        if len(new_password) < 8:
-            raise AppOSValidationError("Password must be at least 8 characters")
-
-        user.password_hash = hash_password(new_password)
-        session.commit()
-        return True
+    with _session_scope(write=False) as session:
+        current_hash = session.scalar(
+            select(User.password_hash).where(User.id == user_id)
+        )
+    if current_hash is None:
+        raise AppOSValidationError(f"User {user_id} not found")
+
+    # verify/hash run with no connection checked out — bcrypt takes ~100s of ms
+    if ctx.user_type != "system_admin":  # admins skip the old-password check
+        if not _PW_EXECUTOR.submit(verify_password, old_password, current_hash).result():
+            raise AppOSSecurityError("Current password is incorrect")
+
+    new_hash = _PW_EXECUTOR.submit(hash_password, new_password).result()
+
+    with _session_scope() as session:
+        # Compare-and-set on the hash we verified against: a concurrent change
+        # between read and write matches no row instead of being overwritten
+        result = session.execute(
+            update(User)
+            .where(User.id == user_id, User.password_hash == current_hash)
+            .values(password_hash=new_hash)
+        )
+        if result.rowcount == 0:
+            raise AppOSSecurityError(
+                "Password was changed concurrently; retry", user_id=ctx.user_id,
+            )
 
-    except Exception:
-        session.rollback()
-        raise
-    finally:
-        session.close()
+    _invalidate_current_user(user_id)
+    return True
 
 
 # ---------------------------------------------------------------------------
@@ -336,10 +455,7 @@ def create_group(
     """Create a new group. system_admin required."""
     _require_admin()
 
-    from appos.db.platform_models import App, Group, GroupApp, UserGroup
-
-    session = _get_session()
-    try:
+    with _session_scope() as session:
         existing = session.query(Group).filter_by(name=name).first()
         if existing:
             raise AppOSValidationError(f"Group already exists: {name}")
@@ -353,23 +469,24 @@ def create_group(
         session.add(group)
         session.flush()
 
-        # Assign apps
+        # Assign apps — one IN lookup, one multi-row INSERT
         if apps:
-            for app_name in apps:
-                app = session.query(App).filter_by(short_name=app_name).first()
-                if app:
-                    session.add(GroupApp(group_id=group.id, app_id=app.id))
+            app_ids = session.execute(
+                select(App.id).where(App.short_name.in_(set(apps)))
+            ).scalars().all()
+            if app_ids:
+                session.execute(insert(GroupApp), [
+                    {"group_id": group.id, "app_id": app_id} for app_id in app_ids
+                ])
 
         # Assign users
         if users:
-            for uid in users:
-                session.add(UserGroup(user_id=uid, group_id=group.id))
+            session.execute(insert(UserGroup), [
+                {"user_id": uid, "group_id": group.id}
+                for uid in dict.fromkeys(users)
+            ])
 
-        session.commit()
-        return {"id": group.id, "name": group.name}
+        created = {"id": group.id, "name": group.name}
 
-    except Exception:
-        session.rollback()
-        raise
-    finally:
-        session.close()
+    _invalidate_group_cache(name)
+    return created
@@ -1,24 +1,49 @@
 """AppOS Process Engine — Celery-based process/step execution.
 
 Provides the ProcessExecutor, Celery helpers, and scheduler singletons.
+
+Names are resolved lazily (PEP 562): ``import appos.process`` is cheap, and
+Celery/kombu/the DB layer load only when one of the names is first used.
 """
 
-from appos.process.executor import (  # noqa: F401
-    ProcessExecutor,
-    get_process_executor,
-    init_process_executor,
-    get_celery_app,
-    init_celery,
-)
-from appos.process.scheduler import (  # noqa: F401
-    ProcessScheduler,
-    EventTriggerRegistry,
-    ScheduleTriggerRegistry,
-    get_scheduler,
-    init_scheduler,
-    get_event_registry,
-    get_schedule_registry,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from appos.process.executor import (  # noqa: F401
+        ProcessExecutor,
+        get_process_executor,
+        init_process_executor,
+        get_celery_app,
+        init_celery,
+    )
+    from appos.process.scheduler import (  # noqa: F401
+        ProcessScheduler,
+        EventTriggerRegistry,
+        ScheduleTriggerRegistry,
+        get_scheduler,
+        init_scheduler,
+        get_event_registry,
+        get_schedule_registry,
+    )
+
+# Public name -> submodule that defines it
+_LAZY_EXPORTS = {
+    "ProcessExecutor": "appos.process.executor",
+    "get_process_executor": "appos.process.executor",
+    "init_process_executor": "appos.process.executor",
+    "get_celery_app": "appos.process.executor",
+    "init_celery": "appos.process.executor",
+    "ProcessScheduler": "appos.process.scheduler",
+    "EventTriggerRegistry": "appos.process.scheduler",
+    "ScheduleTriggerRegistry": "appos.process.scheduler",
+    "get_scheduler": "appos.process.scheduler",
+    "init_scheduler": "appos.process.scheduler",
+    "get_event_registry": "appos.process.scheduler",
+    "get_schedule_registry": "appos.process.scheduler",
+}
 
 __all__ = [
     "ProcessExecutor",
@@ -34,3 +59,16 @@ __all__ = [
     "get_event_registry",
     "get_schedule_registry",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -9,7 +9,7 @@ Executes @process definitions by:
 5. Managing process state (running → completed/failed)
 
 Celery Tasks:
-    - execute_process_step: runs a single step, triggers next
+    - execute_process_step: runs a step, chains following sequential steps
     - start_process_async: creates instance + kicks off first step
 
 Design refs: AppOS_Design.md §11 (Process Engine), §5.9 (Process)
@@ -17,16 +17,30 @@ Design refs: AppOS_Design.md §11 (Process Engine), §5.9 (Process)
 
 from __future__ import annotations
 
+import ast
+import functools
+import json
 import logging
+import os
+import socket
 import time
 import uuid
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import date, datetime, time as dt_time, timezone
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from celery import Celery, chord as celery_chord, group as celery_group
 
 logger = logging.getLogger("appos.process.executor")
 
+# Session shared by every DB helper while a Celery task runs (see task_session)
+_task_session: ContextVar[Optional[Any]] = ContextVar(
+    "appos_process_task_session", default=None,
+)
+
 
 # ---------------------------------------------------------------------------
 # Celery app (configured at startup from platform config)
@@ -43,6 +57,54 @@ def get_celery_app() -> Celery:
     return _celery_app
 
 
+_MSGPACK_SERIALIZER = "appos_msgpack"
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """Encode values msgpack has no type for, matching kombu's JSON output."""
+    if isinstance(obj, (datetime, date, dt_time)):
+        return obj.isoformat()
+    if isinstance(obj, (Decimal, uuid.UUID)):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Cannot serialize {type(obj).__name__} for a Celery task")
+
+
+def _task_serializer() -> str:
+    """
+    Register and return the msgpack task serializer (smaller payloads and
+    faster encode/decode than JSON); falls back to "json" if msgpack is
+    not installed.
+    """
+    try:
+        import msgpack
+    except ImportError:
+        return "json"
+    from kombu.serialization import register
+
+    register(
+        _MSGPACK_SERIALIZER,
+        lambda payload: msgpack.packb(payload, default=_msgpack_default, use_bin_type=True),
+        lambda data: msgpack.unpackb(data, raw=False),
+        content_type="application/x-appos-msgpack",
+        content_encoding="binary",
+    )
+    return _MSGPACK_SERIALIZER
+
+
+# Queues: short steps (high prefetch), long_running steps (prefetch 1), and
+# process control tasks (starts, chord callbacks, log draining)
+STEP_QUEUE_FAST = "process_steps.fast"
+STEP_QUEUE_SLOW = "process_steps.slow"
+CONTROL_QUEUE = "process_control"
+
+
+def step_queue(step_def: Dict[str, Any]) -> str:
+    """Queue a step's task is published to."""
+    return STEP_QUEUE_SLOW if step_def.get("long_running") else STEP_QUEUE_FAST
+
+
 def _create_celery_app() -> Celery:
     """Create and configure the Celery application."""
     try:
@@ -50,37 +112,62 @@ def _create_celery_app() -> Celery:
         config = load_platform_config()
         broker = config.celery.broker
         backend = config.celery.result_backend
+        prefetch_multiplier = config.celery.prefetch_multiplier
+        acks_late = config.celery.acks_late
+        rate_limit = config.celery.task_default_rate_limit
+        async_step_logging = config.celery.async_step_logging
     except Exception:
         broker = "redis://localhost:6379/0"
         backend = "redis://localhost:6379/1"
+        prefetch_multiplier = 4
+        acks_late = True
+        rate_limit = None
+        async_step_logging = False
 
     app = Celery("appos", broker=broker, backend=backend)
+    serializer = _task_serializer()
 
     app.conf.update(
-        task_serializer="json",
-        result_serializer="json",
-        accept_content=["json"],
+        task_serializer=serializer,
+        result_serializer=serializer,
+        # JSON stays accepted so messages queued before a rollout still run
+        accept_content=list(dict.fromkeys([serializer, "json"])),
         timezone="UTC",
         enable_utc=True,
-        task_default_queue="process_steps",
+        task_default_queue=STEP_QUEUE_FAST,
         task_routes={
-            "appos.process.executor.execute_process_step_task": {"queue": "process_steps"},
-            "appos.process.executor.start_process_task": {"queue": "process_steps"},
+            # Step tasks are published with queue=step_queue(step_def)
+            "appos.process.executor.execute_process_step_task": {"queue": STEP_QUEUE_FAST},
+            "appos.process.executor.start_process_task": {"queue": CONTROL_QUEUE},
+            "appos.process.executor.advance_process_step": {"queue": CONTROL_QUEUE},
+            "appos.process.executor.drain_step_log_stream": {"queue": CONTROL_QUEUE},
         },
-        task_acks_late=True,
-        worker_prefetch_multiplier=1,
+        task_acks_late=acks_late,
+        task_default_rate_limit=rate_limit,
+        worker_prefetch_multiplier=prefetch_multiplier,
+        # chord() bookkeeping on the Redis result backend
+        result_extended=True,
+        result_backend_transport_options={"visibility_timeout": 3600},
+        appos_async_step_logging=async_step_logging,
+        beat_schedule=platform_beat_schedule(async_step_logging),
     )
 
     return app
 
 
-def init_celery(broker: Optional[str] = None, backend: Optional[str] = None) -> Celery:
+def init_celery(
+    broker: Optional[str] = None,
+    backend: Optional[str] = None,
+    prefetch_multiplier: Optional[int] = None,
+) -> Celery:
     """
     Initialize the Celery app with custom config (called from runtime.startup).
 
     Args:
         broker: Redis broker URL. Defaults to config.
         backend: Redis result backend URL. Defaults to config.
+        prefetch_multiplier: Override celery.prefetch_multiplier from config
+            (e.g. 1 for a worker that only runs long steps).
 
     Returns:
         Configured Celery app.
@@ -91,10 +178,92 @@ def init_celery(broker: Optional[str] = None, backend: Optional[str] = None) ->
         app.conf.broker_url = broker
     if backend:
         app.conf.result_backend = backend
+    if prefetch_multiplier is not None:
+        app.conf.worker_prefetch_multiplier = prefetch_multiplier
     _celery_app = app
     return app
 
 
+def platform_beat_schedule(async_step_logging: bool) -> Dict[str, Any]:
+    """Beat entries the platform itself needs, merged under process schedules."""
+    if not async_step_logging:
+        return {}
+    return {
+        "appos-drain-step-log": {
+            "task": "appos.process.executor.drain_step_log_stream",
+            "schedule": _STEP_LOG_DRAIN_INTERVAL_S,
+        },
+    }
+
+
+# ---------------------------------------------------------------------------
+# Async step logging (celery.async_step_logging)
+# ---------------------------------------------------------------------------
+
+_STEP_LOG_STREAM = "appos:process_step_log"
+_STEP_LOG_GROUP = "appos-log-drainers"
+_STEP_LOG_BATCH = 100
+_STEP_LOG_DRAIN_INTERVAL_S = 5.0
+_STEP_LOG_CLAIM_IDLE_MS = 60_000  # re-claim entries a crashed drainer left pending
+
+_step_log_client: Optional[Any] = None
+
+
+def _step_log_redis() -> Optional[Any]:
+    """Redis client for the step-log stream (broker DB), or None if disabled."""
+    global _step_log_client
+    app = get_celery_app()
+    if not app.conf.get("appos_async_step_logging"):
+        return None
+    if _step_log_client is None:
+        import redis
+        _step_log_client = redis.Redis.from_url(
+            app.conf.broker_url,
+            decode_responses=True,
+            socket_timeout=5,
+            socket_connect_timeout=5,
+        )
+    return _step_log_client
+
+
+def _encode_step_log_row(row: Dict[str, Any]) -> str:
+    return json.dumps(row, default=_msgpack_default)
+
+
+def _decode_step_log_row(data: str) -> Dict[str, Any]:
+    row = json.loads(data)
+    for key in ("started_at", "completed_at"):
+        if row.get(key):
+            row[key] = datetime.fromisoformat(row[key])
+    return row
+
+
+def _publish_step_log(row: Dict[str, Any]) -> bool:
+    """XADD one step log row. False if disabled or Redis failed (log it sync)."""
+    try:
+        client = _step_log_redis()
+        if client is None:
+            return False
+        client.xadd(_STEP_LOG_STREAM, {"row": _encode_step_log_row(row)})
+        return True
+    except Exception as e:
+        logger.warning(f"Step log stream unavailable, writing synchronously: {e}")
+        return False
+
+
+def _publish_signatures(signatures: List[Any]) -> List[str]:
+    """
+    Publish task signatures over one pooled producer (one connection and
+    channel for the whole batch) instead of a pool checkout per message.
+
+    Returns:
+        Celery task ids, in input order.
+    """
+    app = get_celery_app()
+    with app.producer_or_acquire() as producer:
+        return [sig.apply_async(producer=producer).id for sig in signatures]
+
+
 # ---------------------------------------------------------------------------
 # Process definition parser — extracts step list from @process handler
 # ---------------------------------------------------------------------------
@@ -135,6 +304,201 @@ def parse_process_definition(handler: Any) -> Dict[str, Any]:
     return {"steps": result if isinstance(result, list) else []}
 
 
+@dataclass(frozen=True, slots=True)
+class CompiledStep:
+    """
+    A step() definition with everything derivable from the process
+    definition resolved up front (qualified rule ref, mapping pairs), so
+    executing a step reads attributes instead of re-deriving them.
+    """
+    name: str
+    full_rule_ref: str
+    input_bindings: Tuple[Tuple[str, str], ...]   # (rule_param, ctx_var)
+    output_bindings: Tuple[Tuple[str, str], ...]  # (rule_output, ctx_var)
+    condition: Optional[str]
+    retry_count: int
+    retry_delay: float
+    on_error: str
+    fire_and_forget: bool
+    log_inputs: bool
+    log_outputs: bool
+
+
+def compile_step(process_ref: str, step_def: Dict[str, Any]) -> CompiledStep:
+    """Build the CompiledStep for one step() dict of process_ref."""
+    name = step_def.get("name", "unnamed")
+    rule_ref = step_def.get("rule", "")
+    # Qualify a bare rule name with the process's app
+    app_name = process_ref.split(".")[0] if "." in process_ref else ""
+    if app_name and "." not in rule_ref:
+        rule_ref = f"{app_name}.rules.{rule_ref}"
+    # Reject a bad condition here rather than failing open when the step runs
+    condition = step_def.get("condition")
+    if condition:
+        try:
+            _compile_condition(condition)
+        except (SyntaxError, ValueError) as e:
+            raise ValueError(f"Step '{name}' of {process_ref} has an invalid condition: {e}") from e
+    return CompiledStep(
+        name=name,
+        full_rule_ref=rule_ref,
+        input_bindings=tuple((step_def.get("input_mapping") or {}).items()),
+        output_bindings=tuple((step_def.get("output_mapping") or {}).items()),
+        condition=condition,
+        retry_count=step_def.get("retry_count", 0),
+        retry_delay=step_def.get("retry_delay", 5),
+        on_error=step_def.get("on_error", "fail"),
+        fire_and_forget=step_def.get("fire_and_forget", False),
+        log_inputs=step_def.get("log_inputs", False),
+        log_outputs=step_def.get("log_outputs", False),
+    )
+
+
+class _RetryStep(Exception):
+    """A step attempt failed and its retry_count allows another attempt."""
+
+    def __init__(self, step: CompiledStep, attempt: int, error: Exception):
+        super().__init__(str(error))
+        self.step = step
+        self.attempt = attempt
+        self.error = error
+
+
+# Position of a step in a process definition: (step_index, sub_index), where
+# sub_index is the position inside a parallel group and None otherwise.
+# Step names aren't unique, so compiled steps are keyed by position.
+StepKey = Tuple[int, Optional[int]]
+
+
+def _compile_steps(
+    process_ref: str, steps: List[Dict[str, Any]],
+) -> Dict[StepKey, CompiledStep]:
+    """CompiledStep per step position, parallel sub-steps included."""
+    compiled: Dict[StepKey, CompiledStep] = {}
+    for index, step_def in enumerate(steps):
+        if step_def.get("type") == "parallel":
+            for sub_index, sub in enumerate(step_def.get("steps", [])):
+                compiled[(index, sub_index)] = compile_step(process_ref, sub)
+        else:
+            compiled[(index, None)] = compile_step(process_ref, step_def)
+    return compiled
+
+
+def _compiled_step(
+    compiled: Dict[StepKey, CompiledStep],
+    step_def: Dict[str, Any],
+    index: int,
+    sub_index: Optional[int] = None,
+) -> Union[CompiledStep, Dict[str, Any]]:
+    """
+    The CompiledStep at (index, sub_index), or step_def itself when the
+    definition no longer has that step there (e.g. re-registered mid-run).
+    """
+    step = compiled.get((index, sub_index))
+    if step is not None and step.name == step_def.get("name", "unnamed"):
+        return step
+    return step_def
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_process_cached(
+    process_ref: str, source_hash: str, handler: Any,
+) -> Dict[str, Any]:
+    definition = dict(parse_process_definition(handler))
+    definition["compiled"] = _compile_steps(process_ref, definition.get("steps", []))
+    return definition
+
+
+def get_process_definition(registered: Any) -> Dict[str, Any]:
+    """
+    parse_process_definition() memoized per (process_ref, source_hash).
+
+    Workers are long-lived and re-read the step list on every step; a
+    hot-reload re-registers the process with a new source_hash, so stale
+    definitions are never served. Treat the result as read-only.
+    ``compiled`` maps each step position (see StepKey) to its CompiledStep.
+    """
+    return _parse_process_cached(
+        registered.object_ref, registered.source_hash, registered.handler,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Step conditions — restricted expressions over the ProcessContext
+# ---------------------------------------------------------------------------
+
+# Node types a step condition may contain; anything else is rejected
+_CONDITION_NODES = (
+    ast.Expression, ast.BoolOp, ast.And, ast.Or, ast.UnaryOp, ast.Not, ast.USub,
+    ast.Compare, ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+    ast.In, ast.NotIn, ast.Is, ast.IsNot,
+    ast.BinOp, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Mod,
+    ast.Constant, ast.Name, ast.Load, ast.Attribute, ast.Call, ast.Subscript,
+    ast.List, ast.Tuple,
+)
+# Read-only ProcessContext members a condition may use
+_CONDITION_CTX_ATTRS = frozenset({"var", "input", "inputs", "variables"})
+_CONDITION_CTX_CALLS = frozenset({"var", "input"})
+
+
+class _CtxMemberLookup(ast.NodeTransformer):
+    """Rewrite the documented ``ctx.var.<name>`` / ``ctx.input.<name>`` into getter calls."""
+
+    def visit_Attribute(self, node: ast.Attribute) -> ast.AST:
+        self.generic_visit(node)
+        getter = node.value
+        if (
+            isinstance(getter, ast.Attribute)
+            and isinstance(getter.value, ast.Name) and getter.value.id == "ctx"
+            and getter.attr in _CONDITION_CTX_CALLS
+            and not node.attr.startswith("_")
+        ):
+            return ast.copy_location(
+                ast.Call(func=getter, args=[ast.Constant(node.attr)], keywords=[]), node,
+            )
+        return node
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_condition(condition: str) -> Any:
+    """
+    Parse, validate and compile a step condition once per distinct string.
+
+    Grammar: literals, ``ctx``, comparisons, boolean/arithmetic operators,
+    subscripts, and the read-only ctx members ``var(name)`` / ``var.name``,
+    ``input(name)`` / ``input.name``, ``inputs`` and ``variables``. No other
+    names, attributes or calls.
+
+    Raises:
+        ValueError: the condition uses anything outside that grammar.
+    """
+    tree = ast.fix_missing_locations(
+        _CtxMemberLookup().visit(ast.parse(condition, mode="eval")),
+    )
+    for node in ast.walk(tree):
+        if not isinstance(node, _CONDITION_NODES):
+            raise ValueError(f"Disallowed syntax in condition: {type(node).__name__}")
+        if isinstance(node, ast.Name) and node.id != "ctx":
+            raise ValueError(f"Unknown name in condition: {node.id}")
+        if isinstance(node, ast.Attribute) and not (
+            isinstance(node.value, ast.Name) and node.attr in _CONDITION_CTX_ATTRS
+        ):
+            raise ValueError(f"Disallowed attribute in condition: {node.attr}")
+        if isinstance(node, ast.Call) and not (
+            isinstance(node.func, ast.Attribute)
+            and node.func.attr in _CONDITION_CTX_CALLS
+            and len(node.args) == 1 and not node.keywords  # getter form only
+        ):
+            raise ValueError("Only ctx.var(name) / ctx.input(name) calls are allowed")
+    return compile(tree, f"<condition: {condition}>", "eval")
+
+
+def evaluate_condition(condition: str, ctx: Any) -> bool:
+    """Evaluate a validated step condition against the process context."""
+    code = _compile_condition(condition)
+    return bool(eval(code, {"__builtins__": {}}, {"ctx": ctx}))  # noqa: S307 - validated AST
+
+
 # ---------------------------------------------------------------------------
 # ProcessExecutor — orchestrates full process lifecycle
 # ---------------------------------------------------------------------------
@@ -156,6 +520,54 @@ class ProcessExecutor:
     def __init__(self, db_session_factory=None):
         self._session_factory = db_session_factory
 
+    @contextmanager
+    def task_session(self):
+        """
+        Pin one pooled connection for the duration of a Celery task.
+
+        Every DB helper called inside the block shares a session bound to
+        that connection, so a step costs one pool checkout instead of one
+        per helper. Transactions still end per helper; the connection is
+        never left idle in a transaction while rule code runs.
+        """
+        if self._session_factory is None or _task_session.get() is not None:
+            yield
+            return
+        probe = self._session_factory()
+        try:
+            connection = probe.get_bind().connect()
+        finally:
+            probe.close()
+        session = self._session_factory(bind=connection)
+        token = _task_session.set(session)
+        try:
+            yield
+        finally:
+            _task_session.reset(token)
+            session.close()
+            connection.close()
+
+    @contextmanager
+    def _session_scope(self):
+        """
+        Session for one DB helper: the task-scoped session when inside
+        task_session() (transaction ended, session kept), otherwise a fresh
+        session closed on exit.
+        """
+        shared = _task_session.get()
+        if shared is not None:
+            try:
+                yield shared
+            finally:
+                if shared.in_transaction():
+                    shared.rollback()  # end read transactions; writes have committed
+            return
+        session = self._session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
     def start_process(
         self,
         process_ref: str,
@@ -188,7 +600,7 @@ class ProcessExecutor:
             )
 
         # Parse the process definition (list of steps)
-        process_def = parse_process_definition(registered.handler)
+        process_def = get_process_definition(registered)
         steps = process_def.get("steps", [])
         metadata = registered.metadata or {}
 
@@ -233,10 +645,42 @@ class ProcessExecutor:
             )
         else:
             # Execute all steps synchronously (context already on thread)
-            self._execute_steps_sync(instance_id, process_ref, steps, inputs)
+            self._execute_steps_sync(
+                instance_id, process_ref, steps, inputs, pk=instance_data.get("id"),
+                compiled=process_def["compiled"],
+            )
 
         return instance_data
 
+    def bulk_start_processes(
+        self,
+        process_ref: str,
+        inputs_list: List[Dict[str, Any]],
+        user_id: int = 0,
+    ) -> List[str]:
+        """
+        Queue many start_process_task runs of one process in a single batch.
+
+        For bulk API endpoints: every start message is published over one
+        broker connection rather than one round trip setup per instance.
+
+        Returns:
+            Celery task ids, one per entry in inputs_list.
+        """
+        from appos.engine.context import get_execution_context
+
+        exec_ctx = get_execution_context()
+        exec_ctx_data = exec_ctx.to_serializable() if exec_ctx else None
+        return _publish_signatures([
+            start_process_task.s(
+                process_ref=process_ref,
+                inputs=inputs,
+                user_id=user_id,
+                exec_ctx_data=exec_ctx_data,
+            )
+            for inputs in inputs_list
+        ])
+
     def _create_instance(
         self,
         instance_id: str,
@@ -260,37 +704,35 @@ class ProcessExecutor:
 
         from appos.db.platform_models import ProcessInstance
 
-        session = self._session_factory()
-        try:
-            instance = ProcessInstance(
-                instance_id=instance_id,
-                process_name=process_name,
-                app_name=app_name,
-                display_name=display_name,
-                status="running",
-                inputs=inputs,
-                variables={},
-                variable_visibility={},
-                started_by=user_id,
-                triggered_by=triggered_by,
-            )
-            session.add(instance)
-            session.commit()
+        with self._session_scope() as session:
+            try:
+                instance = ProcessInstance(
+                    instance_id=instance_id,
+                    process_name=process_name,
+                    app_name=app_name,
+                    display_name=display_name,
+                    status="running",
+                    inputs=inputs,
+                    variables={},
+                    variable_visibility={},
+                    started_by=user_id,
+                    triggered_by=triggered_by,
+                )
+                session.add(instance)
+                session.commit()
 
-            return {
-                "instance_id": instance_id,
-                "id": instance.id,
-                "process_name": process_name,
-                "app_name": app_name,
-                "status": "running",
-                "started_at": instance.started_at.isoformat() if instance.started_at else None,
-            }
-        except Exception as e:
-            session.rollback()
-            logger.error(f"Failed to create process instance: {e}")
-            raise
-        finally:
-            session.close()
+                return {
+                    "instance_id": instance_id,
+                    "id": instance.id,
+                    "process_name": process_name,
+                    "app_name": app_name,
+                    "status": "running",
+                    "started_at": instance.started_at.isoformat() if instance.started_at else None,
+                }
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Failed to create process instance: {e}")
+                raise
 
     def _dispatch_step_async(
         self,
@@ -316,7 +758,7 @@ class ProcessExecutor:
         if step_def.get("type") == "parallel":
             # Parallel group — dispatch all sub-steps concurrently
             tasks = []
-            for sub_step in step_def.get("steps", []):
+            for sub_index, sub_step in enumerate(step_def.get("steps", [])):
                 tasks.append(
                     execute_process_step_task.s(
                         instance_id=instance_id,
@@ -326,12 +768,15 @@ class ProcessExecutor:
                         total_steps=len(steps),
                         is_parallel=True,
                         exec_ctx_data=exec_ctx_data,
-                    )
+                        sub_index=sub_index,
+                    ).set(queue=step_queue(sub_step))
                 )
             if tasks:
-                # Use chord() to trigger next step after all parallel tasks complete
+                # chord() fires the callback exactly once, when every header
+                # task has finished; .s() so the header results are prepended
+                # as the callback's `results` argument
                 next_index = step_index + 1
-                callback = _advance_process_step.si(
+                callback = _advance_process_step.s(
                     instance_id=instance_id,
                     process_ref=process_ref,
                     steps=steps,
@@ -346,14 +791,17 @@ class ProcessExecutor:
                 )
         else:
             # Sequential step
-            execute_process_step_task.delay(
-                instance_id=instance_id,
-                process_ref=process_ref,
-                step_def=step_def,
-                step_index=step_index,
-                total_steps=len(steps),
-                is_parallel=False,
-                exec_ctx_data=exec_ctx_data,
+            execute_process_step_task.apply_async(
+                kwargs={
+                    "instance_id": instance_id,
+                    "process_ref": process_ref,
+                    "step_def": step_def,
+                    "step_index": step_index,
+                    "total_steps": len(steps),
+                    "is_parallel": False,
+                    "exec_ctx_data": exec_ctx_data,
+                },
+                queue=step_queue(step_def),
             )
 
     def _execute_steps_sync(
@@ -362,6 +810,8 @@ class ProcessExecutor:
         process_ref: str,
         steps: List[Dict[str, Any]],
         inputs: Dict[str, Any],
+        pk: Optional[int] = None,
+        compiled: Optional[Dict[StepKey, CompiledStep]] = None,
     ) -> None:
         """Execute all steps synchronously (for non-Celery mode)."""
         from appos.engine.context import ProcessContext
@@ -369,41 +819,68 @@ class ProcessExecutor:
         ctx = ProcessContext(
             instance_id=instance_id,
             inputs=inputs,
+            pk=pk,
         )
 
+        compiled = compiled or {}
         for i, step_def in enumerate(steps):
             if step_def.get("type") == "parallel":
                 # Execute parallel steps sequentially in sync mode
-                for sub_step in step_def.get("steps", []):
-                    self._execute_single_step(instance_id, process_ref, sub_step, ctx, is_parallel=True)
+                for j, sub_step in enumerate(step_def.get("steps", [])):
+                    sub_step = _compiled_step(compiled, sub_step, i, j)
+                    self._run_step_sync(instance_id, process_ref, sub_step, ctx, is_parallel=True)
             else:
-                self._execute_single_step(instance_id, process_ref, step_def, ctx, is_parallel=False)
+                step_def = _compiled_step(compiled, step_def, i)
+                self._run_step_sync(instance_id, process_ref, step_def, ctx, is_parallel=False)
 
         # All steps done — complete the process
         self._complete_process(instance_id, outputs=ctx.outputs())
 
+    def _run_step_sync(
+        self,
+        instance_id: str,
+        process_ref: str,
+        step_def: Union[CompiledStep, Dict[str, Any]],
+        ctx: Any,
+        is_parallel: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """Run a step in-process, sleeping between retries (non-Celery mode)."""
+        attempt = 1
+        while True:
+            try:
+                return self._execute_single_step(
+                    instance_id, process_ref, step_def, ctx,
+                    is_parallel=is_parallel, attempt=attempt,
+                )
+            except _RetryStep as retry:
+                time.sleep(retry.step.retry_delay)
+                step_def, attempt = retry.step, attempt + 1
+
     def _execute_single_step(
         self,
         instance_id: str,
         process_ref: str,
-        step_def: Dict[str, Any],
+        step_def: Union[CompiledStep, Dict[str, Any]],
         ctx: Any,
         is_parallel: bool = False,
+        attempt: int = 1,
     ) -> Optional[Dict[str, Any]]:
         """
-        Execute a single step: resolve rule → dispatch → log result.
+        Execute one attempt of a step: resolve rule → dispatch → log result.
+
+        step_def is normally the CompiledStep from the process definition;
+        a raw step() dict is compiled on the spot.
 
         Returns:
             Step result dict or None on failure.
+
+        Raises:
+            _RetryStep: the attempt failed and retry_count allows another;
+                the caller schedules it (Celery retry or _run_step_sync).
         """
-        step_name = step_def.get("name", "unnamed")
-        rule_ref = step_def.get("rule", "")
-        input_mapping = step_def.get("input_mapping", {})
-        output_mapping = step_def.get("output_mapping", {})
-        retry_count = step_def.get("retry_count", 0)
-        retry_delay = step_def.get("retry_delay", 5)
-        condition = step_def.get("condition")
-        fire_and_forget = step_def.get("fire_and_forget", False)
+        step = step_def if isinstance(step_def, CompiledStep) else compile_step(process_ref, step_def)
+        step_name = step.name
+        full_rule_ref = step.full_rule_ref
 
         # Annotate ExecutionContext with current step info
         from appos.engine.context import get_execution_context
@@ -412,170 +889,186 @@ class ProcessExecutor:
             _exec_ctx.process_instance_id = instance_id
             _exec_ctx.step_name = step_name
 
-        # Update current step in instance
-        self._update_instance_step(instance_id, step_name)
-
         # Check condition (if any)
-        if condition:
+        if step.condition:
             try:
                 # Evaluate condition against process variables
-                cond_result = eval(condition, {"ctx": ctx})  # noqa: S307 - controlled eval
+                cond_result = evaluate_condition(step.condition, ctx)
                 if not cond_result:
-                    self._log_step(
-                        instance_id, step_name, rule_ref,
+                    self._record_step(
+                        instance_id, step_name, ctx, full_rule_ref,
                         status="skipped", is_parallel=is_parallel,
                     )
                     logger.info(f"Step '{step_name}' skipped (condition not met)")
                     return None
-            except Exception:
-                pass  # If condition eval fails, proceed with the step
+            except Exception as e:
+                # If condition eval fails, proceed with the step
+                logger.warning(f"Step '{step_name}' condition not evaluated ({e}); running step")
 
         # Resolve inputs from process context
-        step_inputs = {}
-        if input_mapping:
-            for rule_param, ctx_var in input_mapping.items():
-                step_inputs[rule_param] = ctx.var(ctx_var) if hasattr(ctx, 'var') else ctx._variables.get(ctx_var)
+        if step.input_bindings:
+            step_inputs = {rule_param: ctx.var(ctx_var) for rule_param, ctx_var in step.input_bindings}
         else:
             # Default: pass all inputs
-            step_inputs = ctx.inputs if hasattr(ctx, 'inputs') else {}
+            step_inputs = ctx.inputs
 
-        # Execute with retry
         start_time = time.monotonic()
-        last_error = None
+        try:
+            # Dispatch to the rule via engine
+            from appos.engine.runtime import get_runtime
+            runtime = get_runtime()
+            result = runtime.dispatch(full_rule_ref, inputs=step_inputs)
 
-        for attempt in range(retry_count + 1):
-            try:
-                # Qualify rule ref with app name if needed
-                app_name = process_ref.split(".")[0] if "." in process_ref else ""
-                full_rule_ref = rule_ref
-                if app_name and "." not in rule_ref:
-                    full_rule_ref = f"{app_name}.rules.{rule_ref}"
-                elif app_name and rule_ref.count(".") == 0:
-                    full_rule_ref = f"{app_name}.rules.{rule_ref}"
-
-                # Dispatch to the rule via engine
-                from appos.engine.runtime import get_runtime
-                runtime = get_runtime()
-                result = runtime.dispatch(full_rule_ref, inputs=step_inputs)
-
-                duration_ms = (time.monotonic() - start_time) * 1000
-
-                # Map outputs back to process context
-                if output_mapping and isinstance(result, dict):
-                    for rule_output, ctx_var in output_mapping.items():
-                        if rule_output in result:
-                            ctx.var(ctx_var, result[rule_output])
-
-                # Persist context to DB
-                self._persist_context(instance_id, ctx)
-
-                # Log step completion
-                self._log_step(
-                    instance_id, step_name, full_rule_ref,
-                    status="completed",
-                    duration_ms=duration_ms,
-                    inputs=step_inputs if step_def.get("log_inputs", False) else None,
-                    outputs=result if step_def.get("log_outputs", False) else None,
-                    attempt=attempt + 1,
-                    is_fire_and_forget=fire_and_forget,
-                    is_parallel=is_parallel,
-                )
+            duration_ms = (time.monotonic() - start_time) * 1000
 
-                logger.info(
-                    f"Step '{step_name}' completed in {duration_ms:.1f}ms "
-                    f"(attempt {attempt + 1})"
-                )
-                return result
+            # Map outputs back to process context
+            if step.output_bindings and isinstance(result, dict):
+                for rule_output, ctx_var in step.output_bindings:
+                    if rule_output in result:
+                        ctx.var(ctx_var, result[rule_output])
 
-            except Exception as e:
-                last_error = e
-                duration_ms = (time.monotonic() - start_time) * 1000
+            # current_step + context + step log, one commit
+            self._record_step(
+                instance_id, step_name, ctx, full_rule_ref,
+                status="completed",
+                duration_ms=duration_ms,
+                inputs=step_inputs if step.log_inputs else None,
+                outputs=result if step.log_outputs else None,
+                attempt=attempt,
+                is_fire_and_forget=step.fire_and_forget,
+                is_parallel=is_parallel,
+            )
 
-                if attempt < retry_count:
-                    logger.warning(
-                        f"Step '{step_name}' failed (attempt {attempt + 1}/{retry_count + 1}): {e}. "
-                        f"Retrying in {retry_delay}s..."
-                    )
-                    time.sleep(retry_delay)
-                    continue
-
-                # Final attempt failed
-                self._log_step(
-                    instance_id, step_name, full_rule_ref,
-                    status="failed",
-                    duration_ms=duration_ms,
-                    error_info={"error": str(e), "type": type(e).__name__},
-                    attempt=attempt + 1,
-                    is_fire_and_forget=fire_and_forget,
-                    is_parallel=is_parallel,
+            logger.info(
+                f"Step '{step_name}' completed in {duration_ms:.1f}ms "
+                f"(attempt {attempt})"
+            )
+            return result
+
+        except Exception as e:
+            duration_ms = (time.monotonic() - start_time) * 1000
+
+            if attempt <= step.retry_count:
+                logger.warning(
+                    f"Step '{step_name}' failed (attempt {attempt}/{step.retry_count + 1}): {e}. "
+                    f"Retrying in {step.retry_delay}s..."
                 )
+                raise _RetryStep(step, attempt, e) from e
 
-                on_error = step_def.get("on_error", "fail")
-                if on_error == "fail":
-                    self._fail_process(instance_id, str(e))
-                    raise
-                elif on_error == "skip":
-                    logger.warning(f"Step '{step_name}' failed but on_error=skip: {e}")
-                    return None
-                elif on_error == "continue":
-                    logger.warning(f"Step '{step_name}' failed but on_error=continue: {e}")
-                    return None
+            # Final attempt failed
+            self._record_step(
+                instance_id, step_name, ctx, full_rule_ref,
+                status="failed",
+                duration_ms=duration_ms,
+                error_info={"error": str(e), "type": type(e).__name__},
+                attempt=attempt,
+                is_fire_and_forget=step.fire_and_forget,
+                is_parallel=is_parallel,
+            )
 
-        return None
+            on_error = step.on_error
+            if on_error == "fail":
+                self._fail_process(instance_id, str(e))
+                raise
+            elif on_error == "skip":
+                logger.warning(f"Step '{step_name}' failed but on_error=skip: {e}")
+            elif on_error == "continue":
+                logger.warning(f"Step '{step_name}' failed but on_error=continue: {e}")
+            return None
 
     # -------------------------------------------------------------------
     # DB operations
     # -------------------------------------------------------------------
 
-    def _update_instance_step(self, instance_id: str, step_name: str) -> None:
-        """Update current_step on the ProcessInstance."""
+    def _record_step(
+        self,
+        instance_id: str,
+        step_name: str,
+        ctx: Any,
+        rule_ref: str,
+        status: str,
+        **log_fields: Any,
+    ) -> None:
+        """
+        Write everything one step produced in a single transaction:
+        current_step, dirty context variables, and the step log row.
+        Opened after the step ran, so no connection is held during dispatch.
+        The instance UPDATE is skipped when neither the step name nor the
+        variables changed since the last write. With
+        celery.async_step_logging the log row goes to the Redis stream
+        instead (drain_step_log_stream), falling back to the INSERT.
+        """
         if not self._session_factory:
             return
-        from appos.db.platform_models import ProcessInstance
-        session = self._session_factory()
-        try:
-            instance = (
-                session.query(ProcessInstance)
-                .filter(ProcessInstance.instance_id == instance_id)
-                .first()
-            )
-            if instance:
-                instance.current_step = step_name
-                instance.updated_at = datetime.now(timezone.utc)
+        with self._session_scope() as session:
+            try:
+                pk = self._instance_pk(session, instance_id, ctx)
+                if pk is None:
+                    return
+
+                values = self._instance_step_values(step_name, ctx)
+                persisted = self._persist_context_values(values, ctx)
+                if values:
+                    values["updated_at"] = datetime.now(timezone.utc)
+                    self._update_instance_in_session(session, pk, values)
+                row = self._step_log_row(pk, step_name, rule_ref, status, **log_fields)
+                if not _publish_step_log(row):
+                    self._log_step_in_session(session, row)
                 session.commit()
-        except Exception as e:
-            session.rollback()
-            logger.error(f"Failed to update instance step: {e}")
-        finally:
-            session.close()
+                if ctx is not None:
+                    ctx.current_step = step_name
+                if persisted:
+                    ctx.mark_clean()
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Failed to record process step: {e}")
 
-    def _persist_context(self, instance_id: str, ctx: Any) -> None:
-        """Persist process context variables to DB."""
-        if not self._session_factory or not getattr(ctx, 'is_dirty', False):
-            return
-        from appos.db.platform_models import ProcessInstance
-        session = self._session_factory()
-        try:
-            instance = (
-                session.query(ProcessInstance)
-                .filter(ProcessInstance.instance_id == instance_id)
-                .first()
+    @staticmethod
+    def _instance_pk(session: Any, instance_id: str, ctx: Any) -> Optional[int]:
+        """
+        Integer PK for instance_id. Cached on the ProcessContext, so the
+        string -> PK lookup runs at most once per context.
+        """
+        pk = getattr(ctx, "pk", None)
+        if pk is None:
+            from sqlalchemy import select
+            from appos.db.platform_models import ProcessInstance
+            pk = session.scalar(
+                select(ProcessInstance.id)
+                .where(ProcessInstance.instance_id == instance_id)
             )
-            if instance:
-                instance.variables = ctx.get_persistable_variables()
-                instance.variable_visibility = ctx.visibility
-                instance.updated_at = datetime.now(timezone.utc)
-                session.commit()
-                ctx.mark_clean()
-        except Exception as e:
-            session.rollback()
-            logger.error(f"Failed to persist process context: {e}")
-        finally:
-            session.close()
+            if pk is not None and ctx is not None:
+                ctx.pk = pk
+        return pk
+
+    @staticmethod
+    def _instance_step_values(step_name: str, ctx: Any) -> Dict[str, Any]:
+        """current_step column value, unless the row already holds step_name."""
+        if getattr(ctx, "current_step", None) == step_name:
+            return {}
+        return {"current_step": step_name}
+
+    @staticmethod
+    def _persist_context_values(values: Dict[str, Any], ctx: Any) -> bool:
+        """Add dirty process variables to `values`. True if anything changed."""
+        if not getattr(ctx, 'is_dirty', False):
+            return False
+        values["variables"] = ctx.get_persistable_variables()
+        values["variable_visibility"] = ctx.visibility
+        return True
+
+    @staticmethod
+    def _update_instance_in_session(session: Any, pk: int, values: Dict[str, Any]) -> None:
+        """UPDATE the ProcessInstance row by PK — no SELECT (caller commits)."""
+        from sqlalchemy import update
+        from appos.db.platform_models import ProcessInstance
+        session.execute(
+            update(ProcessInstance).where(ProcessInstance.id == pk).values(**values)
+        )
 
-    def _log_step(
-        self,
-        instance_id: str,
+    @staticmethod
+    def _step_log_row(
+        process_instance_pk: int,
         step_name: str,
         rule_ref: str,
         status: str,
@@ -586,45 +1079,62 @@ class ProcessExecutor:
         attempt: int = 1,
         is_fire_and_forget: bool = False,
         is_parallel: bool = False,
-    ) -> None:
-        """Log a step execution to the process_step_log table."""
-        if not self._session_factory:
-            return
-        from appos.db.platform_models import ProcessStepLog, ProcessInstance
-        session = self._session_factory()
-        try:
-            # Get the integer PK from the instance
-            instance = (
-                session.query(ProcessInstance)
-                .filter(ProcessInstance.instance_id == instance_id)
-                .first()
-            )
-            if not instance:
-                return
-
-            log_entry = ProcessStepLog(
-                process_instance_id=instance.id,
-                step_name=step_name,
-                rule_ref=rule_ref,
-                status=status,
-                duration_ms=duration_ms,
-                inputs=inputs,
-                outputs=outputs,
-                error_info=error_info,
-                attempt=attempt,
-                is_fire_and_forget=is_fire_and_forget,
-                is_parallel=is_parallel,
-            )
-            if status in ("completed", "failed", "skipped"):
-                log_entry.completed_at = datetime.now(timezone.utc)
+    ) -> Dict[str, Any]:
+        """
+        process_step_log column values. Timestamps are taken now, not at
+        insert time, so rows drained later from the stream keep them.
+        """
+        now = datetime.now(timezone.utc)
+        return {
+            "process_instance_id": process_instance_pk,
+            "step_name": step_name,
+            "rule_ref": rule_ref,
+            "status": status,
+            "started_at": now,
+            "completed_at": now if status in ("completed", "failed", "skipped") else None,
+            "duration_ms": duration_ms,
+            "inputs": inputs,
+            "outputs": outputs,
+            "error_info": error_info,
+            "attempt": attempt,
+            "is_fire_and_forget": is_fire_and_forget,
+            "is_parallel": is_parallel,
+        }
+
+    @staticmethod
+    def _log_step_in_session(session: Any, row: Dict[str, Any]) -> None:
+        """
+        INSERT a process_step_log row (caller commits). A Core insert: no ORM
+        object, identity-map entry or unit-of-work flush per step.
+        """
+        from sqlalchemy import insert
+        from appos.db.platform_models import ProcessStepLog
+        session.execute(insert(ProcessStepLog).values(**row))
 
-            session.add(log_entry)
-            session.commit()
-        except Exception as e:
-            session.rollback()
-            logger.error(f"Failed to log process step: {e}")
-        finally:
-            session.close()
+    def _finish_instance(self, instance_id: str, values: Dict[str, Any]) -> int:
+        """
+        Single UPDATE ... WHERE instance_id (unique index) AND status='running';
+        returns rowcount. An instance already completed or failed is left
+        as it is, so a late completion never overwrites a failure.
+        """
+        from sqlalchemy import update
+        from appos.db.platform_models import ProcessInstance
+        with self._session_scope() as session:
+            try:
+                now = datetime.now(timezone.utc)
+                result = session.execute(
+                    update(ProcessInstance)
+                    .where(
+                        ProcessInstance.instance_id == instance_id,
+                        ProcessInstance.status == "running",
+                    )
+                    .values(completed_at=now, updated_at=now, **values)
+                )
+                session.commit()
+                return result.rowcount
+            except Exception:
+                session.rollback()
+                raise
 
     def _complete_process(
         self, instance_id: str, outputs: Optional[Dict] = None
@@ -632,60 +1142,32 @@ class ProcessExecutor:
         """Mark a process instance as completed."""
         if not self._session_factory:
             return
-        from appos.db.platform_models import ProcessInstance
-        session = self._session_factory()
+        values: Dict[str, Any] = {"status": "completed"}
+        if outputs:
+            values["outputs"] = outputs
         try:
-            instance = (
-                session.query(ProcessInstance)
-                .filter(ProcessInstance.instance_id == instance_id)
-                .first()
-            )
-            if instance:
-                instance.status = "completed"
-                instance.completed_at = datetime.now(timezone.utc)
-                instance.updated_at = datetime.now(timezone.utc)
-                if outputs:
-                    instance.outputs = outputs
-                session.commit()
+            if self._finish_instance(instance_id, values):
                 logger.info(f"Process {instance_id} completed")
         except Exception as e:
-            session.rollback()
             logger.error(f"Failed to complete process: {e}")
-        finally:
-            session.close()
 
     def _fail_process(self, instance_id: str, error: str) -> None:
         """Mark a process instance as failed."""
         if not self._session_factory:
             return
-        from appos.db.platform_models import ProcessInstance
-        session = self._session_factory()
+        values = {"status": "failed", "error_info": {"error": error}}
         try:
-            instance = (
-                session.query(ProcessInstance)
-                .filter(ProcessInstance.instance_id == instance_id)
-                .first()
-            )
-            if instance:
-                instance.status = "failed"
-                instance.completed_at = datetime.now(timezone.utc)
-                instance.updated_at = datetime.now(timezone.utc)
-                instance.error_info = {"error": error}
-                session.commit()
+            if self._finish_instance(instance_id, values):
                 logger.info(f"Process {instance_id} failed: {error}")
         except Exception as e:
-            session.rollback()
             logger.error(f"Failed to mark process as failed: {e}")
-        finally:
-            session.close()
 
     def get_instance(self, instance_id: str) -> Optional[Dict[str, Any]]:
         """Get process instance details."""
         if not self._session_factory:
             return None
         from appos.db.platform_models import ProcessInstance
-        session = self._session_factory()
-        try:
+        with self._session_scope() as session:
             instance = (
                 session.query(ProcessInstance)
                 .filter(ProcessInstance.instance_id == instance_id)
@@ -695,6 +1177,7 @@ class ProcessExecutor:
                 return None
             return {
                 "instance_id": instance.instance_id,
+                "id": instance.id,
                 "process_name": instance.process_name,
                 "app_name": instance.app_name,
                 "display_name": instance.display_name,
@@ -707,16 +1190,13 @@ class ProcessExecutor:
                 "started_at": instance.started_at.isoformat() if instance.started_at else None,
                 "completed_at": instance.completed_at.isoformat() if instance.completed_at else None,
             }
-        finally:
-            session.close()
 
     def get_step_history(self, instance_id: str) -> List[Dict[str, Any]]:
         """Get step execution history for a process instance."""
         if not self._session_factory:
             return []
         from appos.db.platform_models import ProcessInstance, ProcessStepLog
-        session = self._session_factory()
-        try:
+        with self._session_scope() as session:
             instance = (
                 session.query(ProcessInstance)
                 .filter(ProcessInstance.instance_id == instance_id)
@@ -746,8 +1226,6 @@ class ProcessExecutor:
                 }
                 for s in steps
             ]
-        finally:
-            session.close()
 
 
 # ---------------------------------------------------------------------------
@@ -757,7 +1235,20 @@ class ProcessExecutor:
 celery_app = get_celery_app()
 
 
-@celery_app.task(bind=True, name="appos.process.executor.execute_process_step_task")
+# Fallback in-worker chaining budget when no soft time limit is configured
+_DEFAULT_CHAIN_BUDGET_S = 60.0
+
+
+def _chain_time_budget(task: Any) -> float:
+    """Seconds a step task may spend chaining steps: 80% of its soft limit."""
+    soft_limit = task.soft_time_limit or celery_app.conf.task_soft_time_limit
+    return soft_limit * 0.8 if soft_limit else _DEFAULT_CHAIN_BUDGET_S
+
+
+# max_retries=None: a step's own retry_count bounds its attempts (see below)
+@celery_app.task(
+    bind=True, name="appos.process.executor.execute_process_step_task", max_retries=None,
+)
 def execute_process_step_task(
     self,
     instance_id: str,
@@ -767,14 +1258,24 @@ def execute_process_step_task(
     total_steps: int,
     is_parallel: bool = False,
     exec_ctx_data: Optional[Dict[str, Any]] = None,
+    attempt: int = 1,
+    sub_index: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     Celery task: execute a single process step.
 
     Called by ProcessExecutor._dispatch_step_async().
-    After completion, triggers the next step (unless parallel).
+    After completion (unless parallel), runs the following sequential steps
+    in the same worker and re-enqueues only at a parallel group, a
+    long_running/boundary step, or once the chaining time budget is spent.
     Restores ExecutionContext from serialized data so that permission
     checks, logging, and nested rule dispatches have user identity.
+
+    A failed attempt with retries left is re-enqueued with
+    self.retry(countdown=retry_delay) for the step that failed (which may
+    be a chained one), carrying attempt + 1, so the worker is free during
+    the backoff. sub_index is the step's position in its parallel group
+    (None for sequential steps).
     """
     from appos.engine.context import (
         ProcessContext, ExecutionContext,
@@ -791,47 +1292,101 @@ def execute_process_step_task(
     exec_ctx.step_name = step_def.get("name", "unnamed")
     set_execution_context(exec_ctx)
 
+    running_def, running_index = step_def, step_index
     try:
         executor = get_process_executor()
+        # One pooled connection for every DB helper this task (and its chain) calls
+        with executor.task_session():
+            # Load current process variables from DB
+            instance_data = executor.get_instance(instance_id)
+            if instance_data is None:
+                logger.error(f"Process instance not found: {instance_id}")
+                return {"status": "error", "message": "Instance not found"}
+
+            ctx = ProcessContext(
+                instance_id=instance_id,
+                inputs=instance_data.get("inputs", {}),
+                variables=instance_data.get("variables", {}),
+                pk=instance_data.get("id"),
+                current_step=instance_data.get("current_step"),
+            )
 
-        # Load current process variables from DB
-        instance_data = executor.get_instance(instance_id)
-        if instance_data is None:
-            logger.error(f"Process instance not found: {instance_id}")
-            return {"status": "error", "message": "Instance not found"}
-
-        ctx = ProcessContext(
-            instance_id=instance_id,
-            inputs=instance_data.get("inputs", {}),
-            variables=instance_data.get("variables", {}),
-        )
-
-        result = executor._execute_single_step(
-            instance_id=instance_id,
-            process_ref=process_ref,
-            step_def=step_def,
-            ctx=ctx,
-            is_parallel=is_parallel,
-        )
-
-        # Trigger next step (if sequential, not parallel)
-        if not is_parallel and step_index + 1 < total_steps:
-            # Re-parse the process to get next step
+            # Compiled steps come from the memoized definition of this process
             from appos.engine.registry import object_registry
             registered = object_registry.resolve(process_ref)
-            if registered and registered.handler:
-                process_def = parse_process_definition(registered.handler)
-                steps = process_def.get("steps", [])
-                executor._dispatch_step_async(
-                    instance_id, process_ref, steps, step_index + 1,
-                    exec_ctx_data=exec_ctx_data,
+            definition = (
+                get_process_definition(registered)
+                if registered and registered.handler else None
+            )
+            compiled = definition["compiled"] if definition else {}
+
+            executor._execute_single_step(
+                instance_id=instance_id,
+                process_ref=process_ref,
+                step_def=_compiled_step(compiled, step_def, step_index, sub_index),
+                ctx=ctx,
+                is_parallel=is_parallel,
+                attempt=attempt,
+            )
+            if is_parallel:
+                return {"status": "completed", "step": step_def.get("name")}
+
+            # Chain the following sequential steps in this worker with the
+            # already-loaded ctx; hand off to the broker only at a parallel
+            # group, a long_running/boundary step, or when the time budget is spent
+            next_index = step_index + 1
+            deadline = time.monotonic() + _chain_time_budget(self)
+            while next_index < total_steps:
+                if definition is None:
+                    logger.error(f"Process no longer registered: {process_ref}")
+                    break
+                steps = definition.get("steps", [])
+
+                next_def = steps[next_index]
+                if (
+                    next_def.get("type") == "parallel"
+                    or next_def.get("long_running")
+                    or next_def.get("boundary")
+                    or time.monotonic() >= deadline
+                ):
+                    executor._dispatch_step_async(
+                        instance_id, process_ref, steps, next_index,
+                        exec_ctx_data=exec_ctx_data,
+                    )
+                    break
+
+                exec_ctx.step_name = next_def.get("name", "unnamed")
+                running_def, running_index = next_def, next_index
+                executor._execute_single_step(
+                    instance_id=instance_id,
+                    process_ref=process_ref,
+                    step_def=_compiled_step(compiled, next_def, next_index),
+                    ctx=ctx,
+                    is_parallel=False,
                 )
-        elif not is_parallel and step_index + 1 >= total_steps:
-            # Last step — complete the process
-            executor._complete_process(instance_id, outputs=ctx.outputs())
+                next_index += 1
+            else:
+                # Ran off the end — complete the process
+                executor._complete_process(instance_id, outputs=ctx.outputs())
 
-        return {"status": "completed", "step": step_def.get("name")}
+            return {"status": "completed", "step": step_def.get("name")}
 
+    except _RetryStep as retry:
+        raise self.retry(
+            exc=retry.error,
+            countdown=retry.step.retry_delay,
+            kwargs={
+                "instance_id": instance_id,
+                "process_ref": process_ref,
+                "step_def": running_def,
+                "step_index": running_index,
+                "total_steps": total_steps,
+                "is_parallel": is_parallel,
+                "exec_ctx_data": exec_ctx_data,
+                "attempt": retry.attempt + 1,
+                "sub_index": sub_index,
+            },
+        )
     except Exception as e:
         logger.error(f"Step execution failed: {e}")
         return {"status": "failed", "step": step_def.get("name"), "error": str(e)}
@@ -867,12 +1422,13 @@ def start_process_task(
 
     try:
         executor = get_process_executor()
-        return executor.start_process(
-            process_ref=process_ref,
-            inputs=inputs,
-            user_id=user_id,
-            async_execution=True,
-        )
+        with executor.task_session():
+            return executor.start_process(
+                process_ref=process_ref,
+                inputs=inputs,
+                user_id=user_id,
+                async_execution=True,
+            )
     finally:
         clear_execution_context()
 
@@ -892,9 +1448,26 @@ def _advance_process_step(
     Called automatically by chord() when all parallel tasks finish.
     Triggers the next sequential step or completes the process.
     Propagates ExecutionContext to the next step dispatch.
+    Stops instead when a parallel step failed (its task reports
+    status "failed" after an on_error="fail" step has failed the instance)
+    or the instance is no longer running.
     """
     executor = get_process_executor()
 
+    failed = [
+        r for r in (results or [])
+        if isinstance(r, dict) and r.get("status") in ("failed", "error")
+    ]
+    if failed:
+        logger.info(
+            f"Not advancing {instance_id}: {len(failed)} parallel step(s) failed"
+        )
+        return {"status": "stopped", "instance_id": instance_id}
+    instance = executor.get_instance(instance_id) if executor._session_factory else None
+    if instance is not None and instance["status"] != "running":
+        logger.info(f"Not advancing {instance_id}: instance is {instance['status']}")
+        return {"status": "stopped", "instance_id": instance_id}
+
     if next_step_index >= len(steps):
         executor._complete_process(instance_id)
         return {"status": "completed", "instance_id": instance_id}
@@ -906,6 +1479,83 @@ def _advance_process_step(
     return {"status": "advancing", "next_step": next_step_index}
 
 
+def _insert_step_log_rows(executor: "ProcessExecutor", rows: List[Dict[str, Any]]) -> int:
+    """
+    One executemany INSERT for a batch of drained rows. A batch rejected for
+    its data (e.g. the instance was deleted) is retried row by row and the
+    offending rows dropped; connectivity errors propagate so nothing is acked.
+    """
+    from sqlalchemy import insert
+    from sqlalchemy.exc import DataError, IntegrityError
+    from appos.db.platform_models import ProcessStepLog
+
+    with executor._session_scope() as session:
+        try:
+            session.execute(insert(ProcessStepLog), rows)
+            session.commit()
+            return len(rows)
+        except (DataError, IntegrityError) as e:
+            session.rollback()
+            if len(rows) == 1:
+                logger.error(f"Dropping undeliverable step log row: {e}")
+                return 0
+    return sum(_insert_step_log_rows(executor, [row]) for row in rows)
+
+
+@celery_app.task(name="appos.process.executor.drain_step_log_stream")
+def drain_step_log_stream(batch_size: int = _STEP_LOG_BATCH) -> int:
+    """
+    Celery beat task: move step log rows from the Redis stream into
+    process_step_log, one INSERT per batch of up to batch_size rows.
+
+    Entries are XACKed (and deleted) only after their batch commits; entries
+    left pending by a crashed drainer are re-claimed once idle for
+    _STEP_LOG_CLAIM_IDLE_MS.
+
+    Returns:
+        Number of rows written.
+    """
+    import redis
+
+    client = _step_log_redis()
+    executor = get_process_executor()
+    if client is None or executor._session_factory is None:
+        return 0
+
+    try:
+        client.xgroup_create(_STEP_LOG_STREAM, _STEP_LOG_GROUP, id="0", mkstream=True)
+    except redis.ResponseError:
+        pass  # BUSYGROUP — already created
+    consumer = f"{socket.gethostname()}-{os.getpid()}"
+
+    written = 0
+    entries = client.xautoclaim(
+        _STEP_LOG_STREAM, _STEP_LOG_GROUP, consumer,
+        _STEP_LOG_CLAIM_IDLE_MS, count=batch_size,
+    )[1]
+    with executor.task_session():
+        while True:
+            if not entries:
+                response = client.xreadgroup(
+                    _STEP_LOG_GROUP, consumer, {_STEP_LOG_STREAM: ">"}, count=batch_size,
+                )
+                entries = response[0][1] if response else []
+                if not entries:
+                    break
+            # Claimed entries already trimmed from the stream come back empty
+            rows = [_decode_step_log_row(fields["row"]) for _, fields in entries if fields]
+            if rows:
+                written += _insert_step_log_rows(executor, rows)
+            ids = [entry_id for entry_id, _ in entries]
+            client.xack(_STEP_LOG_STREAM, _STEP_LOG_GROUP, *ids)
+            client.xdel(_STEP_LOG_STREAM, *ids)
+            entries = []
+
+    if written:
+        logger.debug(f"Drained {written} step log rows")
+    return written
+
+
 # ---------------------------------------------------------------------------
 # Module-level singleton
 # ---------------------------------------------------------------------------
@@ -334,9 +334,12 @@ class ProcessScheduler:
         if not beat_schedule:
             return 0
 
-        from appos.process.executor import get_celery_app
+        from appos.process.executor import get_celery_app, platform_beat_schedule
         celery_app = get_celery_app()
-        celery_app.conf.beat_schedule = beat_schedule
+        celery_app.conf.beat_schedule = {
+            **platform_beat_schedule(celery_app.conf.get("appos_async_step_logging", False)),
+            **beat_schedule,
+        }
         logger.info(f"Applied {len(beat_schedule)} Celery Beat schedules")
         return len(beat_schedule)
 
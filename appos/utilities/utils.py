@@ -7,16 +7,25 @@ Centralises functions that were previously duplicated in multiple modules.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
+# CamelCase → snake_case boundary patterns (acronym run, then lower→upper)
+_SNAKE_ACRONYM_RE = re.compile(r"([A-Z]+)([A-Z][a-z])")
+_SNAKE_BOUNDARY_RE = re.compile(r"([a-z0-9])([A-Z])")
 
+
+@lru_cache(maxsize=2048)
 def to_snake(name: str) -> str:
     """
     Convert CamelCase (or PascalCase) to snake_case.
 
+    Results are memoized — class and record names repeat heavily across
+    code generation.
+
     Examples:
         to_snake("CustomerAddress")  → "customer_address"
         to_snake("HTTPSConnection")  → "https_connection"
         to_snake("simpleTest")       → "simple_test"
     """
-    s1 = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", name)
-    return re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+    s1 = _SNAKE_ACRONYM_RE.sub(r"\1_\2", name)
+    return _SNAKE_BOUNDARY_RE.sub(r"\1_\2", s1).lower()
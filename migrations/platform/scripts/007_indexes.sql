@@ -23,7 +23,8 @@ CREATE INDEX IF NOT EXISTS idx_groups_is_active    ON "appOS".groups(is_active);
 
 -- ===== user_groups =====
 CREATE INDEX IF NOT EXISTS idx_ug_user_id          ON "appOS".user_groups(user_id);
-CREATE INDEX IF NOT EXISTS idx_ug_group_id         ON "appOS".user_groups(group_id);
+CREATE INDEX IF NOT EXISTS idx_ug_group_user       ON "appOS".user_groups(group_id, user_id);
+DROP INDEX IF EXISTS "appOS".idx_ug_group_id;  -- superseded by idx_ug_group_user
 
 -- ===== apps =====
 CREATE INDEX IF NOT EXISTS idx_apps_short_name     ON "appOS".apps(short_name);
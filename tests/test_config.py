@@ -25,7 +25,9 @@ class TestPlatformConfig:
         assert cfg.name == "AppOS Platform"
         assert cfg.version == "2.0.0"
         assert cfg.environment == "dev"
-        assert cfg.database.pool_size == 10
+        assert (cfg.database.pool_size, cfg.database.max_overflow) == (20, 40)
+        assert cfg.database.pool_pre_ping is True
+        assert (cfg.celery.prefetch_multiplier, cfg.celery.acks_late) == (4, True)
         assert cfg.redis.url == "redis://localhost:6379/0"
         assert cfg.security.session_timeout == 3600
         assert cfg.logging.level == "INFO"
@@ -91,6 +93,14 @@ class TestLoadPlatformConfig:
         cfg = load_platform_config(str(project_root / "appos.yaml"))
         assert cfg.environment == "dev"
 
+    def test_db_pool_env_overrides(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("APPOS_DB_POOL_SIZE", "64")
+        monkeypatch.setenv("APPOS_DB_POOL_PRE_PING", "false")
+        cfg = load_platform_config(str(tmp_path / "nonexistent.yaml"))
+        assert cfg.database.pool_size == 64
+        assert cfg.database.max_overflow == 40
+        assert cfg.database.pool_pre_ping is False
+
     def test_missing_file_returns_defaults(self, tmp_path):
         cfg = load_platform_config(str(tmp_path / "nonexistent.yaml"))
         assert cfg.name == "AppOS Platform"
@@ -1,5 +1,7 @@
-"""Unit tests for appos.generators — AuditGenerator, ApiGenerator."""
+"""Unit tests for appos.generators — AuditGenerator, ApiGenerator, models, services, migrations."""
 
+import io
+import json
 import os
 import pytest
 from pathlib import Path
@@ -7,6 +9,23 @@ from unittest.mock import patch, MagicMock
 
 from appos.generators.audit_generator import AuditGenerator
 from appos.generators.api_generator import ApiGenerator
+from appos.generators.migration_generator import (
+    DesiredColumn,
+    DesiredTable,
+    LiveColumn,
+    LiveTable,
+    _sql_default,
+    build_desired_table,
+    compute_diff,
+    generate_migration_script,
+    introspect_live_tables,
+)
+from appos.generators.model_generator import (
+    generate_model_code,
+    generate_sql_ddl,
+    parse_record,
+)
+from appos.generators.service_generator import RecordService, generate_service_code
 
 
 class TestAuditGenerator:
@@ -128,3 +147,572 @@ class TestApiGenerator:
         # Check generated file exists
         generated_files = list(output.rglob("*customer*api*"))
         assert len(generated_files) >= 1
+
+
+class TestModelGenerator:
+    """Test record parsing and model/DDL generation."""
+
+    @staticmethod
+    def _parsed():
+        from pydantic import BaseModel, Field
+
+        class Invoice(BaseModel):
+            number: str = Field(max_length=20)
+            status: str = Field(default="open", json_schema_extra={"choices": ["open", "paid"]})
+            total: int = Field(default=0, ge=0)
+
+            class Meta:
+                search_fields = ["number"]
+                soft_delete = True
+
+        return parse_record(Invoice, "billing")
+
+    def test_model_code_is_valid_python(self):
+        code = generate_model_code(self._parsed())
+        compile(code, "invoice_model.py", "exec")
+        assert "class InvoiceModel(Base, AuditMixin, SoftDeleteMixin):" in code
+        assert (
+            'Index("idx_invoices_number_active", "number", '
+            'postgresql_where=text("is_deleted = false"))'
+        ) in code
+        assert "CheckConstraint" in code
+
+    def test_soft_delete_search_indexes_are_partial(self):
+        ddl = generate_sql_ddl(self._parsed())
+        assert (
+            "CREATE INDEX IF NOT EXISTS idx_invoices_number_active "
+            "ON invoices(number) WHERE is_deleted = false;\n"
+            "DROP INDEX IF EXISTS idx_invoices_number;  -- superseded by idx_invoices_number_active"
+        ) in ddl
+        assert "CREATE INDEX IF NOT EXISTS idx_invoices_number ON" not in ddl
+
+    def test_string_search_fields_get_trigram_indexes(self):
+        parsed = self._parsed()
+        code = generate_model_code(parsed)
+        assert (
+            'Index("idx_invoices_number_trgm", "number", postgresql_using="gin", '
+            'postgresql_ops={"number": "gin_trgm_ops"}, '
+            'postgresql_where=text("is_deleted = false"))'
+        ) in code
+        ddl = generate_sql_ddl(parsed)
+        assert ddl.index("CREATE EXTENSION IF NOT EXISTS pg_trgm;") < ddl.index("CREATE TABLE")
+        assert (
+            "CREATE INDEX IF NOT EXISTS idx_invoices_number_trgm "
+            "ON invoices USING gin (number gin_trgm_ops) WHERE is_deleted = false;"
+        ) in ddl
+
+    def test_soft_delete_flag_is_not_null_boolean(self):
+        parsed = self._parsed()
+        assert "    is_deleted      BOOLEAN NOT NULL DEFAULT FALSE" in generate_sql_ddl(parsed)
+        column = build_desired_table(parsed).columns["is_deleted"]
+        assert (column.sql_type, column.is_nullable, column.default) == ("BOOLEAN", False, "false")
+
+    def test_streaming_into_buffer_matches_returned_source(self):
+        parsed = self._parsed()
+        for generate in (generate_model_code, generate_sql_ddl):
+            buf = io.StringIO()
+            assert generate(parsed, buf) == ""
+            assert buf.getvalue() == generate(parsed)
+
+
+    def test_up_to_date_record_is_served_from_disk_without_touching_outputs(self, tmp_path):
+        from pydantic import BaseModel
+        from appos.generators import model_generator
+
+        class Memo(BaseModel):
+            title: str = ""
+
+        written = model_generator.generate_and_write(Memo, "notes", str(tmp_path))
+        mtimes = {path: os.stat(path).st_mtime_ns for path in written}
+
+        with patch.object(model_generator, "_generate_and_write_parsed") as regenerate:
+            assert model_generator.generate_and_write(Memo, "notes", str(tmp_path)) == written
+        regenerate.assert_not_called()
+        assert {path: os.stat(path).st_mtime_ns for path in written} == mtimes
+
+        # Edited inputs regenerate identical outputs: only the stamp changes
+        with patch.object(model_generator, "_generator_digest", return_value=b"edited"):
+            model_generator.generate_and_write(Memo, "notes", str(tmp_path))
+            digest = model_generator._inputs_digest(Memo)
+        assert {path: os.stat(path).st_mtime_ns for path in written} == mtimes
+        assert (tmp_path / ".stamps" / "notes_memos.sha256").read_text() == digest
+
+    @staticmethod
+    def _pool_sized_records(**namespace):
+        from types import SimpleNamespace
+        from pydantic import BaseModel
+        from appos.generators import model_generator
+
+        namespace.setdefault("__annotations__", {"name": str})
+        return [
+            SimpleNamespace(handler=type(f"Thing{i}", (BaseModel,), dict(namespace)))
+            for i in range(model_generator._PROCESS_POOL_MIN_RECORDS)
+        ]
+
+    def test_unpicklable_records_fall_back_to_serial_generation(self, tmp_path):
+        import enum
+        from appos.generators import model_generator
+
+        class Color(str, enum.Enum):  # local class: pickling raises AttributeError
+            RED = "red"
+
+        records = self._pool_sized_records(__annotations__={"color": Color}, color=Color.RED)
+        with patch.object(model_generator.object_registry, "get_by_type", return_value=records), \
+                patch.object(model_generator, "ProcessPoolExecutor") as pool:
+            written = model_generator.generate_all_for_app("billing", str(tmp_path), force=True)
+        pool.assert_not_called()
+        assert len([p for p in written if p.endswith(".py")]) == len(records)
+
+    def test_worker_errors_propagate_instead_of_rerunning_serially(self, tmp_path):
+        from concurrent.futures import Future
+        from appos.generators import model_generator
+
+        def submit(*args):
+            future = Future()
+            future.set_exception(ValueError("codegen bug"))
+            return future
+
+        pool = MagicMock()
+        pool.return_value.__enter__.return_value.submit.side_effect = submit
+        with patch.object(model_generator.object_registry, "get_by_type",
+                          return_value=self._pool_sized_records()), \
+                patch.object(model_generator, "ProcessPoolExecutor", pool), \
+                patch.object(model_generator, "_generate_and_write_parsed") as serial:
+            with pytest.raises(ValueError, match="codegen bug"):
+                model_generator.generate_all_for_app("billing", str(tmp_path), force=True)
+        serial.assert_not_called()
+
+class TestMigrationGenerator:
+    """Test migration diffing and script generation."""
+
+    @staticmethod
+    def _schemas():
+        desired = DesiredTable(name="customers", schema_name="public")
+        desired.columns["id"] = DesiredColumn(
+            name="id", sql_type="SERIAL", is_nullable=False, is_primary_key=True,
+        )
+        desired.columns["name"] = DesiredColumn(name="name", sql_type="VARCHAR(100)", is_nullable=False)
+        desired.columns["active"] = DesiredColumn(name="active", sql_type="BOOLEAN", default="true")
+
+        live = LiveTable(name="customers", schema_name="public")
+        live.columns["id"] = LiveColumn(name="id", data_type="integer", is_nullable=False)
+        live.columns["name"] = LiveColumn(name="name", data_type="character varying", is_nullable=True)
+        live.columns["legacy"] = LiveColumn(name="legacy", data_type="text", is_nullable=True)
+        return desired, live
+
+    def test_in_sync_table_has_no_changes(self):
+        desired, live = self._schemas()
+        del desired.columns["active"]
+        del live.columns["legacy"]
+        live.columns["name"] = LiveColumn(name="name", data_type="character varying", is_nullable=False)
+        diff = compute_diff({"customers": desired}, {"customers": live}, "crm")
+        assert not diff.has_changes
+
+    def test_diff_detects_column_changes(self):
+        desired, live = self._schemas()
+        diff = compute_diff({"customers": desired}, {"customers": live}, "crm")
+        changes = {(cd.column_name, cd.change_type) for cd in diff.table_diffs[0].column_diffs}
+        assert changes == {("name", "modify_nullable"), ("active", "add"), ("legacy", "drop")}
+
+    def test_stop_on_first_change_returns_partial_diff(self):
+        desired, live = self._schemas()
+        diff = compute_diff(
+            {"customers": desired}, {"customers": live}, "crm", stop_on_first_change=True,
+        )
+        assert diff.has_changes
+        assert len(diff.table_diffs[0].column_diffs) == 1
+
+    def test_generated_script_is_valid_python(self):
+        desired, live = self._schemas()
+        new_table = DesiredTable(name="orders", schema_name="public")
+        new_table.columns["id"] = DesiredColumn(
+            name="id", sql_type="SERIAL", is_nullable=False, is_primary_key=True,
+        )
+        new_table.columns["status"] = DesiredColumn(
+            name="status", sql_type="VARCHAR(20)", default=_sql_default("it's new"),
+        )
+        diff = compute_diff(
+            {"customers": desired, "orders": new_table}, {"customers": live}, "crm",
+        )
+        script = generate_migration_script(diff, sequence=1)
+        compile(script, "migration.py", "exec")
+        assert "def upgrade() -> None:\n    op." in script
+        assert "op.create_table(" in script
+
+    def test_rerun_reuses_latest_migration_for_the_same_diff(self, tmp_path):
+        from appos.generators.migration_generator import _generate_from_diff
+
+        desired, live = self._schemas()
+        args = ("crm", {"customers": desired}, {"customers": live}, str(tmp_path))
+        first = _generate_from_diff(*args)
+        assert _generate_from_diff(*args) == first
+        assert [p.name for p in tmp_path.iterdir()] == [Path(first).name]
+
+        del desired.columns["active"]
+        second = _generate_from_diff(*args)
+        assert Path(second).name.startswith("002_")
+
+    def test_sql_default_renders_sql_literals(self):
+        assert _sql_default(True) == "true"
+        assert _sql_default(False) == "false"
+        assert _sql_default(42) == "42"
+        assert _sql_default("it's") == "'it''s'"
+
+    def test_reflection_cache_lives_under_the_project_root(self, tmp_path, monkeypatch):
+        from appos.generators.migration_generator import _reflection_cache_path
+
+        (tmp_path / "appos.yaml").touch()
+        (tmp_path / "apps").mkdir()
+        monkeypatch.chdir(tmp_path / "apps")
+        engine = MagicMock()
+        engine.url.render_as_string.return_value = "postgresql://app:***@db/appos"
+        path = _reflection_cache_path(engine, "public")
+        assert path.parent == tmp_path / ".appos" / "reflection_cache"
+
+    def test_reflection_cache_skips_requery_until_fingerprint_changes(self, tmp_path):
+        fingerprint = ["fp-1"]
+        column_queries = []
+
+        class _Conn:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def execute(self, query, params):
+                result = MagicMock()
+                if "md5" in str(query):
+                    result.scalar.return_value = fingerprint[0]
+                    return result
+                column_queries.append(params)
+                result.__iter__.return_value = iter([
+                    ("customers", "id", "integer", "NO", None, None, 32, 0),
+                ])
+                return result
+
+        engine = MagicMock()
+        engine.url.render_as_string.return_value = "postgresql://app:***@db/appos"
+        engine.connect.side_effect = _Conn
+
+        with patch("appos.generators.migration_generator._REFLECTION_CACHE_DIR", tmp_path):
+            first = introspect_live_tables("public", engine, {"customers"})
+            second = introspect_live_tables("public", engine, {"customers"})
+            assert len(column_queries) == 1
+            assert first == second
+
+            fingerprint[0] = "fp-2"
+            introspect_live_tables("public", engine, {"customers"})
+            assert len(column_queries) == 2
+
+
+class TestRecordService:
+    """Test RecordService CRUD and audit logging against in-memory SQLite."""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        from sqlalchemy import Column, DateTime, Integer, LargeBinary, String, Text, create_engine
+        from sqlalchemy.orm import DeclarativeBase, sessionmaker
+        from appos.db.base import AuditMixin, SoftDeleteMixin
+
+        class _Base(DeclarativeBase):
+            pass
+
+        class WidgetModel(_Base, AuditMixin, SoftDeleteMixin):
+            __tablename__ = "widgets"
+            id = Column(Integer, primary_key=True, autoincrement=True)
+            name = Column(String(50), nullable=False)
+            color = Column(String(20), nullable=True)
+
+        class WidgetAuditLogModel(_Base):
+            __tablename__ = "widgets_audit_log"
+            id = Column(Integer, primary_key=True, autoincrement=True)
+            record_id = Column(Integer, nullable=False)
+            field_name = Column(String(100), nullable=False)
+            old_value = Column(Text)
+            new_value = Column(Text)
+            operation = Column(String(20), nullable=False)
+            changed_by = Column(Integer, nullable=False)
+            execution_id = Column(String(50))
+            changed_at = Column(DateTime(timezone=True), nullable=False)
+            prev_hash = Column(LargeBinary)
+            row_hash = Column(LargeBinary)
+
+        class WidgetService(RecordService):
+            model = WidgetModel
+            app_name = "crm"
+            audit_enabled = True
+            soft_delete_enabled = True
+            _audit_model = WidgetAuditLogModel
+
+        # A file DB: the audit shipper thread needs its own connection to the
+        # same tables (a StaticPool would share one connection between threads)
+        engine = create_engine(f"sqlite:///{tmp_path / 'widgets.db'}")
+        _Base.metadata.create_all(engine)
+        factory = sessionmaker(bind=engine, expire_on_commit=False)
+        svc = WidgetService(factory)
+
+        def audit_rows():
+            with factory() as s:
+                return [
+                    (a.record_id, a.field_name, a.old_value, a.new_value, a.operation, a.changed_by)
+                    for a in s.query(WidgetAuditLogModel).order_by(WidgetAuditLogModel.id)
+                ]
+
+        def audit_chain():
+            with factory() as s:
+                return [
+                    (a.record_id, a.prev_hash, a.row_hash)
+                    for a in s.query(WidgetAuditLogModel).order_by(WidgetAuditLogModel.id)
+                ]
+
+        svc.audit_rows = audit_rows
+        svc.audit_chain = audit_chain
+        return svc
+
+    def test_create_and_update_write_field_level_audit_rows(self, service):
+        widget = service.create({"name": "a", "color": "red"}, user_id=7)
+        service.update(widget.id, {"color": "blue", "name": "a"}, user_id=8)
+        assert service.audit_rows() == [
+            (widget.id, "name", None, "a", "create", 7),
+            (widget.id, "color", None, "red", "create", 7),
+            (widget.id, "is_deleted", None, "False", "create", 7),
+            (widget.id, "color", "red", "blue", "update", 8),
+        ]
+
+    def test_soft_delete_hides_record_and_logs_snapshot(self, service):
+        widget = service.create({"name": "a"})
+        assert service.delete(widget.id, user_id=3) is True
+        assert service.get(widget.id) is None
+        assert service.count() == 0
+        record_id, field_name, old_value, _, operation, changed_by = service.audit_rows()[-1]
+        assert (record_id, field_name, operation, changed_by) == (widget.id, "_record", "delete", 3)
+        assert json.loads(old_value)["is_deleted"] == "True"
+
+    def test_audit_rows_form_a_per_record_hash_chain(self, service):
+        widget = service.create({"name": "a", "color": "red"})
+        other = service.create({"name": "x"})
+        service.update(widget.id, {"color": "blue"})
+        service.delete(widget.id)
+
+        chain = [(prev, row) for rid, prev, row in service.audit_chain() if rid == widget.id]
+        assert chain[0][0] is None
+        assert all(len(row) == 32 for _, row in chain)
+        assert [prev for prev, _ in chain[1:]] == [row for _, row in chain[:-1]]
+        # `other` starts its own chain
+        assert [prev for rid, prev, _ in service.audit_chain() if rid == other.id][0] is None
+
+    def test_row_hash_is_canonical_json(self, service):
+        import hashlib
+        from datetime import datetime, timedelta, timezone
+        from appos.engine.context import (
+            clear_execution_context, create_system_context, set_execution_context,
+        )
+
+        ctx = create_system_context("test")
+        ctx.now = datetime(2026, 1, 2, 3, 4, 5, 6, tzinfo=timezone(timedelta(hours=2)))
+        set_execution_context(ctx)
+        try:
+            widget = service.create({"name": "a"}, user_id=2)
+            service.update(widget.id, {"name": "b"}, user_id=2)
+        finally:
+            clear_execution_context()
+        with service._session_factory() as s:
+            last = s.query(service._audit_model).order_by(service._audit_model.id.desc()).first()
+            payload = json.dumps(
+                [widget.id, "name", "a", "b", "update", 2, ctx.execution_id,
+                 "2026-01-02T01:04:05.000006+00:00"],
+                separators=(",", ":"),
+            )
+            assert last.row_hash == hashlib.sha256(last.prev_hash + payload.encode()).digest()
+
+    def test_rewriting_changed_at_breaks_the_hash(self, service):
+        from datetime import timedelta
+        from appos.generators.service_generator import _audit_row_hash
+
+        widget = service.create({"name": "a"})
+        with service._session_factory() as s:
+            row = s.query(service._audit_model).filter_by(record_id=widget.id).first()
+            values = {k: getattr(row, k) for k in (
+                "record_id", "field_name", "old_value", "new_value",
+                "operation", "changed_by", "execution_id", "changed_at",
+            )}
+            assert _audit_row_hash(row.prev_hash, values) == row.row_hash
+            values["changed_at"] -= timedelta(days=1)
+            assert _audit_row_hash(row.prev_hash, values) != row.row_hash
+
+    def test_update_without_audit_or_hooks_writes_directly(self, service):
+        widget = service.create({"name": "a", "color": "red"})
+        gone = service.create({"name": "b"})
+        service.delete(gone.id)
+        logged = len(service.audit_rows())
+
+        service.audit_enabled = False
+        updated = service.update(widget.id, {"color": "blue", "unknown": 1}, user_id=4)
+        assert (updated.color, updated.updated_by) == ("blue", 4)
+        assert service.update(gone.id, {"color": "blue"}) is None
+        assert service.get(widget.id).color == "blue"
+        assert len(service.audit_rows()) == logged
+
+    def test_create_without_audit_or_hooks_inserts_returning(self, service):
+        service.audit_enabled = False
+        assert service._can_insert_returning({"name": "a"})
+        assert not service._can_insert_returning({"name": "a", "id": 5})
+
+        widget = service.create({"name": "a", "color": "red"}, user_id=2)
+        assert (widget.name, widget.created_by, widget.is_deleted) == ("a", 2, False)
+        assert service.get(widget.id).color == "red"
+        assert service.audit_rows() == []
+
+    def test_hooks_dispatch_off_the_write_path_unless_sync(self, service):
+        import threading
+
+        dispatched = threading.Event()
+        runtime = MagicMock()
+        runtime.dispatch.side_effect = lambda *a, **kw: dispatched.set()
+        service.on_create_hooks = ["crm.rules.on_widget"]
+        with patch("appos.engine.runtime.get_runtime", return_value=runtime):
+            widget = service.create({"name": "a"})
+            assert dispatched.wait(5)
+            runtime.dispatch.assert_called_once_with(
+                "crm.rules.on_widget", inputs={"record_id": widget.id, "name": "a"},
+            )
+
+            runtime.dispatch.reset_mock()
+            service.sync_hooks = True
+            service.create({"name": "b"})
+            runtime.dispatch.assert_called_once()
+
+    def test_timestamps_come_from_execution_context_clock(self, service):
+        from appos.engine.context import (
+            clear_execution_context, create_system_context, set_execution_context,
+        )
+
+        ctx = create_system_context("test")
+        set_execution_context(ctx)
+        try:
+            assert service._now() is ctx.now
+        finally:
+            clear_execution_context()
+        assert service._now() is not ctx.now
+
+    def test_async_copy_mode_ships_audit_rows_outside_the_transaction(self, service):
+        from appos.generators.service_generator import AuditShipper
+
+        shipper = AuditShipper(service._session_factory.kw["bind"], flush_interval=0.01)
+        service.audit_mode = "async_copy"
+        service.audit_shipper = shipper
+        widget = service.create({"name": "a"}, user_id=5)
+        service.update(widget.id, {"name": "b"}, user_id=5)
+        shipper.close()
+        assert service.audit_rows() == [
+            (widget.id, "name", None, "a", "create", 5),
+            (widget.id, "is_deleted", None, "False", "create", 5),
+            (widget.id, "name", "a", "b", "update", 5),
+        ]
+        # The shipper chains rows in queue order
+        chain = [(prev, row) for _, prev, row in service.audit_chain()]
+        assert chain[0][0] is None
+        assert [prev for prev, _ in chain[1:]] == [row for _, row in chain[:-1]]
+
+    def test_audit_shipper_batches_rows_until_size_or_interval(self):
+        import threading
+        import time
+        from appos.generators.service_generator import AuditShipper
+
+        batches = []
+        written = threading.Event()
+        shipper = AuditShipper(MagicMock(), batch_size=3, flush_interval=0.2)
+        with patch.object(shipper, "_write", side_effect=lambda b: (batches.append(len(b)), written.set())):
+            shipper.enqueue("t", [{"n": 1}])
+            time.sleep(0.05)
+            shipper.enqueue("t", [{"n": 2}])
+            assert written.wait(1)
+            assert batches == [2]  # trickled rows share one write
+
+            written.clear()
+            shipper.enqueue("t", [{"n": i} for i in range(4)])
+            shipper.close()
+        assert batches == [2, 3, 1]
+
+    @pytest.mark.asyncio
+    async def test_async_service_round_trip_writes_chained_audit_rows(self, service):
+        from sqlalchemy import select
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+        from sqlalchemy.pool import StaticPool
+        from appos.generators.service_generator import AsyncRecordService
+
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with engine.begin() as conn:
+            await conn.run_sync(service.model.metadata.create_all)
+        audit_model = service._audit_model
+
+        class AsyncWidgetService(AsyncRecordService):
+            model = service.model
+            app_name = "crm"
+            audit_enabled = True
+            soft_delete_enabled = True
+            _audit_model = audit_model
+
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+        svc = AsyncWidgetService(factory)
+        try:
+            widget = await svc.create({"name": "a", "color": "red"}, user_id=7)
+            await svc.update(widget.id, {"color": "blue"}, user_id=8)
+            assert (await svc.get(widget.id)).color == "blue"
+            assert await svc.delete(widget.id, user_id=9) is True
+            assert await svc.get(widget.id) is None
+
+            async with factory() as s:
+                rows = (await s.scalars(select(audit_model).order_by(audit_model.id))).all()
+        finally:
+            await engine.dispose()
+
+        assert [(a.field_name, a.operation, a.changed_by) for a in rows] == [
+            ("name", "create", 7), ("color", "create", 7), ("is_deleted", "create", 7),
+            ("color", "update", 8), ("_record", "delete", 9),
+        ]
+        assert rows[0].prev_hash is None
+        assert [a.prev_hash for a in rows[1:]] == [a.row_hash for a in rows[:-1]]
+
+    def test_get_many_returns_live_records_keyed_by_id(self, service):
+        a = service.create({"name": "a"})
+        b = service.create({"name": "b"})
+        c = service.create({"name": "c"})
+        service.delete(b.id)
+
+        found = service.get_many([c.id, a.id, b.id, a.id, 999])
+        assert {k: v.name for k, v in found.items()} == {a.id: "a", c.id: "c"}
+        assert service.get_many([]) == {}
+
+    def test_list_reuses_cached_statement_across_filter_values(self, service):
+        service.create({"name": "a", "color": "red"})
+        service.create({"name": "b"})
+        service.create({"name": "c", "color": "blue"})
+
+        assert [w.name for w in service.list(filters={"color": "red"})] == ["a"]
+        assert [w.name for w in service.list(filters={"color": "blue"})] == ["c"]
+        assert len(service._stmt_cache) == 1
+
+        # None filters compile to IS NULL rather than binding NULL
+        assert [w.name for w in service.list(filters={"color": None})] == ["b"]
+        assert service.count(filters={"color": None}) == 1
+        assert service.get_by("color", None).name == "b"
+
+
+class TestServiceGenerator:
+    """Test generate_service_code output."""
+
+    def test_sync_service_by_default(self):
+        code = generate_service_code("Customer", "crm", "crm_customers")
+        assert "class CustomerService(RecordService):" in code
+        assert "    def search(" in code
+        compile(code, "<service>", "exec")
+
+    def test_async_mode_subclasses_async_base(self):
+        code = generate_service_code("Customer", "crm", "crm_customers", audit=True, async_mode=True)
+        assert "import AsyncRecordService" in code
+        assert "class CustomerService(AsyncRecordService):" in code
+        assert "    async def search(" in code
+        assert "return await super().search(" in code
+        compile(code, "<service>", "exec")
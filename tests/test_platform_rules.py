@@ -0,0 +1,252 @@
+"""Unit tests for appos.platform_rules — user/group rules against in-memory SQLite."""
+
+import pytest
+from unittest.mock import patch
+
+from appos.db.base import Base
+from appos.db.platform_models import App, Group, GroupApp, User, UserGroup
+from appos.engine.context import (
+    ExecutionContext,
+    clear_execution_context,
+    set_execution_context,
+)
+from appos.engine.errors import AppOSSecurityError, AppOSValidationError
+from appos.platform_rules import user_rules
+
+
+@pytest.fixture
+def factory():
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    # One shared in-memory DB, also reachable from the appos-pwhash threads
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(
+        engine,
+        tables=[t.__table__ for t in (User, Group, UserGroup, App, GroupApp)],
+    )
+    factory = sessionmaker(bind=engine)
+    user_rules._invalidate_group_cache()
+    with patch.object(user_rules, "_get_session", side_effect=lambda: factory()):
+        yield factory
+    user_rules._invalidate_group_cache()
+
+
+@pytest.fixture
+def admin(factory):
+    with factory() as s:
+        user = User(
+            username="admin", email="admin@x", full_name="Admin",
+            password_hash="-", user_type="system_admin",
+        )
+        s.add_all([
+            user,
+            Group(name="ops", type="security"),
+            Group(name="devs", type="team"),
+        ])
+        s.commit()
+        ctx = ExecutionContext(
+            user_id=user.id, username="admin", user_type="system_admin",
+            user_groups={"ops"},
+        )
+    set_execution_context(ctx)
+    yield ctx
+    clear_execution_context()
+
+
+def _add_user(factory, username, groups=(), is_active=True):
+    with factory() as s:
+        user = User(
+            username=username, email=f"{username}@x", full_name=username.title(),
+            password_hash="-", is_active=is_active,
+        )
+        s.add(user)
+        s.flush()
+        for name in groups:
+            group = s.query(Group).filter_by(name=name).one()
+            s.add(UserGroup(user_id=user.id, group_id=group.id))
+        s.commit()
+        return user.id
+
+
+class TestUserReads:
+    """get_current_user / get_user / get_user_groups / get_group_members."""
+
+    def test_get_user_includes_groups(self, factory, admin):
+        uid = _add_user(factory, "bob", groups=("ops", "devs"))
+        user = user_rules.get_user(uid)
+        assert (user["username"], sorted(user["groups"])) == ("bob", ["devs", "ops"])
+        assert sorted(user_rules.get_user_groups(uid)) == ["devs", "ops"]
+        assert user_rules.get_user(9999) == {}
+
+    def test_get_current_user_is_memoized_per_context(self, factory, admin):
+        assert user_rules.get_current_user()["username"] == "admin"
+        with patch.object(user_rules, "_get_session") as no_db:
+            user_rules.get_current_user()["groups"].append("mutated")
+            assert user_rules.get_current_user()["groups"] == []
+            no_db.assert_not_called()
+
+        user_rules.update_user(admin.user_id, {"full_name": "Root"})
+        assert user_rules.get_current_user()["full_name"] == "Root"
+
+    def test_group_members_are_active_only(self, factory, admin):
+        _add_user(factory, "bob", groups=("ops",))
+        _add_user(factory, "eve", groups=("ops",), is_active=False)
+        _add_user(factory, "dan", groups=("devs",))
+        assert [m["username"] for m in user_rules.get_group_members("ops")] == ["bob"]
+        assert user_rules.get_group_members("nobody") == []
+
+
+class TestMembership:
+    """add_user_to_group / remove_user_from_group / create_user groups."""
+
+    def test_group_ids_resolved_once(self, factory, admin):
+        uid = _add_user(factory, "bob")
+        assert user_rules.add_user_to_group(uid, "ops")
+        assert user_rules.add_user_to_group(uid, "devs")
+        assert set(user_rules._group_id_cache) == {"ops", "devs"}
+        assert user_rules.add_user_to_group(uid, "ops")  # already a member
+        assert sorted(user_rules.get_user_groups(uid)) == ["devs", "ops"]
+
+        user_rules.remove_user_from_group(uid, "ops")
+        assert user_rules.get_user_groups(uid) == ["devs"]
+
+        with pytest.raises(AppOSValidationError):
+            user_rules.add_user_to_group(uid, "nobody")
+        assert "nobody" not in user_rules._group_id_cache
+
+    def test_group_cache_is_bounded(self, factory, admin):
+        uid = _add_user(factory, "bob")
+        with patch.object(user_rules, "_GROUP_CACHE_MAX", 1):
+            user_rules.add_user_to_group(uid, "ops")
+            user_rules.add_user_to_group(uid, "devs")
+        assert list(user_rules._group_id_cache) == ["devs"]
+
+    def test_create_user_and_group_batch_assignments(self, factory, admin):
+        with patch.object(user_rules, "hash_password", return_value="-"):
+            created = user_rules.create_user(
+                "carol", "carol@x", "Carol", "secret123",
+                groups=["ops", "devs", "ops", "nobody"],
+            )
+        assert sorted(user_rules.get_user_groups(created["id"])) == ["devs", "ops"]
+
+        with factory() as s:
+            s.add(App(name="CRM", short_name="crm"))
+            s.commit()
+        group = user_rules.create_group(
+            "sales", apps=["crm", "missing"], users=[created["id"], created["id"]],
+        )
+        assert [m["username"] for m in user_rules.get_group_members("sales")] == ["carol"]
+        with factory() as s:
+            assert s.query(GroupApp).filter_by(group_id=group["id"]).count() == 1
+
+
+class TestChangePassword:
+    """change_password reads, verifies and hashes outside any open session."""
+
+    def test_change_own_password(self, factory, admin):
+        uid = _add_user(factory, "bob")
+        with factory() as s:
+            s.get(User, uid).password_hash = "old-hash"
+            s.commit()
+        admin.user_id, admin.user_type = uid, "basic"
+
+        with patch.object(user_rules, "verify_password", return_value=False):
+            with pytest.raises(AppOSSecurityError):
+                user_rules.change_password(uid, "wrong", "new-password")
+
+        with patch.object(user_rules, "verify_password", return_value=True) as verify, \
+                patch.object(user_rules, "hash_password", return_value="new-hash"):
+            assert user_rules.change_password(uid, "old", "new-password")
+        verify.assert_called_once_with("old", "old-hash")
+        with factory() as s:
+            assert s.get(User, uid).password_hash == "new-hash"
+
+    def test_unknown_user(self, factory, admin):
+        with pytest.raises(AppOSValidationError):
+            user_rules.change_password(9999, "", "new-password")
+
+    def test_hashing_runs_on_password_executor(self, factory, admin):
+        import threading
+
+        threads = []
+
+        def fake_hash(password):
+            threads.append(threading.current_thread().name)
+            return "new-hash"
+
+        uid = _add_user(factory, "bob")
+        with patch.object(user_rules, "hash_password", side_effect=fake_hash):
+            user_rules.change_password(uid, "", "new-password")
+        assert threads[0].startswith("appos-pwhash")
+
+    def test_short_password_rejected_without_db(self, factory, admin):
+        with patch.object(user_rules, "_get_session") as no_db:
+            for bad in ("short", None, 12345678):
+                with pytest.raises(AppOSValidationError):
+                    user_rules.change_password(admin.user_id, "", bad)
+        no_db.assert_not_called()
+
+    def test_concurrent_change_is_detected(self, factory, admin):
+        uid = _add_user(factory, "bob")
+
+        def racing_hash(password):
+            with factory() as s:
+                s.get(User, uid).password_hash = "changed-meanwhile"
+                s.commit()
+            return "new-hash"
+
+        with patch.object(user_rules, "hash_password", side_effect=racing_hash):
+            with pytest.raises(AppOSSecurityError, match="concurrently"):
+                user_rules.change_password(uid, "", "new-password")
+        with factory() as s:
+            assert s.get(User, uid).password_hash == "changed-meanwhile"
+
+
+class TestUpdateUser:
+    """update_user issues one UPDATE with the allowed columns."""
+
+    def test_only_allowed_fields_written(self, factory, admin):
+        uid = _add_user(factory, "bob")
+        result = user_rules.update_user(uid, {"full_name": "Robert", "password_hash": "x"})
+        assert (result["id"], result["username"]) == (uid, "bob")
+        with factory() as s:
+            user = s.get(User, uid)
+            assert (user.full_name, user.password_hash) == ("Robert", "-")
+
+    def test_unknown_user(self, factory, admin):
+        for fields in ({"full_name": "X"}, {}):
+            with pytest.raises(AppOSValidationError):
+                user_rules.update_user(9999, fields)
+
+
+class TestSessionScope:
+    """Nested rule calls share the outermost rule's session."""
+
+    def test_nested_rules_reuse_outer_session(self, factory, admin):
+        uid = _add_user(factory, "bob", groups=("ops",))
+        with patch.object(user_rules, "_get_session", side_effect=factory) as get:
+            with user_rules._session_scope(write=False) as outer:
+                assert user_rules.get_user(uid)["groups"] == ["ops"]
+                assert user_rules.get_user_groups(uid) == ["ops"]
+                assert user_rules._active_session.get() is outer
+        get.assert_called_once()
+        assert user_rules._active_session.get() is None
+
+    def test_nested_write_under_read_scope_is_committed(self, factory, admin):
+        uid = _add_user(factory, "bob", groups=("ops",))
+        session = factory()
+        with patch.object(user_rules, "_get_session", return_value=session), \
+                patch.object(session, "commit", wraps=session.commit) as commit:
+            with user_rules._session_scope(write=False):
+                assert user_rules.add_user_to_group(uid, "devs") is True
+        commit.assert_called_once()
+        assert sorted(user_rules.get_user_groups(uid)) == ["devs", "ops"]
+
+    def test_failed_rule_rolls_back(self, factory, admin):
+        with pytest.raises(AppOSValidationError):
+            user_rules.create_group("ops")
+        assert user_rules._active_session.get() is None
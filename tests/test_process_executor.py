@@ -0,0 +1,369 @@
+"""Unit tests for appos.process.executor — step conditions, task serialization."""
+
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from appos.engine.context import ProcessContext
+from appos.process import executor as executor_module
+from appos.process.executor import ProcessExecutor, _msgpack_default, evaluate_condition
+
+
+@pytest.fixture
+def db_executor():
+    """ProcessExecutor on an in-memory SQLite platform DB, installed as the singleton."""
+    from unittest.mock import patch
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+    from appos.db.base import Base
+    from appos.db.platform_models import ProcessInstance, ProcessStepLog
+
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(engine, tables=[ProcessInstance.__table__, ProcessStepLog.__table__])
+    executor = ProcessExecutor(db_session_factory=sessionmaker(bind=engine))
+    with patch.object(executor_module, "get_process_executor", return_value=executor):
+        yield executor
+
+
+def _new_instance(executor, instance_id="proc_test"):
+    return executor._create_instance(instance_id, "p", "crm", "", {}, 1, "crm.processes.p")
+
+
+@pytest.fixture
+def ctx():
+    return ProcessContext(
+        instance_id="proc_test",
+        inputs={"region": "eu"},
+        variables={"total": 150, "tier": "gold"},
+    )
+
+
+class TestEvaluateCondition:
+    def test_comparisons_over_ctx(self, ctx):
+        assert evaluate_condition('ctx.var("total") > 100', ctx)
+        assert evaluate_condition('ctx.var("tier") in ["gold", "platinum"]', ctx)
+        assert evaluate_condition('ctx.inputs["region"] == "eu" and not ctx.var("missing")', ctx)
+        assert not evaluate_condition('ctx.input("region") != "eu" or ctx.var("total") < 0', ctx)
+
+    def test_documented_attribute_lookup_form(self, ctx):
+        assert evaluate_condition("ctx.var.tier", ctx)
+        assert evaluate_condition('ctx.var.total > 100 and ctx.input.region == "eu"', ctx)
+        assert not evaluate_condition("ctx.var.missing", ctx)
+
+    @pytest.mark.parametrize("condition", [
+        '__import__("os").system("true")',
+        'ctx.var("total", 0)',                # setter form has side effects
+        'ctx.__class__',
+        'ctx.var("tier").__class__',
+        'ctx.var.__class__',
+        'ctx.var.tier.upper()',
+        '[v for v in ctx.variables]',
+        '(lambda: True)()',
+    ])
+    def test_rejects_anything_outside_the_grammar(self, ctx, condition):
+        with pytest.raises(ValueError):
+            evaluate_condition(condition, ctx)
+        assert ctx.var("total") == 150
+
+
+class TestMsgpackDefault:
+    def test_encodes_like_kombu_json(self):
+        ts = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        uid = uuid.uuid4()
+        assert _msgpack_default(ts) == "2024-01-02T03:04:05+00:00"
+        assert _msgpack_default(date(2024, 1, 2)) == "2024-01-02"
+        assert _msgpack_default(Decimal("1.50")) == "1.50"
+        assert _msgpack_default(uid) == str(uid)
+        assert _msgpack_default({1}) == [1]
+
+    def test_unknown_types_raise(self):
+        with pytest.raises(TypeError):
+            _msgpack_default(object())
+
+
+class TestRecordStep:
+    """_record_step writes the instance row only when something changed."""
+
+    @pytest.fixture
+    def executor(self):
+        from unittest.mock import MagicMock
+        return ProcessExecutor(db_session_factory=MagicMock())
+
+    def _record(self, executor, ctx, step_name):
+        from unittest.mock import patch
+        with patch.object(ProcessExecutor, "_update_instance_in_session") as update, \
+                patch.object(ProcessExecutor, "_log_step_in_session") as log_step:
+            executor._record_step(ctx.instance_id, step_name, ctx, "app.rules.r", "completed")
+        log_step.assert_called_once()
+        return update.call_args.args[2] if update.called else None
+
+    def test_skips_update_when_step_and_variables_unchanged(self, executor):
+        ctx = ProcessContext(instance_id="proc_test", pk=7)
+        assert self._record(executor, ctx, "validate")["current_step"] == "validate"
+        assert ctx.current_step == "validate"
+        assert self._record(executor, ctx, "validate") is None
+
+        ctx.var("total", 1)
+        values = self._record(executor, ctx, "validate")
+        assert "current_step" not in values and values["variables"] == {"total": 1}
+        assert not ctx.is_dirty
+
+    def test_log_row_goes_to_stream_when_async_logging_is_on(self, executor):
+        from unittest.mock import patch
+        ctx = ProcessContext(instance_id="proc_test", pk=7)
+        with patch.object(executor_module, "_publish_step_log", return_value=True) as publish, \
+                patch.object(ProcessExecutor, "_log_step_in_session") as log_step:
+            executor._record_step("proc_test", "validate", ctx, "app.rules.r", "completed")
+        log_step.assert_not_called()
+        row = publish.call_args.args[0]
+        assert (row["process_instance_id"], row["step_name"]) == (7, "validate")
+
+
+class TestStepLogStream:
+    def test_row_round_trips(self):
+        row = ProcessExecutor._step_log_row(
+            7, "validate", "app.rules.r", "completed",
+            duration_ms=1.5, outputs={"ok": True},
+        )
+        decoded = executor_module._decode_step_log_row(executor_module._encode_step_log_row(row))
+        assert decoded == row
+
+
+class TestCompileStep:
+    def test_resolves_rule_ref_and_bindings(self):
+        from appos.decorators.core import parallel, step
+        steps = [
+            step("validate", rule="validate_customer", input_mapping={"cid": "customer_id"}),
+            parallel(step("email", rule="mail.rules.send_welcome", fire_and_forget=True)),
+        ]
+        compiled = executor_module._compile_steps("crm.processes.onboard", steps)
+
+        validate = compiled[(0, None)]
+        assert validate.full_rule_ref == "crm.rules.validate_customer"
+        assert validate.input_bindings == (("cid", "customer_id"),)
+        assert compiled[(1, 0)].full_rule_ref == "mail.rules.send_welcome"
+        assert compiled[(1, 0)].fire_and_forget
+        with pytest.raises(AttributeError):
+            validate.retry_count = 3
+
+    def test_steps_sharing_a_name_compile_separately(self):
+        from appos.decorators.core import step
+        steps = [
+            step("notify", rule="notify_sales"),
+            step("notify", rule="notify_ops", retry_count=3),
+        ]
+        compiled = executor_module._compile_steps("crm.processes.onboard", steps)
+
+        first = executor_module._compiled_step(compiled, steps[0], 0)
+        second = executor_module._compiled_step(compiled, steps[1], 1)
+        assert (first.full_rule_ref, first.retry_count) == ("crm.rules.notify_sales", 0)
+        assert (second.full_rule_ref, second.retry_count) == ("crm.rules.notify_ops", 3)
+
+
+    def test_invalid_condition_is_rejected_when_compiled(self):
+        from appos.decorators.core import step
+        with pytest.raises(ValueError, match="'score'"):
+            executor_module.compile_step(
+                "crm.processes.p", step("score", rule="score", condition="ctx.__class__"),
+            )
+
+
+class TestStepRetries:
+    """A failed attempt with retries left is handed back to the caller to schedule."""
+
+    @pytest.fixture
+    def runtime(self):
+        from unittest.mock import MagicMock, patch
+        runtime = MagicMock()
+        with patch("appos.engine.runtime.get_runtime", return_value=runtime):
+            yield runtime
+
+    def test_attempts_are_single_shot(self, runtime, ctx):
+        from appos.decorators.core import step
+        executor = ProcessExecutor()
+        compiled = executor_module.compile_step(
+            "crm.processes.p", step("charge", rule="charge", retry_count=1, on_error="skip"),
+        )
+        runtime.dispatch.side_effect = RuntimeError("boom")
+
+        with pytest.raises(executor_module._RetryStep) as retry:
+            executor._execute_single_step("proc_test", "crm.processes.p", compiled, ctx, attempt=1)
+        assert (retry.value.attempt, retry.value.step) == (1, compiled)
+        assert executor._execute_single_step(
+            "proc_test", "crm.processes.p", compiled, ctx, attempt=2,
+        ) is None
+        assert runtime.dispatch.call_count == 2
+
+    def test_sync_mode_retries_in_process(self, runtime, ctx):
+        from unittest.mock import patch
+        from appos.decorators.core import step
+        runtime.dispatch.side_effect = [RuntimeError("boom"), {"ok": True}]
+        with patch.object(executor_module.time, "sleep") as sleep:
+            result = ProcessExecutor()._run_step_sync(
+                "proc_test", "crm.processes.p",
+                step("charge", rule="charge", retry_count=2, retry_delay=3), ctx,
+            )
+        assert result == {"ok": True}
+        sleep.assert_called_once_with(3)
+
+
+def test_step_queue_by_long_running():
+    from appos.decorators.core import step
+    assert executor_module.step_queue(step("a", rule="r")) == "process_steps.fast"
+    assert executor_module.step_queue(step("b", rule="r", long_running=True)) == "process_steps.slow"
+
+
+class TestAdvanceProcessStep:
+    """The chord callback stops at a failed parallel group."""
+
+    def _advance(self, results, steps):
+        from unittest.mock import patch
+        with patch.object(ProcessExecutor, "_dispatch_step_async") as dispatch:
+            outcome = executor_module._advance_process_step(
+                results, instance_id="proc_test", process_ref="crm.processes.p",
+                steps=steps, next_step_index=1,
+            )
+        return outcome, dispatch
+
+    def test_failed_parallel_step_stops_the_process(self, db_executor):
+        from appos.decorators.core import parallel, step
+        steps = [parallel(step("a", rule="a"), step("b", rule="b")), step("c", rule="c")]
+        _new_instance(db_executor)
+        db_executor._fail_process("proc_test", "b failed")
+
+        outcome, dispatch = self._advance([{"status": "completed"}, {"status": "failed"}], steps)
+        assert outcome["status"] == "stopped"
+        dispatch.assert_not_called()
+
+        # Even with clean results, a failed instance is not advanced or completed
+        outcome, dispatch = self._advance([{"status": "completed"}] * 2, steps[:1])
+        assert outcome["status"] == "stopped"
+        db_executor._complete_process("proc_test")
+        assert db_executor.get_instance("proc_test")["status"] == "failed"
+
+    def test_successful_group_advances(self, db_executor):
+        from appos.decorators.core import parallel, step
+        steps = [parallel(step("a", rule="a")), step("c", rule="c")]
+        _new_instance(db_executor)
+        outcome, dispatch = self._advance([{"status": "completed"}], steps)
+        assert outcome == {"status": "advancing", "next_step": 1}
+        dispatch.assert_called_once()
+
+
+class TestStepTaskChaining:
+    """execute_process_step_task runs sequential steps in-process until a hand-off point."""
+
+    @pytest.fixture
+    def run(self, db_executor):
+        from types import SimpleNamespace
+        from unittest.mock import MagicMock, patch
+
+        ran, dispatched = [], []
+        runtime = MagicMock()
+
+        def dispatch_rule(rule_ref, inputs):
+            ran.append(rule_ref)
+            if rule_ref in failing:
+                raise RuntimeError(f"{rule_ref} failed")
+            return {}
+
+        failing = set()
+        runtime.dispatch.side_effect = dispatch_rule
+
+        def run(steps, step_index=0, **kwargs):
+            registered = SimpleNamespace(
+                object_ref="crm.processes.p", source_hash=str(id(steps)), handler=lambda: steps,
+            )
+            _new_instance(db_executor)
+            with patch("appos.engine.runtime.get_runtime", return_value=runtime), \
+                    patch("appos.engine.registry.object_registry.resolve", return_value=registered), \
+                    patch.object(
+                        ProcessExecutor, "_dispatch_step_async",
+                        side_effect=lambda iid, ref, steps, index, **kw: dispatched.append(index),
+                    ):
+                result = executor_module.execute_process_step_task.apply(kwargs={
+                    "instance_id": "proc_test", "process_ref": "crm.processes.p",
+                    "step_def": steps[step_index], "step_index": step_index,
+                    "total_steps": len(steps), **kwargs,
+                }).get()
+            return result, [ref.rsplit(".", 1)[1] for ref in ran], dispatched
+
+        run.failing = failing
+        return run
+
+    @pytest.mark.parametrize("handoff", [
+        {"long_running": True}, {"boundary": True}, {"type": "parallel", "steps": []},
+    ])
+    def test_hands_off_at_a_non_chainable_step(self, run, handoff):
+        from appos.decorators.core import step
+        steps = [step("s0", rule="s0"), step("s1", rule="s1"), {**step("s2", rule="s2"), **handoff}]
+        _, ran, dispatched = run(steps)
+        assert (ran, dispatched) == (["s0", "s1"], [2])
+
+    def test_chained_steps_sharing_a_name_run_their_own_rules(self, run):
+        from appos.decorators.core import step
+        _, ran, _ = run([step("notify", rule="notify_sales"), step("notify", rule="notify_ops")])
+        assert ran == ["notify_sales", "notify_ops"]
+
+    def test_hands_off_when_the_time_budget_is_spent(self, run):
+        from unittest.mock import patch
+        from appos.decorators.core import step
+        with patch.object(executor_module, "_chain_time_budget", return_value=0.0):
+            _, ran, dispatched = run([step("s0", rule="s0"), step("s1", rule="s1")])
+        assert (ran, dispatched) == (["s0"], [1])
+
+    def test_completes_the_process_after_the_last_step(self, run, db_executor):
+        from appos.decorators.core import step
+        result, ran, dispatched = run([step("s0", rule="s0"), step("s1", rule="s1")])
+        assert (result["status"], ran, dispatched) == ("completed", ["s0", "s1"], [])
+        instance = db_executor.get_instance("proc_test")
+        assert (instance["status"], instance["current_step"]) == ("completed", "s1")
+
+    def test_retry_resumes_at_the_failed_chained_step(self, run, db_executor):
+        from unittest.mock import patch
+        from appos.decorators.core import step
+
+        task = executor_module.execute_process_step_task
+        retries = []
+        original_retry = task.retry
+
+        def record_retry(*args, **kwargs):
+            retries.append(kwargs["kwargs"])
+            return original_retry(*args, **kwargs)
+
+        run.failing.add("crm.rules.s1")
+        steps = [step("s0", rule="s0"), step("s1", rule="s1", retry_count=1, retry_delay=0)]
+        with patch.object(task, "retry", side_effect=record_retry):
+            run(steps)
+
+        assert [(r["step_def"]["name"], r["step_index"], r["attempt"]) for r in retries] == [("s1", 1, 2)]
+        assert [h["attempt"] for h in db_executor.get_step_history("proc_test")] == [1, 2]
+        assert db_executor.get_instance("proc_test")["status"] == "failed"
+
+
+class TestBulkStartProcesses:
+    def test_publishes_every_start_over_one_producer_in_input_order(self):
+        from types import SimpleNamespace
+        from unittest.mock import MagicMock, patch
+
+        app = MagicMock()
+        producer = app.producer_or_acquire.return_value.__enter__.return_value
+        sent = []
+
+        def apply_async(args=None, kwargs=None, **options):
+            sent.append((kwargs["inputs"], options["producer"]))
+            return SimpleNamespace(id=f"task-{kwargs['inputs']['n']}")
+
+        inputs_list = [{"n": n} for n in (3, 1, 2)]
+        with patch.object(executor_module, "get_celery_app", return_value=app), \
+                patch.object(executor_module.start_process_task, "apply_async", side_effect=apply_async):
+            ids = ProcessExecutor().bulk_start_processes("crm.processes.p", inputs_list, user_id=7)
+
+        assert ids == ["task-3", "task-1", "task-2"]
+        app.producer_or_acquire.assert_called_once_with()
+        assert sent == [(inputs, producer) for inputs in inputs_list]